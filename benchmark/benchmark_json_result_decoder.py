@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import json
+import random
+import string
+import time
+from logging import getLogger
+
+import pytest
+
+from snowflake.connector.json_result_decoder import get_json_result_decoder
+
+logger = getLogger(__name__)
+
+# rows and columns of chunks in the size range the back-end sends, from the first
+# small chunks to the largest ones
+CHUNK_SHAPES = [(1_000, 10), (20_000, 10), (50_000, 20)]
+DECODERS = ["json", "orjson"]
+
+
+def _create_chunk(rows: int, columns: int) -> bytes:
+    """Creates comma separated rows like the JSON result chunks in blob storage."""
+    rnd = random.Random(rows * columns)
+
+    def value(column: int) -> str | None:
+        if column % 5 == 4:
+            return None
+        if column % 2:
+            return "".join(rnd.choices(string.ascii_letters, k=rnd.randint(1, 40)))
+        return str(rnd.randint(-(10**12), 10**12))
+
+    return ",".join(
+        json.dumps([value(c) for c in range(columns)]) for _ in range(rows)
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("rows,columns", CHUNK_SHAPES)
+@pytest.mark.parametrize("name", DECODERS)
+def test_benchmark_json_result_decoder(name, rows, columns):
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    decoder = get_json_result_decoder(name)
+    chunk = _create_chunk(rows, columns)
+    text = chunk.decode("utf-8")
+    framed = memoryview(b"".join([b"[", chunk, b"]"]))
+    for label, load in (
+        # detected encoding, rows are framed as a string
+        ("text", lambda: decoder.loads("".join(["[", text, "]"]))),
+        # json_result_force_utf8_decoding, rows are downloaded into a framed buffer
+        ("utf8", lambda: decoder.loads_utf8(framed)),
+    ):
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        logger.warning(
+            f"{name} {label}: {rows} rows x {columns} columns "
+            f"({len(chunk) / 2**20:.1f} MiB) in {min(timings) * 1000:.2f} ms"
+        )
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from concurrent.futures.process import BrokenProcessPool
+from logging import getLogger
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Deque, NamedTuple
+
+logger = getLogger(__name__)
+
+
+class _WorkItem(NamedTuple):
+    future: Future
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+class SharedDownloadExecutor:
+    """A bounded thread pool that is shared by every ``ResultSet`` of the process.
+
+    Each ``ResultSet`` submits its chunk downloads through its own
+    :class:`DownloadQueue`. Idle workers pick work from those queues in a round-robin
+    fashion, so a result set with thousands of chunks can not starve the small ones
+    that are iterated at the same time.
+
+    Worker threads are created lazily, up to ``max_workers``, and are kept alive for
+    the lifetime of the process.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max(1, max_workers)
+        self._cond = Condition(Lock())
+        self._queues: OrderedDict[int, Deque[_WorkItem]] = OrderedDict()
+        self._threads: list[Thread] = []
+        self._idle_workers = 0
+        self._pending = 0
+        self._shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def resize(self, max_workers: int) -> None:
+        """Allows the pool to grow up to ``max_workers`` threads."""
+        with self._cond:
+            self._max_workers = max(self._max_workers, max_workers)
+
+    def queue(self) -> DownloadQueue:
+        """Returns a new fair queue to submit the downloads of one result set into."""
+        return DownloadQueue(self)
+
+    def _submit(
+        self, key: int, fn: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Future:
+        future: Future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new downloads after shutdown")
+            self._queues.setdefault(key, deque()).append(
+                _WorkItem(future, fn, args, kwargs)
+            )
+            self._pending += 1
+            if (
+                self._pending > self._idle_workers
+                and len(self._threads) < self._max_workers
+            ):
+                thread = Thread(
+                    target=self._work,
+                    name=f"SnowflakeDownloader-{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return future
+
+    def _next_work_item(self) -> _WorkItem:
+        """Pops the head of the queue that was served the longest time ago.
+
+        Must be called while holding the lock, with at least one queue present.
+        """
+        key, items = next(iter(self._queues.items()))
+        item = items.popleft()
+        self._pending -= 1
+        if items:
+            self._queues.move_to_end(key)
+        else:
+            del self._queues[key]
+        return item
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                self._idle_workers += 1
+                while not self._queues and not self._shutdown:
+                    self._cond.wait()
+                self._idle_workers -= 1
+                if not self._queues:
+                    return
+                item = self._next_work_item()
+            if not item.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = item.fn(*item.args, **item.kwargs)
+            except BaseException as e:
+                item.future.set_exception(e)
+            else:
+                item.future.set_result(result)
+            del item
+
+    def shutdown(self) -> None:
+        """Cancels queued downloads and lets the worker threads exit."""
+        with self._cond:
+            self._shutdown = True
+            for items in self._queues.values():
+                for item in items:
+                    item.future.cancel()
+            self._queues.clear()
+            self._pending = 0
+            self._cond.notify_all()
+
+
+class SharedProcessPool:
+    """A pool of worker processes that is shared by every ``ResultSet`` of the process.
+
+    It is used to download result chunks with ``client_fetch_use_mp``. The worker
+    processes are started on first use and kept for the lifetime of the process, so
+    that result sets do not pay for starting a process pool each.
+
+    The pool is replaced by a bigger one when a result set asks for more workers and by
+    a new one when a worker process died. Work that was already submitted to the
+    replaced pool still finishes.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max(1, max_workers)
+        self._lock = Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def resize(self, max_workers: int) -> None:
+        """Makes the pool grow to ``max_workers`` processes."""
+        with self._lock:
+            if max_workers <= self._max_workers:
+                return
+            self._max_workers = max_workers
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def queue(self) -> DownloadQueue:
+        """Returns a new queue to submit the downloads of one result set into."""
+        return DownloadQueue(self)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                logger.debug(
+                    f"starting shared process pool with {self._max_workers} workers"
+                )
+                self._pool = ProcessPoolExecutor(self._max_workers)
+            return self._pool
+
+    def _submit(
+        self, key: int, fn: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Future:
+        pool = self._get_pool()
+        try:
+            return pool.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            logger.debug("a worker process died, starting a new process pool")
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False)
+            return self._get_pool().submit(fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Cancels queued downloads and stops the worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+class DownloadQueue(Executor):
+    """The view of a shared executor or process pool given to a single result set.
+
+    It implements the ``concurrent.futures.Executor`` interface, shutting it down only
+    waits for (or cancels) the downloads that were submitted through this queue.
+    """
+
+    def __init__(self, executor: SharedDownloadExecutor | SharedProcessPool) -> None:
+        self._executor = executor
+        self._futures: list[Future] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future = self._executor._submit(id(self), fn, args, kwargs)
+        self._futures.append(future)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if cancel_futures:
+            for future in self._futures:
+                future.cancel()
+        if wait:
+            wait_for_futures(self._futures)
+        self._futures = []
+
+
+_shared_executor: SharedDownloadExecutor | None = None
+_shared_executor_lock = Lock()
+
+
+def get_shared_download_executor(max_workers: int) -> SharedDownloadExecutor:
+    """Returns the process-wide download executor, creating it if necessary.
+
+    The pool is sized by the biggest ``max_workers`` it has been requested with.
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            logger.debug(f"creating shared download executor with {max_workers} threads")
+            _shared_executor = SharedDownloadExecutor(max_workers)
+        else:
+            _shared_executor.resize(max_workers)
+        return _shared_executor
+
+
+_shared_process_pool: SharedProcessPool | None = None
+_shared_process_pool_lock = Lock()
+
+
+def get_shared_process_pool(max_workers: int) -> SharedProcessPool:
+    """Returns the process-wide pool of worker processes, creating it if necessary.
+
+    The pool is sized by the biggest ``max_workers`` it has been requested with.
+    """
+    global _shared_process_pool
+    with _shared_process_pool_lock:
+        if _shared_process_pool is None:
+            _shared_process_pool = SharedProcessPool(max_workers)
+        else:
+            _shared_process_pool.resize(max_workers)
+        return _shared_process_pool
+
+
+def _reset_after_fork() -> None:
+    # Worker threads do not survive a fork, the child has to start its own pool. The
+    # worker processes do, but they belong to the parent.
+    global _shared_executor, _shared_executor_lock
+    global _shared_process_pool, _shared_process_pool_lock
+    _shared_executor = None
+    _shared_executor_lock = Lock()
+    _shared_process_pool = None
+    _shared_process_pool_lock = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
 
 from .constants import FileTransferType
 
+if TYPE_CHECKING:  # pragma: no cover
+    from functools import _CacheInfo
+
+# number of distinct statements whose analysis is cached
+STATEMENT_CACHE_SIZE = 512
+# longer statements are analyzed every time, they are rarely executed again
+MAX_CACHED_STATEMENT_LENGTH = 16 << 10
+
 COMMENT_START_SQL_RE = re.compile(
     r"""
                                   ^\s*(?:
@@ -14,6 +24,29 @@ COMMENT_START_SQL_RE = re.compile(
 
 PUT_SQL_RE = re.compile(r"^\s*put", flags=re.IGNORECASE)
 GET_SQL_RE = re.compile(r"^\s*get", flags=re.IGNORECASE)
+INSERT_SQL_RE = re.compile(r"^insert\s+into", flags=re.IGNORECASE)
+COMMENT_SQL_RE = re.compile(r"/\*.*\*/")
+INSERT_SQL_VALUES_RE = re.compile(
+    r".*VALUES\s*(\(.*\)).*", re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+ALTER_SESSION_RE = re.compile(
+    r"alter\s+session\s+set\s+(\w*?)\s*=\s*\'?([^\']+?)\'?\s*(?:;|$)",
+    flags=re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+DESC_TABLE_RE = re.compile(r"desc(?:ribe)?\s+([\w_]+)\s*;?\s*$", flags=re.IGNORECASE)
+
+
+class StatementInfo(NamedTuple):
+    """What the connector derives from the text of a SQL statement."""
+
+    file_transfer_type: FileTransferType | None
+    is_insert: bool
+    # the parenthesized VALUES of an INSERT, repeated to insert many rows
+    insert_values: str | None
+    # the statement a "desc <table>" is rewritten to
+    describe_table: str | None
+    # the session parameters set by ALTER SESSION statements
+    session_parameters: tuple[tuple[str, str], ...]
 
 
 def remove_starting_comments(sql: str) -> str:
@@ -27,17 +60,60 @@ def remove_starting_comments(sql: str) -> str:
     return commentless_sql
 
 
+def _get_file_transfer_type(sql: str) -> FileTransferType | None:
+    commentless_sql = remove_starting_comments(sql)
+    if PUT_SQL_RE.match(commentless_sql):
+        return FileTransferType.PUT
+    elif GET_SQL_RE.match(commentless_sql):
+        return FileTransferType.GET
+
+
+def _analyze_statement(sql: str) -> StatementInfo:
+    is_insert = INSERT_SQL_RE.match(sql) is not None
+    insert_values = None
+    if is_insert:
+        m = INSERT_SQL_VALUES_RE.match(COMMENT_SQL_RE.sub("", sql))
+        insert_values = m.group(1) if m else None
+    m = DESC_TABLE_RE.match(sql)
+    return StatementInfo(
+        _get_file_transfer_type(sql),
+        is_insert,
+        insert_values,
+        f"describe table {m.group(1)}" if m else None,
+        tuple(
+            (m.group(1).upper(), m.group(2)) for m in ALTER_SESSION_RE.finditer(sql)
+        ),
+    )
+
+
+_cached_statement_info = lru_cache(maxsize=STATEMENT_CACHE_SIZE)(_analyze_statement)
+
+
+def get_statement_info(sql: str, cache: bool = True) -> StatementInfo:
+    """Returns what the connector derives from the text of a SQL statement.
+
+    The results are kept in a process-wide LRU cache keyed by the statement text, so
+    statements that are executed over and over are not matched against the regular
+    expressions again. Statements holding bound values must not be cached, pass
+    ``cache=False`` for them.
+    """
+    if not cache or len(sql) > MAX_CACHED_STATEMENT_LENGTH:
+        return _analyze_statement(sql)
+    return _cached_statement_info(sql)
+
+
+def statement_cache_info() -> _CacheInfo:
+    """Returns the hits, misses, maximum and current size of the statement cache."""
+    return _cached_statement_info.cache_info()
+
+
 def get_file_transfer_type(sql: str) -> FileTransferType | None:
     """Decide whether a SQL is a file transfer and return its type.
 
     None is returned if the SQL isn't a file transfer so that this function can be
     used in an if-statement.
     """
-    commentless_sql = remove_starting_comments(sql)
-    if PUT_SQL_RE.match(commentless_sql):
-        return FileTransferType.PUT
-    elif GET_SQL_RE.match(commentless_sql):
-        return FileTransferType.GET
+    return get_statement_info(sql).file_transfer_type
 
 
 def is_put_statement(sql: str) -> bool:
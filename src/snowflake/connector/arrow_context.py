@@ -78,6 +78,12 @@ class ArrowConverterContext:
                 except AttributeError:
                     return pytz.timezone("UTC")
 
+    def TIMESTAMP_TZ_to_tzinfo(self, tz: int) -> tzinfo:
+        return _generate_tzinfo_from_tzoffset(tz - 1440)
+
+    def TIMESTAMP_LTZ_to_tzinfo(self) -> tzinfo | UTC:
+        return self._get_session_tz()
+
     def TIMESTAMP_TZ_to_python(
         self, epoch: int, microseconds: int, tz: int
     ) -> datetime:
@@ -1,19 +1,25 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import gzip
 import os
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from ._utils import (
     _PYTHON_SNOWPARK_USE_SCOPED_TEMP_OBJECTS_STRING,
     get_temp_type_for_object,
 )
 from .errors import BindUploadError, Error
+from .options import import_pyarrow_parquet, pyarrow
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pyarrow import Table
+
     from .cursor import SnowflakeCursor
 
 logger = getLogger(__name__)
@@ -24,15 +30,24 @@ class BindUploadAgent:
     def __init__(
         self,
         cursor: SnowflakeCursor,
-        rows: list[bytes],
+        rows: Iterable[bytes] | Table,
         stream_buffer_size: int = 1024 * 1024 * 10,
+        max_concurrent_uploads: int = 4,
+        file_format: str = "csv",
     ) -> None:
         """Construct an agent that uploads binding parameters as CSV files to a temporary stage.
 
+        The rows are consumed lazily and gzip compressed while the files are filled, so
+        at most ``max_concurrent_uploads`` files are held in memory, however many rows
+        there are. With the ``parquet`` file format the rows are a pyarrow Table that is
+        uploaded as typed Parquet files instead.
+
         Args:
             cursor: The cursor object.
-            rows: Rows of binding parameters in CSV format.
-            stream_buffer_size: Size of each file, default to 10MB.
+            rows: Rows of binding parameters in CSV format, or a pyarrow Table.
+            stream_buffer_size: Uncompressed size of each file, default to 10MB.
+            max_concurrent_uploads: Number of files uploaded at the same time.
+            file_format: Format of the files, "csv" or "parquet".
         """
         self._use_scoped_temp_object = (
             cursor.connection._session_parameters.get(
@@ -47,12 +62,18 @@ class BindUploadAgent:
         self.cursor = cursor
         self.rows = rows
         self._stream_buffer_size = stream_buffer_size
+        self._max_concurrent_uploads = max(1, max_concurrent_uploads)
+        self._file_format = file_format
         self.stage_path = f"@{self._STAGE_NAME}/{uuid.uuid4().hex}"
 
     def _create_stage(self) -> None:
         create_stage_sql = (
             f"create or replace {get_temp_type_for_object(self._use_scoped_temp_object)} stage {self._STAGE_NAME} "
-            "file_format=(type=csv field_optionally_enclosed_by='\"')"
+            + (
+                "file_format=(type=parquet)"
+                if self._file_format == "parquet"
+                else "file_format=(type=csv field_optionally_enclosed_by='\"')"
+            )
         )
         self.cursor.execute(create_stage_sql)
 
@@ -66,24 +87,76 @@ class BindUploadAgent:
             logger.debug("Failed to create stage for binding.")
             raise BindUploadError from err
 
+        with ThreadPoolExecutor(
+            self._max_concurrent_uploads, thread_name_prefix="BindUploadAgent"
+        ) as executor:
+            uploads: deque[Future] = deque()
+            try:
+                files = (
+                    self._parquet_files()
+                    if self._file_format == "parquet"
+                    else self._compressed_files()
+                )
+                for file_name, f in files:
+                    if len(uploads) >= self._max_concurrent_uploads:
+                        # wait for a file to be uploaded before filling another one
+                        uploads.popleft().result()
+                    uploads.append(executor.submit(self._upload_file, file_name, f))
+                while uploads:
+                    uploads.popleft().result()
+            finally:
+                executor.shutdown(cancel_futures=True)
+
+    def _compressed_files(self) -> Iterator[tuple[str, BytesIO]]:
+        """Fills gzip compressed files of up to the stream buffer size of rows."""
+        rows = iter(self.rows)
         row_idx = 0
-        while row_idx < len(self.rows):
+        for row in rows:
+            f = BytesIO()
+            with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=6, mtime=0) as gz:
+                size = 0
+                while True:
+                    gz.write(row)
+                    size += len(row)
+                    row_idx += 1
+                    if size >= self._stream_buffer_size:
+                        break
+                    row = next(rows, None)
+                    if row is None:
+                        break
+            f.seek(0)
+            yield f"{row_idx}.csv.gz", f
+
+    def _parquet_files(self) -> Iterator[tuple[str, BytesIO]]:
+        """Writes Parquet files of about the stream buffer size of rows."""
+        parquet = import_pyarrow_parquet()
+        table = self.rows
+        rows_per_file = max(
+            1, self._stream_buffer_size * table.num_rows // max(1, table.nbytes)
+        )
+        for offset in range(0, table.num_rows, rows_per_file):
+            rows = table.slice(offset, rows_per_file)
             f = BytesIO()
-            size = 0
-            while True:
-                f.write(self.rows[row_idx])
-                size += len(self.rows[row_idx])
-                row_idx += 1
-                if row_idx >= len(self.rows) or size >= self._stream_buffer_size:
-                    break
             try:
-                f.seek(0)
-                self.cursor._upload_stream(
-                    input_stream=f,
-                    stage_location=os.path.join(self.stage_path, f"{row_idx}.csv"),
-                    options={"source_compression": "auto_detect"},
-                )
-            except Error as err:
-                logger.debug("Failed to upload the bindings file to stage.")
+                parquet.write_table(rows, f)
+            except pyarrow.ArrowException as err:
+                logger.debug("Failed to write the bindings to a Parquet file.")
                 raise BindUploadError from err
+            f.seek(0)
+            yield f"{offset + rows.num_rows}.parquet", f
+
+    def _upload_file(self, file_name: str, f: BytesIO) -> None:
+        # every upload gets its own cursor, so that they can run at the same time
+        cursor = self.cursor.connection.cursor()
+        try:
+            cursor._upload_stream(
+                input_stream=f,
+                stage_location=os.path.join(self.stage_path, file_name),
+                options={"source_compression": "auto_detect"},
+            )
+        except Error as err:
+            logger.debug("Failed to upload the bindings file to stage.")
+            raise BindUploadError from err
+        finally:
+            cursor.close()
             f.close()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timezone
+from typing import TYPE_CHECKING, Any, NamedTuple, Sequence
+
+from .converter import SnowflakeConverter
+from .options import installed_pandas, pandas, pyarrow
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
+    from pyarrow import Array, Table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# dates of at least this many epoch milliseconds are bound in nanoseconds in CSV files,
+# see SnowflakeConverter._date_to_snowflake_bindings_in_bulk_insertion
+_MAX_CSV_DATE_MILLISECONDS = 31536000000000
+
+
+class BindingColumn(NamedTuple):
+    """A column of ``executemany`` parameters.
+
+    ``values`` is a NumPy array when the column can be converted in one pass, otherwise
+    a list of Python values. ``mask`` is True for the NULL values of a NumPy array,
+    ``snowflake_type`` is the type given by the input rather than by the values.
+    """
+
+    name: str
+    values: ndarray | list
+    mask: ndarray | None = None
+    snowflake_type: str | None = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def is_columnar(params: Any) -> bool:
+    """Whether ``params`` are columns: a pyarrow Table or RecordBatch, a pandas
+    DataFrame or a mapping of column names to NumPy arrays."""
+    if installed_pandas and isinstance(
+        params, (pyarrow.Table, pyarrow.RecordBatch, pandas.DataFrame)
+    ):
+        return True
+    return (
+        numpy is not None
+        and isinstance(params, Mapping)
+        and bool(params)
+        and all(isinstance(v, numpy.ndarray) for v in params.values())
+    )
+
+
+def to_binding_columns(params: Any) -> list[BindingColumn]:
+    """Splits columnar ``params`` into ``BindingColumn``s, without converting values."""
+    if installed_pandas and isinstance(params, (pyarrow.Table, pyarrow.RecordBatch)):
+        return [
+            _arrow_column(name, column)
+            for name, column in zip(params.column_names, params.columns)
+        ]
+    if installed_pandas and isinstance(params, pandas.DataFrame):
+        return [_pandas_column(str(name), series) for name, series in params.items()]
+    return [_numpy_column(str(name), array) for name, array in params.items()]
+
+
+def _arrow_column(name: str, column) -> BindingColumn:
+    types = pyarrow.types
+    arrow_type = column.type
+    if types.is_date64(arrow_type):
+        column = column.cast(pyarrow.date32())
+        arrow_type = column.type
+    if not (
+        types.is_integer(arrow_type)
+        or types.is_floating(arrow_type)
+        or types.is_boolean(arrow_type)
+        or types.is_timestamp(arrow_type)
+        or types.is_date32(arrow_type)
+        or types.is_duration(arrow_type)
+    ):
+        return BindingColumn(name, column.to_pylist())
+    mask = None
+    if column.null_count:
+        mask = column.is_null().to_numpy(zero_copy_only=False)
+        fill = False if types.is_boolean(arrow_type) else 0
+        column = column.fill_null(pyarrow.scalar(fill, arrow_type))
+    snowflake_type = None
+    if types.is_timestamp(arrow_type) and arrow_type.tz is not None:
+        # the values are in UTC
+        snowflake_type = "TIMESTAMP_LTZ"
+    return BindingColumn(
+        name, column.to_numpy(zero_copy_only=False), mask, snowflake_type
+    )
+
+
+def _pandas_column(name: str, series) -> BindingColumn:
+    mask = series.isna().to_numpy()
+    if not mask.any():
+        mask = None
+    if isinstance(series.dtype, pandas.DatetimeTZDtype):
+        values = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+        return BindingColumn(name, values, mask, "TIMESTAMP_LTZ")
+    numpy_dtype = getattr(series.dtype, "numpy_dtype", series.dtype)
+    if not isinstance(numpy_dtype, numpy.dtype) or numpy_dtype.kind not in "biufMm":
+        values = series.to_numpy(dtype=object)
+        if mask is not None:
+            values[mask] = None
+        return BindingColumn(name, values.tolist())
+    if mask is not None and numpy_dtype.kind in "biuf":
+        # nullable extension arrays need a value for the NULLs
+        values = series.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+    else:
+        values = series.to_numpy(dtype=numpy_dtype)
+    return BindingColumn(name, values, mask)
+
+
+def _numpy_column(name: str, array: ndarray) -> BindingColumn:
+    mask = None
+    if isinstance(array, numpy.ma.MaskedArray):
+        mask = numpy.ma.getmaskarray(array)
+        array = array.data
+    elif array.dtype.kind in "Mm":
+        mask = numpy.isnat(array)
+    if mask is not None and not mask.any():
+        mask = None
+    if array.dtype.kind not in "biufMmUS":
+        values = array.tolist()
+        if mask is not None:
+            values = [None if m else v for v, m in zip(values, mask.tolist())]
+        return BindingColumn(name, values)
+    return BindingColumn(name, array, mask)
+
+
+def column_to_bindings(
+    column: BindingColumn, csv: bool = False
+) -> tuple[str, list[str | None]] | None:
+    """Converts a column to its Snowflake type and bindings in one pass.
+
+    With ``csv`` the bindings are escaped for the CSV files uploaded to a stage.
+    Returns None when the values of the column have to be converted one by one.
+    """
+    values = column.values
+    if not isinstance(values, numpy.ndarray):
+        return None
+    kind = values.dtype.kind
+    if kind == "b":
+        snowflake_type = "BOOLEAN"
+        bindings = numpy.where(values, "true", "false")
+    elif kind in "iu":
+        snowflake_type = "FIXED"
+        bindings = values.astype(str)
+    elif kind == "f":
+        snowflake_type = "REAL"
+        bindings = values.astype(str)
+    elif kind == "M" and numpy.datetime_data(values.dtype)[0] == "D":
+        snowflake_type = "DATE"
+        milliseconds = values.astype("datetime64[ms]").astype(numpy.int64)
+        bindings = milliseconds.astype(str)
+        if csv:
+            bindings = numpy.where(
+                milliseconds < _MAX_CSV_DATE_MILLISECONDS,
+                bindings,
+                numpy.char.add(bindings, "000000"),
+            )
+    elif kind == "M":
+        snowflake_type = column.snowflake_type or "TIMESTAMP_NTZ"
+        bindings = _epoch_nanoseconds(values)
+    elif kind == "m":
+        snowflake_type = "TIME"
+        bindings = _time_to_csv(values) if csv else _epoch_nanoseconds(values)
+    elif kind == "U":
+        snowflake_type = "TEXT"
+        bindings = values
+    elif kind == "S":
+        snowflake_type = "BINARY"
+        bindings = numpy.array([v.hex() for v in values.tolist()])
+    else:
+        return None
+    result = bindings.tolist()
+    if csv and kind in "US":
+        result = list(map(SnowflakeConverter.escape_for_csv, result))
+    if column.mask is not None:
+        null = "" if csv else None
+        for index in numpy.flatnonzero(column.mask).tolist():
+            result[index] = null
+    return snowflake_type, result
+
+
+def _epoch_nanoseconds(values: ndarray) -> ndarray:
+    kind = values.dtype.kind
+    if numpy.datetime_data(values.dtype)[0] in ("ns", "ps", "fs", "as"):
+        return values.astype(f"{kind}8[ns]").astype(numpy.int64).astype(str)
+    # microseconds do not overflow for dates far from the epoch
+    microseconds = values.astype(f"{kind}8[us]").astype(numpy.int64)
+    return numpy.char.add(microseconds.astype(str), "000")
+
+
+def _time_to_csv(values: ndarray) -> ndarray:
+    """Formats time deltas like ``SnowflakeConverter._timedelta_to_snowflake``."""
+    microseconds = values.astype("m8[us]").astype(numpy.int64)
+    seconds, fraction = numpy.divmod(microseconds, 1_000_000)
+    minutes, seconds = numpy.divmod(seconds, 60)
+    hours, minutes = numpy.divmod(minutes, 60)
+    return numpy.array(
+        [
+            f"{h:02d}:{m:02d}:{s:02d}.{f:06d}" if f else f"{h:02d}:{m:02d}:{s:02d}"
+            for h, m, s, f in zip(
+                hours.tolist(), minutes.tolist(), seconds.tolist(), fraction.tolist()
+            )
+        ]
+    )
+
+
+def columns_to_rows(columns: list[BindingColumn]) -> list[tuple]:
+    """Transposes the columns into rows of Python values, for the statements that
+    bind rows one by one."""
+    python_columns = []
+    for column in columns:
+        values = column.values
+        if isinstance(values, numpy.ndarray):
+            kind = values.dtype.kind
+            if kind in "Mm" and numpy.datetime_data(values.dtype)[0] != "D":
+                # nanoseconds would become ints
+                values = values.astype(f"{kind}8[us]")
+            values = values.tolist()
+            if column.snowflake_type == "TIMESTAMP_LTZ":
+                values = [
+                    v if v is None else v.replace(tzinfo=timezone.utc) for v in values
+                ]
+            if column.mask is not None:
+                mask = column.mask.tolist()
+                values = [None if m else v for v, m in zip(values, mask)]
+        python_columns.append(values)
+    return list(zip(*python_columns))
+
+
+def columns_to_arrow_table(columns: list[BindingColumn]) -> Table:
+    """Builds the typed table of the Parquet files uploaded to a bind stage.
+
+    The columns are named by their position, like the fields of CSV bind files.
+    """
+    arrays = []
+    for column in columns:
+        if isinstance(column.values, numpy.ndarray):
+            array = pyarrow.array(column.values, mask=column.mask)
+            if column.snowflake_type == "TIMESTAMP_LTZ":
+                array = array.cast(pyarrow.timestamp(array.type.unit, tz="UTC"))
+        else:
+            array = pyarrow.array(column.values)
+        arrays.append(_to_parquet_type(array))
+    return pyarrow.Table.from_arrays(
+        arrays, names=[str(index + 1) for index in range(len(arrays))]
+    )
+
+
+def rows_to_arrow_table(rows: Sequence[Sequence[Any]]) -> Table:
+    """Builds the typed table of the Parquet files uploaded to a bind stage from rows,
+    the types are inferred by pyarrow."""
+    arrays = [_to_parquet_type(pyarrow.array(values)) for values in zip(*rows)]
+    return pyarrow.Table.from_arrays(
+        arrays, names=[str(index + 1) for index in range(len(arrays))]
+    )
+
+
+def _to_parquet_type(array: Array) -> Array:
+    # Parquet has no durations, they are bound as TIME like timedelta values
+    if pyarrow.types.is_duration(array.type):
+        unit = "ns" if array.type.unit == "ns" else "us"
+        array = array.cast(pyarrow.duration(unit))
+        return array.cast(pyarrow.int64()).cast(pyarrow.time64(unit))
+    return array
+
+
+def split_binding_params(params: list, max_size: int) -> list[list]:
+    """Splits the transposed binds of a bulk insert into parts of about ``max_size``
+    bytes, each to be sent in its own request.
+
+    Every column is a list of values, or a ``TypeAndBinding`` of a column that was
+    converted already. The size of a row is estimated from a sample of the rows.
+    """
+
+    def values(column) -> list:
+        return column if isinstance(column, list) else column[1]
+
+    row_count = len(values(params[0]))
+    sample = range(0, row_count, max(1, row_count // 1000))
+    sample_size = sum(
+        # quotes and separator of the value in the JSON request
+        len(str(column_values[index])) + 3
+        for column_values in map(values, params)
+        for index in sample
+    )
+    rows_per_part = max(1, int(max_size * len(sample) // max(1, sample_size)))
+    if rows_per_part >= row_count:
+        return [params]
+    return [
+        [
+            (
+                column[start : start + rows_per_part]
+                if isinstance(column, list)
+                else type(column)(column[0], column[1][start : start + rows_per_part])
+            )
+            for column in params
+        ]
+        for start in range(0, row_count, rows_per_part)
+    ]
@@ -62,6 +62,12 @@ from .auth import (
 from .auth.idtoken import AuthByIdToken
 from .backoff_policies import exponential_backoff
 from .bind_upload_agent import BindUploadError
+from .column_bindings import (
+    BindingColumn,
+    column_to_bindings,
+    columns_to_arrow_table,
+    rows_to_arrow_table,
+)
 from .compat import IS_LINUX, IS_WINDOWS, quote, urlencode
 from .config_manager import CONFIG_MANAGER, _get_default_connection_params
 from .connection_diagnostic import ConnectionDiagnostic
@@ -113,6 +119,7 @@ from .errorcode import (
     ER_NOT_IMPLICITY_SNOWFLAKE_DATATYPE,
 )
 from .errors import DatabaseError, Error, OperationalError, ProgrammingError
+from .json_result_decoder import JSONResultDecoder, get_json_result_decoder
 from .log_configuration import EasyLoggingConfigPython
 from .network import (
     DEFAULT_AUTHENTICATOR,
@@ -130,6 +137,8 @@ from .network import (
     ReauthenticationRequest,
     SnowflakeRestful,
 )
+from .options import pyarrow
+from .result_chunk_cache import DEFAULT_RESULT_CHUNK_CACHE_MEMORY_SIZE
 from .session_manager import (
     HttpConfig,
     ProxySupportAdapterFactory,
@@ -269,6 +278,44 @@ DEFAULT_CONFIGURATION: dict[str, tuple[Any, type | tuple[type, ...]]] = {
     "client_prefetch_threads": (4, int),  # snowflake
     "client_fetch_threads": (None, (type(None), int)),
     "client_fetch_use_mp": (False, bool),
+    "client_prefetch_memory_limit": (
+        None,
+        (type(None), int),
+    ),  # upper bound in bytes for result chunks held in memory while prefetching
+    "client_fetch_shared_executor": (
+        False,
+        bool,
+    ),  # download result chunks of every cursor through one process-wide thread pool
+    "client_fetch_arrow_streaming": (
+        False,
+        bool,
+    ),  # decode arrow result chunks while they are being downloaded
+    "client_fetch_spill_memory_limit": (
+        None,
+        (type(None), int),
+    ),  # upper bound in bytes for downloaded result chunks before spilling to disk
+    "client_fetch_spill_directory": (None, (type(None), str)),
+    "client_result_chunk_cache_size": (
+        None,
+        (type(None), int),
+    ),  # upper bound in bytes for result chunks cached on disk
+    "client_result_chunk_cache_memory_size": (
+        DEFAULT_RESULT_CHUNK_CACHE_MEMORY_SIZE,
+        int,
+    ),  # upper bound in bytes for cached result chunks also kept in memory
+    "client_result_chunk_cache_directory": (None, (type(None), str)),
+    "client_prefetch_on_execute": (
+        False,
+        bool,
+    ),  # start downloading the first result chunks when a query finishes
+    "client_stage_binding_format": (
+        "csv",
+        str,
+    ),  # format of the files executemany uploads to the bind stage: csv or parquet
+    "client_bind_request_max_size": (
+        None,
+        (type(None), int),
+    ),  # approximate upper bound in bytes for the binds sent in one bulk insert request
     "numpy": (False, bool),  # snowflake
     "ocsp_response_cache_filename": (None, (type(None), str)),  # snowflake internal
     "converter_class": (DefaultConverterClass(), SnowflakeConverter),
@@ -328,6 +375,10 @@ DEFAULT_CONFIGURATION: dict[str, tuple[Any, type | tuple[type, ...]]] = {
         False,
         bool,
     ),  # Whether to force the JSON content to be decoded in utf-8, it is only effective when result format is JSON
+    "json_result_decoder": (
+        "json",
+        (str, JSONResultDecoder),
+    ),  # Decoder used to load JSON result chunks, it is only effective when result format is JSON
     "server_session_keep_alive": (
         False,
         bool,
@@ -491,7 +542,7 @@ class TypeAndBinding(NamedTuple):
     """Stores the type name and the Snowflake binding."""
 
     type: str
-    binding: str | None
+    binding: str | list[str | None] | None
 
 
 class SnowflakeConnection:
@@ -539,7 +590,46 @@ class SnowflakeConnection:
         client_prefetch_threads: Number of threads to download the result set.
         client_fetch_threads: Number of threads (or processes) to fetch staged query results.
             If not specified, reuses client_prefetch_threads value.
-        client_fetch_use_mp: Enables multiprocessing for fetching query results in parallel.
+        client_fetch_use_mp: Enables multiprocessing for fetching query results in parallel. The worker processes are
+            started once and shared by all result sets of the process, Arrow result chunks are handed back to the
+            application in shared memory.
+        client_prefetch_memory_limit: Memory budget in bytes for downloaded result chunks that have not been consumed yet.
+            When set, the number of chunks prefetched in parallel is sized from the chunks' uncompressed sizes and
+            adapted to how fast the application consumes them. If not specified, a fixed window of
+            client_prefetch_threads chunks is prefetched.
+        client_fetch_shared_executor: When true, result chunks of all cursors in the process are downloaded by one
+            shared, bounded thread pool that serves result sets in a round-robin fashion, instead of by a new thread
+            pool created for every result set. Has no effect when client_fetch_use_mp is enabled.
+        client_fetch_arrow_streaming: When true, Arrow result chunks that are iterated row by row are decoded one
+            record batch at a time while they are still being downloaded, instead of after the whole chunk arrived.
+            This lowers the time to the first row of every chunk.
+        client_fetch_spill_memory_limit: Memory budget in bytes for downloaded Arrow result chunks that have not been
+            consumed yet. Chunks that do not fit are downloaded to Arrow IPC files in client_fetch_spill_directory and
+            memory-mapped back when they are consumed, so fetch_pandas_all and fetch_arrow_all can download results
+            that are bigger than the memory. If not specified, chunks are never spilled to disk.
+        client_fetch_spill_directory: Directory for the files of spilled result chunks. If not specified, the default
+            temporary directory is used.
+        client_result_chunk_cache_size: Enables a local cache of downloaded Arrow result chunks, keyed by query id and
+            chunk index, that is bounded to this many bytes on disk. Fetching the results of the same query again, for
+            example with get_results_from_sfqid, reads the chunks from the cache instead of cloud storage. The least
+            recently used chunks are removed once the size is exceeded. If not specified, nothing is cached.
+        client_result_chunk_cache_memory_size: How many bytes of cached result chunks are also kept in memory. 64 MiB by
+            default.
+        client_result_chunk_cache_directory: Directory of the result chunk cache. It is shared by every connection of
+            the process, by default it is in the user's cache directory.
+        client_prefetch_on_execute: When true, the first result chunks are downloaded in the background as soon as a
+            query finished executing, instead of when the results are first fetched. As many chunks are downloaded as
+            fetching would prefetch, bounded by client_prefetch_memory_limit, and fetching picks up these downloads.
+        client_stage_binding_format: Format of the files that executemany uploads to a temporary stage when the binds
+            exceed CLIENT_STAGE_ARRAY_BINDING_THRESHOLD: "csv" (the default) or "parquet". With "parquet" the binds
+            are written as typed Parquet files when pyarrow is installed, which skips formatting every value as CSV
+            text and keeps the types of timestamps and binary values. When the insert from a Parquet bind stage fails,
+            it is retried with CSV files, which are used for the rest of the connection if the retry succeeds.
+        client_bind_request_max_size: Approximate size in bytes of the binds sent in one request by an executemany bulk
+            insert that does not use a bind stage. Bigger inserts are split into several requests that are executed one
+            after the other, and together report the number of inserted rows. The requests are separate statements:
+            when no transaction is open they are wrapped in a transaction of their own, so that a failed request rolls
+            back the others, otherwise they are part of the open transaction. None (the default) disables splitting.
         rest: Snowflake REST API object. Internal use only. Maybe removed in a later release.
         application: Application name to communicate with Snowflake as. By default, this is "PythonConnector".
         errorhandler: Handler used with errors. By default, an exception will be raised on error.
@@ -555,6 +645,9 @@ class SnowflakeConnection:
         json_result_force_utf8_decoding: When true, json result will be decoded in utf-8,
           when false, the encoding of the content is auto-detected. Default value is false.
           This parameter is only effective when the result format is JSON.
+        json_result_decoder: Decoder used to load downloaded JSON result chunks: "json" (the default, standard library),
+          "orjson" (requires the orjson package), "auto" (orjson when it is installed), or a JSONResultDecoder instance.
+          This parameter is only effective when the result format is JSON.
         server_session_keep_alive: When true, the connector does not destroy the session on the Snowflake server side
           before the connector shuts down. Default value is false.
         token_file_path: The file path of the token file. If both token and token_file_path are provided, the token in token_file_path will be used.
@@ -920,6 +1013,66 @@ class SnowflakeConnection:
     def client_fetch_use_mp(self) -> bool:
         return self._client_fetch_use_mp
 
+    @property
+    def client_prefetch_memory_limit(self) -> int | None:
+        return self._client_prefetch_memory_limit
+
+    @client_prefetch_memory_limit.setter
+    def client_prefetch_memory_limit(self, value: None | int) -> None:
+        if value is not None:
+            value = max(1, value)
+        self._client_prefetch_memory_limit = value
+
+    @property
+    def client_fetch_spill_memory_limit(self) -> int | None:
+        return self._client_fetch_spill_memory_limit
+
+    @client_fetch_spill_memory_limit.setter
+    def client_fetch_spill_memory_limit(self, value: None | int) -> None:
+        if value is not None:
+            value = max(0, value)
+        self._client_fetch_spill_memory_limit = value
+
+    @property
+    def client_fetch_spill_directory(self) -> str | None:
+        return self._client_fetch_spill_directory
+
+    @property
+    def client_result_chunk_cache_size(self) -> int | None:
+        return self._client_result_chunk_cache_size
+
+    @property
+    def client_result_chunk_cache_memory_size(self) -> int:
+        return self._client_result_chunk_cache_memory_size
+
+    @property
+    def client_result_chunk_cache_directory(self) -> str | None:
+        return self._client_result_chunk_cache_directory
+
+    @property
+    def client_fetch_shared_executor(self) -> bool:
+        return self._client_fetch_shared_executor
+
+    @property
+    def client_fetch_arrow_streaming(self) -> bool:
+        return self._client_fetch_arrow_streaming
+
+    @property
+    def client_prefetch_on_execute(self) -> bool:
+        return self._client_prefetch_on_execute
+
+    @property
+    def client_stage_binding_format(self) -> str:
+        return self._client_stage_binding_format
+
+    @property
+    def client_bind_request_max_size(self) -> int | None:
+        return self._client_bind_request_max_size
+
+    @property
+    def json_result_decoder(self) -> JSONResultDecoder:
+        return self._json_result_decoder
+
     @property
     def rest(self) -> SnowflakeRestful | None:
         return self._rest
@@ -1665,6 +1818,20 @@ class SnowflakeConnection:
                 msg="Invalid paramstyle is specified", errno=ER_INVALID_VALUE
             )
 
+        if self._client_stage_binding_format not in ("csv", "parquet"):
+            raise ProgrammingError(
+                msg="Invalid client_stage_binding_format is specified: "
+                f"{self._client_stage_binding_format}",
+                errno=ER_INVALID_VALUE,
+            )
+
+        try:
+            self._json_result_decoder = get_json_result_decoder(
+                self._json_result_decoder
+            )
+        except ValueError as e:
+            raise ProgrammingError(msg=str(e), errno=ER_INVALID_VALUE)
+
         if self._auth_class and not isinstance(self._auth_class, AuthByPlugin):
             raise TypeError("auth_class must subclass AuthByPlugin")
 
@@ -1999,26 +2166,88 @@ class SnowflakeConnection:
                 break
 
     def _write_params_to_byte_rows(
-        self, params: list[tuple[Any | tuple]]
-    ) -> list[bytes]:
-        """Write csv-format rows of binding values as list of bytes string.
+        self, params: Iterable[tuple[Any | tuple]]
+    ) -> Iterator[bytes]:
+        """Write csv-format rows of binding values as bytes strings.
+
+        The rows are converted lazily, while they are consumed.
 
         Args:
             params: Binding parameters to bulk array insertion query with qmark/numeric format.
-            cursor: SnowflakeCursor.
 
         Returns:
-            List of bytes string corresponding to rows
+            Iterator of bytes strings corresponding to rows
 
         """
-        res = []
         try:
             for row in params:
                 temp = map(self.converter.to_csv_bindings, row)
-                res.append((",".join(temp) + "\n").encode("utf-8"))
+                yield (",".join(temp) + "\n").encode("utf-8")
         except (ProgrammingError, AttributeError) as exc:
             raise BindUploadError from exc
-        return res
+
+    def _write_columns_to_byte_rows(
+        self, columns: list[BindingColumn]
+    ) -> Iterator[bytes]:
+        """Write csv-format rows of binding values given as columns.
+
+        Every column is converted in one pass, unless it holds Python objects.
+
+        Args:
+            columns: Columns of binding parameters to bulk array insertion query.
+
+        Returns:
+            Iterator of bytes strings corresponding to rows
+
+        """
+        try:
+            csv_columns = []
+            for column in columns:
+                converted = column_to_bindings(column, csv=True)
+                if converted is None:
+                    csv_columns.append(
+                        map(self.converter.to_csv_bindings, column.values)
+                    )
+                else:
+                    csv_columns.append(converted[1])
+            for row in zip(*csv_columns):
+                yield (",".join(row) + "\n").encode("utf-8")
+        except (ProgrammingError, AttributeError) as exc:
+            raise BindUploadError from exc
+
+    def _write_params_to_arrow_table(
+        self, params: Sequence[Sequence[Any]] | list[BindingColumn]
+    ) -> pyarrow.Table:
+        """Write binding values as a typed pyarrow Table for Parquet bind files.
+
+        Args:
+            params: Rows or columns of binding parameters to bulk array insertion query.
+
+        Returns:
+            A table with one column per parameter
+
+        """
+        try:
+            if params and isinstance(params[0], BindingColumn):
+                return columns_to_arrow_table(params)
+            return rows_to_arrow_table(params)
+        except (pyarrow.ArrowException, TypeError, ValueError) as exc:
+            raise BindUploadError from exc
+
+    def _columns_to_qmark_params(self, columns: list[BindingColumn]) -> list:
+        """Converts columns of binding values to the qmark parameters of a bulk insert.
+
+        Columns holding Python objects are left as lists, they are converted value by
+        value in ``_process_params_qmarks``.
+        """
+        params = []
+        for column in columns:
+            converted = column_to_bindings(column)
+            if converted is None:
+                params.append(list(column.values))
+            else:
+                params.append(TypeAndBinding(*converted))
+        return params
 
     def _get_snowflake_type_and_binding(
         self,
@@ -2072,7 +2301,10 @@ class SnowflakeConnection:
         get_type_and_binding = partial(self._get_snowflake_type_and_binding, cursor)
 
         for idx, v in enumerate(params):
-            if isinstance(v, list):
+            if isinstance(v, TypeAndBinding):
+                # a column that was converted already
+                processed_params[str(idx + 1)] = {"type": v.type, "value": v.binding}
+            elif isinstance(v, list):
                 snowflake_type = self.converter.snowflake_type(v)
                 all_param_data = list(map(get_type_and_binding, v))
                 first_type = all_param_data[0].type
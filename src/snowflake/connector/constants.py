@@ -418,6 +418,8 @@ gigabyte = megabyte * 1024
 class IterUnit(Enum):
     ROW_UNIT = "row"
     TABLE_UNIT = "table"
+    COLUMN_UNIT = "column"
+    STREAM_UNIT = "stream"
 
 
 # File Transfer
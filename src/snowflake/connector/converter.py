@@ -41,6 +41,13 @@ ZERO_TIMEDELTA = timedelta(seconds=0)
 ZERO_EPOCH_DATE = date(1970, 1, 1)
 ZERO_EPOCH = datetime.fromtimestamp(0, timezone.utc).replace(tzinfo=None)
 ZERO_FILL = "000000000"
+# range of the epoch days and seconds that date and datetime can represent
+MIN_DATE_DAYS = (date.min - ZERO_EPOCH_DATE).days
+MAX_DATE_DAYS = (date.max - ZERO_EPOCH_DATE).days
+MIN_DATETIME_SECONDS = MIN_DATE_DAYS * 86400
+MAX_DATETIME_SECONDS = MAX_DATE_DAYS * 86400 + 86399
+# range of the epoch seconds that fit into numpy.datetime64 nanoseconds
+MAX_DATETIME64_NS_SECONDS = 9_223_372_035
 
 logger = getLogger(__name__)
 
@@ -81,6 +88,7 @@ PYTHON_TO_SNOWFLAKE_TYPE = {
 
 # Type alias
 SnowflakeConverterType = Callable[[Any], Any]
+SnowflakeColumnConverterType = Callable[[list], list]
 
 
 def convert_datetime_to_epoch(dt: datetime) -> float:
@@ -143,6 +151,22 @@ def _adjust_fraction_of_nanoseconds(value: str, max_fraction: int, scale: int) -
         return int(str(max_fraction - frac) + ZERO_FILL[: 9 - scale])
 
 
+def _split_timestamps(
+    values: list[str], pad: int = 0
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Splits epoch timestamps into their sign, whole seconds and fraction digits.
+
+    ``pad`` right pads the fraction digits with zeros to the given width.
+    """
+    parts = numpy.char.partition(numpy.array(values), ".")
+    fraction = parts[:, 2]
+    if pad:
+        fraction = numpy.char.ljust(fraction, pad, "0")
+    fraction = numpy.where(fraction == "", "0", fraction).astype(numpy.int64)
+    negative = numpy.char.startswith(parts[:, 0], "-")
+    return negative, parts[:, 0].astype(numpy.int64), fraction
+
+
 def _generate_tzinfo_from_tzoffset(tzoffset_minutes: int) -> tzinfo:
     """Generates tzinfo object from tzoffset."""
     return pytz.FixedOffset(tzoffset_minutes)
@@ -184,6 +208,35 @@ class SnowflakeConverter:
         logger.warning("No column converter found for type: %s", type_name)
         return None  # Skip conversion
 
+    def to_python_column_method(
+        self, type_name, column
+    ) -> SnowflakeColumnConverterType | None:
+        """FROM Snowflake to Python Objects, a whole column of values at a time.
+
+        Returns a NumPy vectorized equivalent of the converter ``to_python_method``
+        returns, or None if the type has none. The returned function converts a list
+        of non-null values, it raises ``ValueError`` if any of them can not be
+        converted, in which case the caller should convert the values one by one.
+        """
+        if numpy is None or (
+            type(self).to_python_method is not SnowflakeConverter.to_python_method
+        ):
+            return None
+        ctx = column.copy()
+        converters = [f"_{type_name}_to_python"]
+        if self._use_numpy:
+            converters.insert(0, f"_{type_name}_numpy_to_python")
+        for conv in converters:
+            row_conv = getattr(type(self), conv, None)
+            if row_conv is None:
+                continue
+            # only a converter that has not been overridden can be replaced
+            if row_conv is not getattr(SnowflakeConverter, conv, None):
+                return None
+            column_conv = getattr(self, f"{conv}_column", None)
+            return column_conv(ctx) if column_conv is not None else None
+        return None
+
     def _FIXED_to_python(self, ctx: dict[str, Any]) -> Callable:
         return int if ctx["scale"] == 0 else decimal.Decimal
 
@@ -235,6 +288,15 @@ class SnowflakeConverter:
 
         return conv
 
+    def _DATE_to_python_column(self, _: dict[str, str | None]) -> Callable:
+        def conv(values: list[str]) -> list[date]:
+            days = numpy.array(values).astype(numpy.int64)
+            if len(days) and (days.min() < MIN_DATE_DAYS or days.max() > MAX_DATE_DAYS):
+                raise ValueError("date out of range")
+            return days.astype("datetime64[D]").tolist()
+
+        return conv
+
     def _DATE_numpy_to_python(self, _) -> Callable:
         """Converts DATE to datetime.
 
@@ -311,6 +373,29 @@ class SnowflakeConverter:
 
         return partial(SnowflakeConverter.create_timestamp_from_string, scale=scale)
 
+    def _TIMESTAMP_NTZ_to_python_column(self, ctx: dict[str, Any]) -> Callable:
+        scale = ctx["scale"]
+
+        def conv(values: list[str]) -> list[datetime]:
+            negative, seconds, fraction = _split_timestamps(values)
+            fraction = numpy.where(negative, -fraction, fraction)
+            # rounds down like SnowflakeConverter.get_seconds_microseconds
+            if scale > 6:
+                fraction //= 10 ** (scale - 6)
+            else:
+                fraction *= 10 ** (6 - scale)
+            if len(seconds) and (
+                abs(seconds).max() > MAX_DATETIME_SECONDS
+                or (seconds * 1_000_000 + fraction).min()
+                < MIN_DATETIME_SECONDS * 1_000_000
+            ):
+                raise ValueError("timestamp out of range")
+            return (
+                (seconds * 1_000_000 + fraction).astype("datetime64[us]").tolist()
+            )
+
+        return conv
+
     def _TIMESTAMP_NTZ_numpy_to_python(self, ctx):
         """TIMESTAMP NTZ to datetime64 with no timezone info is attached."""
 
@@ -320,6 +405,19 @@ class SnowflakeConverter:
 
         return conv
 
+    def _TIMESTAMP_NTZ_numpy_to_python_column(self, ctx: dict[str, Any]) -> Callable:
+        def conv(values: list[str]) -> list[numpy.datetime64]:
+            # the fraction is taken literally, like decimal.Decimal does
+            negative, seconds, fraction = _split_timestamps(values, pad=9)
+            if len(seconds) and abs(seconds).max() > MAX_DATETIME64_NS_SECONDS:
+                raise ValueError("timestamp out of range")
+            nanoseconds = seconds * 1_000_000_000 + numpy.where(
+                negative, -fraction, fraction
+            )
+            return list(nanoseconds.astype("datetime64[ns]"))
+
+        return conv
+
     def _TIME_to_python(self, ctx: dict[str, Any]) -> Callable:
         """TIME to formatted string, SnowflakeDateTime, or datetime.time with no timezone attached."""
         scale = ctx["scale"]
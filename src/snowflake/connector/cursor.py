@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import abc
 import collections
+import itertools
 import logging
 import os
 import re
@@ -14,7 +15,7 @@ import warnings
 from enum import Enum
 from logging import getLogger
 from threading import Lock
-from types import TracebackType
+from types import GeneratorType, TracebackType
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -36,10 +37,20 @@ from typing import (
 from typing_extensions import Self
 
 from snowflake.connector.result_batch import create_batches_from_response
-from snowflake.connector.result_set import ResultSet
+from snowflake.connector.result_set import ResultPartition, ResultSet
 
 from . import compat
-from ._sql_util import get_file_transfer_type
+from ._download_executor import get_shared_download_executor
+from ._sql_util import (
+    ALTER_SESSION_RE,
+    COMMENT_SQL_RE,
+    DESC_TABLE_RE,
+    INSERT_SQL_RE,
+    INSERT_SQL_VALUES_RE,
+    get_file_transfer_type,
+    get_statement_info,
+    statement_cache_info,
+)
 from ._utils import (
     REQUEST_ID_STATEMENT_PARAM_NAME,
     _snowflake_max_parallelism_for_file_transfer,
@@ -47,6 +58,13 @@ from ._utils import (
     is_uuid4,
 )
 from .bind_upload_agent import BindUploadAgent, BindUploadError
+from .column_bindings import (
+    BindingColumn,
+    columns_to_rows,
+    is_columnar,
+    split_binding_params,
+    to_binding_columns,
+)
 from .constants import (
     CMD_TYPE_DOWNLOAD,
     CMD_TYPE_UPLOAD,
@@ -61,10 +79,12 @@ from .errorcode import (
     ER_FAILED_TO_REWRITE_MULTI_ROW_INSERT,
     ER_INVALID_VALUE,
     ER_NO_ARROW_RESULT,
+    ER_NO_DATA_FOUND,
+    ER_NO_NUMPY,
     ER_NO_PYARROW,
     ER_NO_PYARROW_SNOWSQL,
     ER_NOT_POSITIVE_SIZE,
-    ER_UNSUPPORTED_METHOD,
+    ER_RESULTS_ALREADY_FETCHED,
 )
 from .errors import (
     DatabaseError,
@@ -75,13 +95,15 @@ from .errors import (
     ProgrammingError,
 )
 from .options import installed_pandas
-from .sqlstate import SQLSTATE_FEATURE_NOT_SUPPORTED
 from .telemetry import TelemetryData, TelemetryField
 from .time_util import get_time_millis
 
 if TYPE_CHECKING:  # pragma: no cover
+    from functools import _CacheInfo
+
+    from numpy import ndarray
     from pandas import DataFrame
-    from pyarrow import Table
+    from pyarrow import RecordBatchReader, Table
 
     from .connection import SnowflakeConnection
     from .file_transfer_agent import (
@@ -132,7 +154,6 @@ STATEMENT_TYPE_ID_DML_SET = frozenset(
     ]
 )
 
-DESC_TABLE_RE = re.compile(r"desc(?:ribe)?\s+([\w_]+)\s*;?\s*$", flags=re.IGNORECASE)
 
 LOG_MAX_QUERY_LENGTH = 80
 
@@ -332,6 +353,14 @@ def exit_handler(*_) -> NoReturn:
     sys.exit(1)
 
 
+def _rows_from(
+    rows: list[tuple] | list[dict], start: int, rest: Iterator[tuple] | Iterator[dict]
+) -> Iterator[tuple] | Iterator[dict]:
+    """Yields the rows of a kept result batch from ``start`` on, then the ones after it."""
+    yield from itertools.islice(rows, start, None)
+    yield from rest
+
+
 class ResultState(Enum):
     DEFAULT = 1
     VALID = 2
@@ -344,15 +373,10 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
     #    Most of these attributes have no reason to be properties, we could just store them in public variables.
     #    Calling a function is expensive in Python and most of these getters are unnecessary.
 
-    INSERT_SQL_RE = re.compile(r"^insert\s+into", flags=re.IGNORECASE)
-    COMMENT_SQL_RE = re.compile(r"/\*.*\*/")
-    INSERT_SQL_VALUES_RE = re.compile(
-        r".*VALUES\s*(\(.*\)).*", re.IGNORECASE | re.MULTILINE | re.DOTALL
-    )
-    ALTER_SESSION_RE = re.compile(
-        r"alter\s+session\s+set\s+(\w*?)\s*=\s*\'?([^\']+?)\'?\s*(?:;|$)",
-        flags=re.IGNORECASE | re.MULTILINE | re.DOTALL,
-    )
+    INSERT_SQL_RE = INSERT_SQL_RE
+    COMMENT_SQL_RE = COMMENT_SQL_RE
+    INSERT_SQL_VALUES_RE = INSERT_SQL_VALUES_RE
+    ALTER_SESSION_RE = ALTER_SESSION_RE
 
     @staticmethod
     def get_file_transfer_type(sql: str) -> FileTransferType | None:
@@ -363,6 +387,12 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         """
         return get_file_transfer_type(sql)
 
+    @staticmethod
+    def statement_cache_info() -> _CacheInfo:
+        """Returns the hits, misses, maximum and current size of the process-wide
+        cache of what is derived from the text of executed SQL statements."""
+        return statement_cache_info()
+
     def __init__(
         self,
         connection: SnowflakeConnection,
@@ -419,6 +449,12 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         self._inner_cursor: SnowflakeCursorBase | None = None
         self._prefetch_hook = None
         self._rownumber: int | None = None
+        # first row index and rows of the batch the cursor was scrolled to, and the
+        # iterator of the rows after them
+        self._scrolled_batch: (
+            tuple[int, list[tuple] | list[dict], Iterator[tuple] | Iterator[dict]]
+            | None
+        ) = None
 
         self.reset()
 
@@ -893,6 +929,7 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         num_statements: int | None = None,
         _force_qmark_paramstyle: bool = False,
         _dataframe_ast: str | None = None,
+        _cache_statement: bool = True,
     ) -> Self | dict[str, Any] | None:
         """Executes a command/query.
 
@@ -929,6 +966,8 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
             statements being submitted (or 0 if submitting an uncounted number) when using a multi-statement query.
             _force_qmark_paramstyle: Force the use of qmark paramstyle regardless of the connection's paramstyle.
             _dataframe_ast: Base64-encoded dataframe request abstract syntax tree.
+            _cache_statement: Whether the analysis of the command may be cached, False when values were
+                filled into it.
 
         Returns:
             The cursor itself, or None if some error happened, or the response returned
@@ -997,9 +1036,18 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                     params, self
                 )
 
-        m = DESC_TABLE_RE.match(query)
-        if m:
-            query1 = f"describe table {m.group(1)}"
+        # the statement is analyzed before its values are filled in, so executing it
+        # with other values hits the cache and no values are kept in the cache
+        statement = get_statement_info(command, cache=_cache_statement)
+        if query != command and (
+            statement.describe_table or statement.session_parameters
+        ):
+            # what these statements do depends on the values
+            statement = get_statement_info(query, cache=False)
+        if _is_put_get is None:
+            kwargs["_is_put_get"] = statement.file_transfer_type is not None
+        if statement.describe_table:
+            query1 = statement.describe_table
             logger.debug(
                 "query was rewritten: org=%s, new=%s",
                 " ".join(line.strip() for line in query.split("\n")),
@@ -1036,10 +1084,7 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
             logger.debug("SUCCESS")
             data = ret["data"]
 
-            for m in self.ALTER_SESSION_RE.finditer(query):
-                # session parameters
-                param = m.group(1).upper()
-                value = m.group(2)
+            for param, value in statement.session_parameters:
                 self._connection.converter.set_parameter(param, value)
 
             if "resultIds" in data:
@@ -1191,13 +1236,28 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                 "Number of results in first chunk: %s", result_chunks[0].rowcount
             )
 
+        prefetch_thread_num = (
+            self._connection.client_fetch_threads
+            or self._connection.client_prefetch_threads
+        )
         self._result_set = ResultSet(
             self,
             result_chunks,
-            self._connection.client_fetch_threads
-            or self._connection.client_prefetch_threads,
+            prefetch_thread_num,
             self._connection.client_fetch_use_mp,
+            self._connection.client_prefetch_memory_limit,
+            download_executor=(
+                get_shared_download_executor(prefetch_thread_num)
+                if self._connection.client_fetch_shared_executor
+                else None
+            ),
+            spill_memory_limit=self._connection.client_fetch_spill_memory_limit,
+            spill_directory=self._connection.client_fetch_spill_directory,
         )
+        if self._connection.client_prefetch_on_execute and not (
+            is_dml or self.is_file_transfer
+        ):
+            self._result_set.prefetch()
         self._rownumber = -1
         self._result_state = ResultState.VALID
 
@@ -1273,6 +1333,20 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                 },
             )
 
+    def check_can_use_numpy(self) -> None:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            Error.errorhandler_wrapper(
+                self.connection,
+                self,
+                ProgrammingError,
+                {
+                    "msg": "Numpy module is not installed. Cannot fetch data as numpy",
+                    "errno": ER_NO_NUMPY,
+                },
+            )
+
     def query_result(self, qid: str) -> SnowflakeCursor:
         """Query the result of a previously executed query."""
         url = f"/queries/{qid}/result"
@@ -1310,7 +1384,14 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
             )
         return self
 
-    def fetch_arrow_batches(self) -> Iterator[Table]:
+    def fetch_arrow_batches(self, ordered: bool = True) -> Iterator[Table]:
+        """Fetches the results as pyarrow Tables, one per result chunk.
+
+        Args:
+            ordered: Set to False to get the tables in the order their chunks finish
+                downloading rather than in result order, so that a slow download does
+                not hold back the chunks after it. Default value is True.
+        """
         self.check_can_use_arrow_resultset()
         if self._prefetch_hook is not None:
             self._prefetch_hook()
@@ -1319,7 +1400,7 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         self._log_telemetry_job_data(
             TelemetryField.ARROW_FETCH_BATCHES, TelemetryData.TRUE
         )
-        return self._result_set._fetch_arrow_batches()
+        return self._result_set._fetch_arrow_batches(ordered=ordered)
 
     @overload
     def fetch_arrow_all(self, force_return_table: Literal[False]) -> Table | None: ...
@@ -1343,8 +1424,99 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         self._log_telemetry_job_data(TelemetryField.ARROW_FETCH_ALL, TelemetryData.TRUE)
         return self._result_set._fetch_arrow_all(force_return_table=force_return_table)
 
-    def fetch_pandas_batches(self, **kwargs: Any) -> Iterator[DataFrame]:
-        """Fetches a single Arrow Table."""
+    def fetch_arrow_reader(self) -> RecordBatchReader:
+        """Fetches the results as a pyarrow RecordBatchReader.
+
+        Unlike ``fetch_arrow_all``, the results are never held in memory at once. The
+        result chunks are downloaded and converted while the reader is read, so it can
+        be handed to ``pyarrow.dataset.write_dataset`` or duckdb to stream results
+        that do not fit in memory. The schema is known when the reader is returned.
+        Whatever integer width the back-end used for a chunk, NUMBER columns are
+        int64, decimals when they have more than 18 digits, and float64 or decimals
+        with ``arrow_number_to_decimal`` when they have a scale.
+        """
+        self.check_can_use_arrow_resultset()
+        if self._prefetch_hook is not None:
+            self._prefetch_hook()
+        if self._query_result_format != "arrow":
+            raise NotSupportedError
+        self._log_telemetry_job_data(
+            TelemetryField.ARROW_FETCH_READER, TelemetryData.TRUE
+        )
+        return self._result_set._fetch_arrow_reader()
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        """Exports the results as an "arrow_array_stream" PyCapsule.
+
+        This implements the Arrow PyCapsule interface, so the cursor can be handed to
+        libraries like polars, duckdb or DataFusion, which then read the record
+        batches without pyarrow and without copying them. The record batches have
+        the types ``fetch_arrow_all`` returns. Result chunks are downloaded while the
+        stream is read, like when fetching rows, and the results can be exported
+        once. ``requested_schema`` is ignored.
+        """
+        self.check_can_use_arrow_resultset()
+        if self._prefetch_hook is not None:
+            self._prefetch_hook()
+        if self._query_result_format != "arrow":
+            raise NotSupportedError
+        self._log_telemetry_job_data(
+            TelemetryField.ARROW_FETCH_C_STREAM, TelemetryData.TRUE
+        )
+        return self._result_set._fetch_arrow_stream()
+
+    def fetch_numpy_batches(self, ordered: bool = True) -> Iterator[dict[str, ndarray]]:
+        """Fetches the results as NumPy arrays, one batch per result chunk.
+
+        Each batch is a dict that maps the column names to one contiguous array per
+        column. The arrays are built directly from the Arrow result chunks, neither
+        pyarrow nor pandas is needed.
+
+        NUMBER columns become int64 arrays, or float64 arrays if they have a scale.
+        NUMBER columns without a scale and with a precision above 18 become object
+        arrays of ints. FLOAT columns become float64, BOOLEAN bool, DATE
+        datetime64[D] and TIMESTAMP datetime64[ns] arrays. TIMESTAMP_LTZ and TIMESTAMP_TZ values are in UTC.
+        Columns of these types that contain NULL values are returned as
+        ``numpy.ma.MaskedArray``. All other columns are object arrays holding the
+        values that fetching rows returns, with None for NULL.
+
+        Unless ``ordered``, the batches are returned in the order their chunks finish
+        downloading, see ``fetch_arrow_batches``.
+        """
+        self.check_can_use_arrow_resultset()
+        self.check_can_use_numpy()
+        if self._prefetch_hook is not None:
+            self._prefetch_hook()
+        if self._query_result_format != "arrow":
+            raise NotSupportedError
+        self._log_telemetry_job_data(
+            TelemetryField.NUMPY_FETCH_BATCHES, TelemetryData.TRUE
+        )
+        return self._result_set._fetch_numpy_batches(ordered=ordered)
+
+    def fetch_numpy_all(self) -> dict[str, ndarray]:
+        """Fetches all results as a dict with a NumPy array per column.
+
+        See ``fetch_numpy_batches`` for the types of the arrays. When the query
+        returns no rows the arrays are empty.
+        """
+        self.check_can_use_arrow_resultset()
+        self.check_can_use_numpy()
+        if self._prefetch_hook is not None:
+            self._prefetch_hook()
+        if self._query_result_format != "arrow":
+            raise NotSupportedError
+        self._log_telemetry_job_data(TelemetryField.NUMPY_FETCH_ALL, TelemetryData.TRUE)
+        return self._result_set._fetch_numpy_all()
+
+    def fetch_pandas_batches(
+        self, ordered: bool = True, **kwargs: Any
+    ) -> Iterator[DataFrame]:
+        """Fetches Pandas dataframes, one per result chunk.
+
+        Unless ``ordered``, the dataframes are returned in the order their chunks
+        finish downloading, see ``fetch_arrow_batches``.
+        """
         self.check_can_use_pandas()
         if self._prefetch_hook is not None:
             self._prefetch_hook()
@@ -1353,7 +1525,7 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         self._log_telemetry_job_data(
             TelemetryField.PANDAS_FETCH_BATCHES, TelemetryData.TRUE
         )
-        return self._result_set._fetch_pandas_batches(**kwargs)
+        return self._result_set._fetch_pandas_batches(ordered=ordered, **kwargs)
 
     def fetch_pandas_all(self, **kwargs: Any) -> DataFrame:
         """
@@ -1388,26 +1560,53 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         seqparams: Sequence[Any] | dict[str, Any],
         **kwargs: Any,
     ) -> SnowflakeCursor:
-        """Executes a command/query with the given set of parameters sequentially."""
+        """Executes a command/query with the given set of parameters sequentially.
+
+        Besides a sequence of rows, ``seqparams`` can be columns: a pyarrow Table or
+        RecordBatch, a pandas DataFrame or a dict of NumPy arrays. A bulk insert
+        with qmark or numeric parameters converts each of these columns in one pass,
+        with the Snowflake type taken from its data type.
+        """
         logger.debug("executing many SQLs/commands")
         command = command.strip(" \t\n\r") if command else None
 
-        if not seqparams:
+        columns = None
+        if is_columnar(seqparams):
+            columns = to_binding_columns(seqparams)
+            row_count = len(columns[0]) if columns else 0
+            for column in columns:
+                if len(column) != row_count:
+                    error_value = {
+                        "msg": f"Bulk data size don't match. expected: {row_count}, "
+                        f"got: {len(column)} in column {column.name}, "
+                        f"command: {command}",
+                        "errno": ER_INVALID_VALUE,
+                    }
+                    Error.errorhandler_wrapper(
+                        self.connection, self, InterfaceError, error_value
+                    )
+                    return self
+            no_params = not row_count
+        else:
+            no_params = not seqparams
+        if no_params:
             logger.warning(
                 "No parameters provided to executemany, returning without doing anything."
             )
             return self
 
-        if self.INSERT_SQL_RE.match(command) and (
+        statement = get_statement_info(command)
+        if statement.is_insert and (
             "num_statements" not in kwargs or kwargs.get("num_statements") == 1
         ):
             if self._connection.is_pyformat:
                 # TODO(SNOW-940692) - utilize multi-statement instead of rewriting the query and
                 #  accumulate results to mock the result from a single insert statement as formatted below
                 logger.debug("rewriting INSERT query")
-                command_wo_comments = re.sub(self.COMMENT_SQL_RE, "", command)
-                m = self.INSERT_SQL_VALUES_RE.match(command_wo_comments)
-                if not m:
+                if columns is not None:
+                    seqparams = columns_to_rows(columns)
+                fmt = statement.insert_values
+                if fmt is None:
                     Error.errorhandler_wrapper(
                         self.connection,
                         self,
@@ -1418,7 +1617,6 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                         },
                     )
 
-                fmt = m.group(1)
                 values = []
                 for param in seqparams:
                     logger.debug(f"parameter: {param}")
@@ -1426,24 +1624,27 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                         fmt % self._connection._process_params_pyformat(param, self)
                     )
                 command = command.replace(fmt, ",".join(values), 1)
-                self.execute(command, **kwargs)
+                self.execute(command, _cache_statement=False, **kwargs)
                 return self
             else:
                 logger.debug("bulk insert")
-                # sanity check
-                row_size = len(seqparams[0])
-                for row in seqparams:
-                    if len(row) != row_size:
-                        error_value = {
-                            "msg": f"Bulk data size don't match. expected: {row_size}, "
-                            f"got: {len(row)}, command: {command}",
-                            "errno": ER_INVALID_VALUE,
-                        }
-                        Error.errorhandler_wrapper(
-                            self.connection, self, InterfaceError, error_value
-                        )
-                        return self
-                bind_size = len(seqparams) * row_size
+                if columns is not None:
+                    bind_size = row_count * len(columns)
+                else:
+                    # sanity check
+                    row_size = len(seqparams[0])
+                    for row in seqparams:
+                        if len(row) != row_size:
+                            error_value = {
+                                "msg": "Bulk data size don't match. expected: "
+                                f"{row_size}, got: {len(row)}, command: {command}",
+                                "errno": ER_INVALID_VALUE,
+                            }
+                            Error.errorhandler_wrapper(
+                                self.connection, self, InterfaceError, error_value
+                            )
+                            return self
+                    bind_size = len(seqparams) * row_size
                 bind_stage = None
                 if (
                     bind_size
@@ -1452,10 +1653,11 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                     ]
                     > 0
                 ):
-                    # bind stage optimization
+                    # bind stage optimization, the rows are converted while uploading
                     try:
-                        rows = self.connection._write_params_to_byte_rows(seqparams)
-                        bind_uploader = BindUploadAgent(self, rows)
+                        bind_uploader = self._create_bind_upload_agent(
+                            seqparams if columns is None else columns
+                        )
                         bind_uploader.upload()
                         bind_stage = bind_uploader.stage_path
                     except BindUploadError:
@@ -1463,15 +1665,42 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
                             "Failed to upload binds to stage, sending binds to "
                             "Snowflake instead."
                         )
-                binding_param = (
-                    None if bind_stage else list(map(list, zip(*seqparams)))
-                )  # transpose
-                self.execute(
-                    command, params=binding_param, _bind_stage=bind_stage, **kwargs
-                )
+                if bind_stage:
+                    binding_param = None
+                elif columns is not None:
+                    binding_param = self.connection._columns_to_qmark_params(columns)
+                else:
+                    binding_param = list(map(list, zip(*seqparams)))  # transpose
+                max_size = self.connection.client_bind_request_max_size
+                if binding_param and max_size:
+                    parts = split_binding_params(binding_param, max_size)
+                    if len(parts) > 1:
+                        self._execute_split_binds(command, parts, **kwargs)
+                        return self
+                try:
+                    self.execute(
+                        command, params=binding_param, _bind_stage=bind_stage, **kwargs
+                    )
+                except ProgrammingError:
+                    if bind_stage is None or bind_uploader._file_format != "parquet":
+                        raise
+                    # the insert is retried with CSV files, which are used from now on
+                    # if Snowflake only rejected the Parquet files
+                    logger.debug(
+                        "Failed to insert the binds uploaded as Parquet files, "
+                        "uploading them as CSV instead."
+                    )
+                    self.connection._client_stage_binding_format = "csv"
+                    try:
+                        return self.executemany(command, seqparams, **kwargs)
+                    except Error:
+                        self.connection._client_stage_binding_format = "parquet"
+                        raise
                 return self
 
         self.reset()
+        if columns is not None:
+            seqparams = columns_to_rows(columns)
         if "num_statements" not in kwargs:
             # fall back to old driver behavior when the user does not provide the parameter to enable
             #  multi-statement optimizations for executemany
@@ -1501,6 +1730,61 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
 
         return self
 
+    def _execute_split_binds(
+        self, command: str, parts: list[list], **kwargs: Any
+    ) -> None:
+        """Executes a bulk insert whose binds were split into several requests.
+
+        The parts are executed one after the other by this cursor, its row count is the
+        one of all parts. Every part is a statement of its own: when no transaction is
+        open, they are wrapped in a transaction so that a failed part rolls back the
+        parts before it. Otherwise they belong to the open transaction, which the
+        caller commits or rolls back.
+        """
+        logger.debug(f"sending bulk insert binds in {len(parts)} requests")
+        with self.connection.cursor() as transaction_cursor:
+            own_transaction = (
+                transaction_cursor.execute("SELECT CURRENT_TRANSACTION()").fetchone()[0]
+                is None
+            )
+            if own_transaction:
+                transaction_cursor.execute("BEGIN")
+            try:
+                self.reset()
+                for params in parts:
+                    self.execute(command, params=params, _do_reset=False, **kwargs)
+            except BaseException:
+                if own_transaction:
+                    logger.debug("rolling back the parts of the failed bulk insert")
+                    transaction_cursor.execute("ROLLBACK")
+                raise
+            if own_transaction:
+                transaction_cursor.execute("COMMIT")
+
+    def _create_bind_upload_agent(
+        self, params: Sequence[Any] | list[BindingColumn]
+    ) -> BindUploadAgent:
+        """Creates the agent uploading the rows or columns of a bulk insert to a stage,
+        in the file format configured by client_stage_binding_format."""
+        columnar = bool(params) and isinstance(params[0], BindingColumn)
+        if self.connection.client_stage_binding_format == "parquet":
+            if installed_pandas:
+                try:
+                    table = self.connection._write_params_to_arrow_table(params)
+                    return BindUploadAgent(self, table, file_format="parquet")
+                except BindUploadError:
+                    logger.debug(
+                        "Failed to convert binds to an Arrow table, uploading them "
+                        "as CSV instead."
+                    )
+            else:
+                logger.debug("pyarrow is not installed, uploading binds as CSV.")
+        if columnar:
+            rows = self.connection._write_columns_to_byte_rows(params)
+        else:
+            rows = self.connection._write_params_to_byte_rows(params)
+        return BindUploadAgent(self, rows)
+
     @abc.abstractmethod
     def fetchone(self) -> FetchRow:
         pass
@@ -1598,17 +1882,75 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         del column
         logger.debug("nop")
 
-    def scroll(self, value, mode: str = "relative") -> None:
-        Error.errorhandler_wrapper(
-            self.connection,
-            self,
-            NotSupportedError,
-            {
-                "msg": "scroll is not supported.",
-                "errno": ER_UNSUPPORTED_METHOD,
-                "sqlstate": SQLSTATE_FEATURE_NOT_SUPPORTED,
-            },
-        )
+    def scroll(self, value: int, mode: str = "relative") -> None:
+        """Moves the cursor to another row of the results.
+
+        With ``mode="relative"`` ``value`` is added to the current position, with
+        ``mode="absolute"`` it is the index of the row the next fetch returns. The row
+        counts of the result chunks are known, so only the chunk holding the target row
+        and the ones after it are downloaded, not the ones that are skipped. The rows
+        of that chunk are kept, scrolling within it again does not download it again,
+        nor does scrolling forward within the chunk being fetched.
+        """
+        if mode not in ("relative", "absolute"):
+            Error.errorhandler_wrapper(
+                self.connection,
+                self,
+                ProgrammingError,
+                {
+                    "msg": f"Invalid scroll mode: {mode}",
+                    "errno": ER_INVALID_VALUE,
+                },
+            )
+        if self._prefetch_hook is not None:
+            self._prefetch_hook()
+        if self._result_set is None:
+            Error.errorhandler_wrapper(
+                self.connection,
+                self,
+                ProgrammingError,
+                {
+                    "msg": "There are no results to scroll through.",
+                    "errno": ER_NO_DATA_FOUND,
+                },
+            )
+        position = value if mode == "absolute" else self._rownumber + 1 + value
+        if not 0 <= position <= self._result_set.total_row_index():
+            Error.errorhandler_wrapper(
+                self.connection,
+                self,
+                ProgrammingError,
+                {
+                    "msg": f"Scroll position {position} is out of the results.",
+                    "errno": ER_INVALID_VALUE,
+                },
+            )
+        current = 0 if self._rownumber is None else self._rownumber + 1
+        index, first_row = self._result_set._find_batch(position)
+        self._result_state = ResultState.VALID
+        if self._scrolled_batch is not None:
+            batch_row, rows, rest = self._scrolled_batch
+            # the rows after the kept batch have not been fetched yet
+            if batch_row == first_row and current <= batch_row + len(rows):
+                self._result = _rows_from(rows, position - first_row, rest)
+                self._rownumber = position - 1
+                return
+        if (
+            self._result is not None
+            and current <= position
+            and self._result_set._find_batch(current)[0] == index
+        ):
+            # skips the rows up to the target in the batch being fetched
+            collections.deque(
+                itertools.islice(self._result, position - current), maxlen=0
+            )
+            self._rownumber = position - 1
+            return
+        rest = self._result_set._create_iter(start_row=first_row)
+        rows = list(itertools.islice(rest, self._result_set.batches[index].rowcount))
+        self._scrolled_batch = first_row, rows, rest
+        self._result = _rows_from(rows, position - first_row, rest)
+        self._rownumber = position - 1
 
     def reset(self, closing: bool = False) -> None:
         """Resets the result set."""
@@ -1619,12 +1961,25 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         if self._result_state != ResultState.DEFAULT:
             self._result_state = ResultState.RESET
         if self._result is not None:
+            if isinstance(self._result, GeneratorType) and self._inner_cursor is None:
+                # stops downloading the results that are not going to be fetched
+                try:
+                    self._result.close()
+                except ValueError:
+                    # it is being iterated in another thread
+                    pass
             self._result = None
+        self._scrolled_batch = None
         if self._inner_cursor is not None:
             self._inner_cursor.reset(closing=closing)
             self._result = None
             self._inner_cursor = None
         self._prefetch_hook = None
+        if self._result_set is not None and (
+            closing or not self.connection._reuse_results
+        ):
+            # stops the downloads started on execute that are not going to be fetched
+            self._result_set.cancel_prefetch()
         if not self.connection._reuse_results:
             self._result_set = None
 
@@ -1768,6 +2123,49 @@ class SnowflakeCursorBase(abc.ABC, Generic[FetchRow]):
         )
         return self._result_set.batches
 
+    def partition_results(self, num_partitions: int) -> list[ResultPartition] | None:
+        """Splits the previously executed query's results into independent partitions.
+
+        The ``ResultBatch`` es are split into up to ``num_partitions`` partitions of
+        about the same estimated size, so that the results can be consumed by several
+        threads at once. The partitions download their batches through one shared
+        download executor and split the prefetching of the cursor between them. They
+        cover all results, so they cannot be created once rows were fetched from the
+        cursor, unless it was scrolled back to the first row.
+
+        If nothing has been executed yet None will be returned.
+        """
+        if num_partitions < 1:
+            Error.errorhandler_wrapper(
+                self.connection,
+                self,
+                ProgrammingError,
+                {
+                    "msg": f"The number of partitions is not positive: {num_partitions}",
+                    "errno": ER_NOT_POSITIVE_SIZE,
+                },
+            )
+        if self._result_set is None:
+            return None
+        if self._rownumber is not None and self._rownumber >= 0:
+            Error.errorhandler_wrapper(
+                self.connection,
+                self,
+                ProgrammingError,
+                {
+                    "msg": "Cannot partition the results, "
+                    f"{self._rownumber + 1} rows were already fetched",
+                    "errno": ER_RESULTS_ALREADY_FETCHED,
+                },
+            )
+        self._log_telemetry_job_data(
+            TelemetryField.PARTITION_RESULTS_USED, TelemetryData.TRUE
+        )
+        return [
+            ResultPartition(result_set)
+            for result_set in self._result_set._partition(num_partitions)
+        ]
+
     def _download(
         self,
         stage_location: str,
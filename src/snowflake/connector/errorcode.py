@@ -50,6 +50,7 @@ ER_NO_DATA_FOUND = 252009
 ER_CHUNK_DOWNLOAD_FAILED = 252010
 ER_NOT_IMPLICITY_SNOWFLAKE_DATATYPE = 252011
 ER_FAILED_PROCESSING_QMARK = 252012
+ER_RESULTS_ALREADY_FETCHED = 252013
 
 # file_transfer
 ER_INVALID_STAGE_FS = 253001
@@ -0,0 +1,107 @@
+"""Decoders used to load the JSON result chunks downloaded from blob storage.
+
+Snowflake sends JSON result chunks as comma separated rows, the ``JSONResultBatch``
+frames them into a JSON array and hands them to a ``JSONResultDecoder``. The decoder
+can be chosen by name with the ``json_result_decoder`` connection parameter, or a
+custom decoder instance can be passed instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from logging import getLogger
+from typing import Any, Callable
+
+from .errors import MissingDependencyError
+
+logger = getLogger(__name__)
+
+
+class JSONResultDecoder:
+    """Decodes JSON result chunks with the standard library ``json`` module.
+
+    Subclasses have to stay picklable, ``ResultBatch`` objects carry their decoder
+    with them when they are sent to other processes.
+    """
+
+    name = "json"
+
+    def loads(self, data: str) -> list[Any]:
+        """Decodes a JSON array of rows that was already decoded into a ``str``."""
+        return json.loads(data)
+
+    def loads_utf8(self, data: bytes | bytearray | memoryview) -> list[Any]:
+        """Decodes a JSON array of rows from its UTF-8 encoded bytes.
+
+        Invalid UTF-8 has to be reported with a ``ValueError``.
+        """
+        return json.loads(str(data, "utf-8", errors="strict"))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonJSONResultDecoder(JSONResultDecoder):
+    """Decodes JSON result chunks with ``orjson``.
+
+    ``orjson`` parses the downloaded bytes directly, it validates the UTF-8 encoding
+    itself, so no intermediate ``str`` is created.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            self._orjson = importlib.import_module("orjson")
+        except ImportError:
+            raise MissingDependencyError("orjson")
+
+    def loads(self, data: str) -> list[Any]:
+        return self._orjson.loads(data)
+
+    def loads_utf8(self, data: bytes | bytearray | memoryview) -> list[Any]:
+        return self._orjson.loads(data)
+
+    def __reduce__(self):
+        return type(self), ()
+
+
+_DECODERS: dict[str, Callable[[], JSONResultDecoder]] = {
+    JSONResultDecoder.name: JSONResultDecoder,
+    OrjsonJSONResultDecoder.name: OrjsonJSONResultDecoder,
+}
+
+
+def register_json_result_decoder(
+    name: str, factory: Callable[[], JSONResultDecoder]
+) -> None:
+    """Makes a decoder available to the ``json_result_decoder`` connection parameter."""
+    _DECODERS[name] = factory
+
+
+def get_json_result_decoder(decoder: str | JSONResultDecoder) -> JSONResultDecoder:
+    """Returns the decoder that a ``json_result_decoder`` value refers to.
+
+    ``"auto"`` picks the fastest installed decoder.
+
+    Raises:
+        ValueError: If no decoder is registered with the given name.
+        MissingDependencyError: If the decoder's package is not installed.
+    """
+    if isinstance(decoder, JSONResultDecoder):
+        return decoder
+    if decoder == "auto":
+        try:
+            return OrjsonJSONResultDecoder()
+        except MissingDependencyError:
+            logger.debug("orjson is not installed, decoding JSON results with json")
+            return JSONResultDecoder()
+    try:
+        factory = _DECODERS[decoder]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON result decoder: {decoder}, "
+            f"expected one of {', '.join(['auto', *_DECODERS])}"
+        )
+    return factory()
@@ -1,5 +1,8 @@
 #include "CArrowChunkIterator.hpp"
 
+#include <climits>
+#include <cmath>
+#include <cstring>
 #include <memory>
 #include <string>
 #include <vector>
@@ -19,6 +22,7 @@
 #include "StringConverter.hpp"
 #include "TimeConverter.hpp"
 #include "TimeStampConverter.hpp"
+#include "Util/time.hpp"
 
 namespace sf {
 
@@ -554,4 +558,353 @@ void DictCArrowChunkIterator::createRowPyObject() {
   return;
 }
 
+namespace {
+
+constexpr int64_t NANOSECONDS_PER_SECOND = 1000000000;
+
+/** powers of ten that are exactly representable as double */
+constexpr double EXACT_POWERS_OF_TEN[]{
+    1e0,  1e1,  1e2,  1e3,  1e4,  1e5,  1e6,  1e7,  1e8,  1e9,  1e10, 1e11,
+    1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22};
+
+/** integers up to 2^53 are exactly representable as double */
+constexpr int64_t MAX_EXACT_DOUBLE_INTEGER = 9007199254740992LL;
+
+int getMetadataInt(const char* metadata, const char* key, int defaultValue) {
+  struct ArrowStringView value = ArrowCharView(nullptr);
+  if (metadata == nullptr ||
+      ArrowMetadataGetValue(metadata, ArrowCharView(key), &value) !=
+          NANOARROW_OK ||
+      value.data == nullptr) {
+    return defaultValue;
+  }
+  return std::stoi(std::string(value.data, value.size_bytes));
+}
+
+ArrowArrayView* getChild(ArrowSchema* schema, ArrowArrayView* array,
+                         const std::string& name) {
+  for (int64_t i = 0; i < schema->n_children; i++) {
+    if (name == schema->children[i]->name) {
+      return array->children[i];
+    }
+  }
+  return nullptr;
+}
+
+/**
+ * Same as the conversion of the table iterator, dividing is exact as long as
+ * both the value and the power of ten are exactly representable.
+ */
+double scaledToDouble(int64_t value, int scale) {
+  if (scale < 23 && value <= MAX_EXACT_DOUBLE_INTEGER &&
+      value >= -MAX_EXACT_DOUBLE_INTEGER) {
+    return static_cast<double>(value) / EXACT_POWERS_OF_TEN[scale];
+  }
+  std::string valStr = std::to_string(value);
+  int negative = valStr.at(0) == '-' ? 1 : 0;
+  unsigned int digits = valStr.length() - negative;
+  if (digits <= static_cast<unsigned int>(scale)) {
+    valStr.insert(negative, std::string(scale - digits + 1, '0'));
+  }
+  valStr.insert(valStr.length() - scale, ".");
+  return std::stod(valStr);
+}
+
+/**
+ * Nanoseconds since the epoch of a timestamp stored in units of 10^-scale
+ * seconds, false if they do not fit into numpy.datetime64[ns].
+ */
+bool scaledToNanoseconds(int64_t value, int scale, int64_t& nanoseconds) {
+  int64_t factor = sf::internal::powTenSB4[9 - scale];
+  if (value >= LLONG_MAX / factor || value <= LLONG_MIN / factor) {
+    return false;
+  }
+  nanoseconds = value * factor;
+  return true;
+}
+
+/**
+ * Nanoseconds since the epoch of a timestamp stored as seconds and
+ * nanoseconds, false if they do not fit into numpy.datetime64[ns].
+ */
+bool fieldsToNanoseconds(int64_t seconds, int64_t fraction,
+                         int64_t& nanoseconds) {
+  if (seconds >= LLONG_MAX / NANOSECONDS_PER_SECOND ||
+      seconds <= LLONG_MIN / NANOSECONDS_PER_SECOND) {
+    return false;
+  }
+  nanoseconds = seconds * NANOSECONDS_PER_SECOND + fraction;
+  return true;
+}
+
+/**
+ * @return a bytearray with the value of every row converted to T, NULL rows
+ * get nullValue. nullptr if convert returned false for a row, or with the
+ * python error set if the bytearray could not be allocated.
+ */
+template <typename T, typename Convert>
+PyObject* createValues(ArrowArrayView* array, T nullValue, Convert convert) {
+  sf::py::UniqueRef values(PyByteArray_FromStringAndSize(
+      nullptr, static_cast<Py_ssize_t>(array->length * sizeof(T))));
+  if (values.empty()) {
+    return nullptr;
+  }
+  T* data = reinterpret_cast<T*>(PyByteArray_AS_STRING(values.get()));
+  for (int64_t i = 0; i < array->length; i++) {
+    if (ArrowArrayViewIsNull(array, i)) {
+      data[i] = nullValue;
+    } else if (!convert(i, data[i])) {
+      return nullptr;
+    }
+  }
+  return values.release();
+}
+
+/**
+ * @return a bytearray with one byte per row, 1 for NULL, or None if the
+ * column has no NULL
+ */
+PyObject* createMask(ArrowArrayView* array) {
+  if (array->buffer_views[0].data.data == nullptr || array->null_count == 0) {
+    Py_RETURN_NONE;
+  }
+  sf::py::UniqueRef mask(PyByteArray_FromStringAndSize(
+      nullptr, static_cast<Py_ssize_t>(array->length)));
+  if (mask.empty()) {
+    return nullptr;
+  }
+  char* data = PyByteArray_AS_STRING(mask.get());
+  bool hasNull = false;
+  for (int64_t i = 0; i < array->length; i++) {
+    data[i] = ArrowArrayViewIsNull(array, i);
+    hasNull |= data[i] != 0;
+  }
+  if (!hasNull) {
+    Py_RETURN_NONE;
+  }
+  return mask.release();
+}
+
+}  // namespace
+
+CArrowColumnIterator::CArrowColumnIterator(PyObject* context, char* arrow_bytes,
+                                           int64_t arrow_bytes_size,
+                                           bool number_to_decimal)
+    : CArrowChunkIterator(context, arrow_bytes, arrow_bytes_size, Py_False,
+                          Py_True),
+      m_convertNumberToDecimal(number_to_decimal) {}
+
+ReturnVal CArrowColumnIterator::next() {
+  // errors of the initialization are reported by the first call
+  SF_CHECK_PYTHON_ERR()
+  m_currentBatchIndex++;
+  if (m_currentBatchIndex >= m_batchCount) {
+    return ReturnVal(Py_None, nullptr);
+  }
+  logger->debug(__FILE__, __func__, __LINE__,
+                "Current batch index: %d, rows in current batch: %d",
+                m_currentBatchIndex,
+                m_ipcArrowArrayVec[m_currentBatchIndex]->length);
+
+  m_latestReturnedRow.reset(PyList_New(m_columnCount));
+  for (int i = 0; i < m_columnCount; i++) {
+    PyObject* column = createColumnPyObject(
+        m_ipcArrowSchema->children[i],
+        m_ipcArrowArrayViewVec[m_currentBatchIndex]->children[i]);
+    SF_CHECK_PYTHON_ERR()
+    // PyList_SET_ITEM steals the reference
+    PyList_SET_ITEM(m_latestReturnedRow.get(), i, column);
+  }
+  return ReturnVal(m_latestReturnedRow.get(), nullptr);
+}
+
+PyObject* CArrowColumnIterator::createColumnPyObject(ArrowSchema* schema,
+                                                     ArrowArrayView* array) {
+  struct ArrowStringView logicalType = ArrowCharView(nullptr);
+  ArrowMetadataGetValue(schema->metadata, ArrowCharView("logicalType"),
+                        &logicalType);
+  if (logicalType.data == nullptr) {
+    return createObjectColumnPyObject(schema, array);
+  }
+  SnowflakeType::Type st = SnowflakeType::snowflakeTypeFromString(
+      std::string(logicalType.data, logicalType.size_bytes));
+  const char* metadata = schema->metadata;
+  ArrowType storageType = array->storage_type;
+  bool isInteger = storageType == NANOARROW_TYPE_INT8 ||
+                   storageType == NANOARROW_TYPE_INT16 ||
+                   storageType == NANOARROW_TYPE_INT32 ||
+                   storageType == NANOARROW_TYPE_INT64;
+
+  const char* dtype = nullptr;
+  py::UniqueRef values;
+  switch (st) {
+    case SnowflakeType::Type::FIXED: {
+      int scale = getMetadataInt(metadata, "scale", 0);
+      if (scale > 0 && m_convertNumberToDecimal) {
+        break;
+      }
+      if (scale == 0 && getMetadataInt(metadata, "precision", 0) > 18) {
+        // the back-end stores a chunk of these as int64 or as decimals
+        // depending on its values, so every chunk is returned as objects
+        break;
+      }
+      if (storageType == NANOARROW_TYPE_DECIMAL128) {
+        if (scale == 0) {
+          // integers that may not fit into int64
+          break;
+        }
+        // rare, the back-end only sends decimals that do not fit into int64
+        std::shared_ptr<sf::IColumnConverter> converter =
+            getConverterFromSchema(schema, array, m_context, false, logger);
+        if (converter == nullptr || py::checkPyError()) {
+          return nullptr;
+        }
+        dtype = "float64";
+        values.reset(createValues<double>(
+            array, NAN, [&converter](int64_t i, double& value) {
+              py::UniqueRef decimal(converter->toPyObject(i));
+              value = decimal.empty() ? -1.0 : PyFloat_AsDouble(decimal.get());
+              return !(value == -1.0 && PyErr_Occurred());
+            }));
+        break;
+      }
+      if (!isInteger) {
+        break;
+      }
+      if (scale == 0) {
+        dtype = "int64";
+        values.reset(
+            createValues<int64_t>(array, 0, [array](int64_t i, int64_t& value) {
+              value = ArrowArrayViewGetIntUnsafe(array, i);
+              return true;
+            }));
+      } else {
+        dtype = "float64";
+        values.reset(createValues<double>(
+            array, NAN, [array, scale](int64_t i, double& value) {
+              value =
+                  scaledToDouble(ArrowArrayViewGetIntUnsafe(array, i), scale);
+              return true;
+            }));
+      }
+      break;
+    }
+
+    case SnowflakeType::Type::REAL: {
+      dtype = "float64";
+      values.reset(
+          createValues<double>(array, NAN, [array](int64_t i, double& value) {
+            value = ArrowArrayViewGetDoubleUnsafe(array, i);
+            return true;
+          }));
+      break;
+    }
+
+    case SnowflakeType::Type::BOOLEAN: {
+      dtype = "bool";
+      values.reset(
+          createValues<uint8_t>(array, 0, [array](int64_t i, uint8_t& value) {
+            value = ArrowArrayViewGetIntUnsafe(array, i) != 0;
+            return true;
+          }));
+      break;
+    }
+
+    case SnowflakeType::Type::DATE: {
+      dtype = "datetime64[D]";
+      values.reset(createValues<int64_t>(
+          array, LLONG_MIN, [array](int64_t i, int64_t& value) {
+            value = ArrowArrayViewGetIntUnsafe(array, i);
+            return true;
+          }));
+      break;
+    }
+
+    case SnowflakeType::Type::TIMESTAMP_NTZ:
+    case SnowflakeType::Type::TIMESTAMP_LTZ:
+    case SnowflakeType::Type::TIMESTAMP_TZ: {
+      int scale = getMetadataInt(metadata, "scale", 9);
+      ArrowArrayView* epoch =
+          getChild(schema, array, internal::FIELD_NAME_EPOCH);
+      ArrowArrayView* fraction =
+          getChild(schema, array, internal::FIELD_NAME_FRACTION);
+      if (scale < 0 || scale > 9) {
+        break;
+      }
+      dtype = "datetime64[ns]";
+      if (storageType == NANOARROW_TYPE_INT64) {
+        values.reset(createValues<int64_t>(
+            array, LLONG_MIN, [array, scale](int64_t i, int64_t& value) {
+              return scaledToNanoseconds(ArrowArrayViewGetIntUnsafe(array, i),
+                                         scale, value);
+            }));
+      } else if (epoch != nullptr && fraction != nullptr) {
+        values.reset(createValues<int64_t>(
+            array, LLONG_MIN, [epoch, fraction](int64_t i, int64_t& value) {
+              return fieldsToNanoseconds(
+                  ArrowArrayViewGetIntUnsafe(epoch, i),
+                  ArrowArrayViewGetIntUnsafe(fraction, i), value);
+            }));
+      } else if (epoch != nullptr) {
+        // TIMESTAMP_TZ with an epoch in units of the scale and a time zone
+        values.reset(createValues<int64_t>(
+            array, LLONG_MIN, [epoch, scale](int64_t i, int64_t& value) {
+              return scaledToNanoseconds(ArrowArrayViewGetIntUnsafe(epoch, i),
+                                         scale, value);
+            }));
+      } else {
+        dtype = nullptr;
+      }
+      if (dtype != nullptr && values.empty() && !py::checkPyError()) {
+        PyErr_Format(
+            PyExc_OverflowError,
+            "%s value of column %s is out of the range of "
+            "numpy.datetime64[ns]",
+            std::string(logicalType.data, logicalType.size_bytes).c_str(),
+            schema->name);
+      }
+      break;
+    }
+
+    default: {
+      break;
+    }
+  }
+
+  if (dtype == nullptr) {
+    return createObjectColumnPyObject(schema, array);
+  }
+  if (values.empty()) {
+    return nullptr;
+  }
+  py::UniqueRef mask(createMask(array));
+  if (mask.empty()) {
+    return nullptr;
+  }
+  return Py_BuildValue("(sOO)", dtype, values.get(), mask.get());
+}
+
+PyObject* CArrowColumnIterator::createObjectColumnPyObject(
+    ArrowSchema* schema, ArrowArrayView* array) {
+  std::shared_ptr<sf::IColumnConverter> converter =
+      getConverterFromSchema(schema, array, m_context, false, logger);
+  if (converter == nullptr || py::checkPyError()) {
+    return nullptr;
+  }
+  py::UniqueRef objects(PyList_New(array->length));
+  if (objects.empty()) {
+    return nullptr;
+  }
+  for (int64_t i = 0; i < array->length; i++) {
+    PyObject* value = converter->toPyObject(i);
+    if (value == nullptr || py::checkPyError()) {
+      Py_XDECREF(value);
+      return nullptr;
+    }
+    // PyList_SET_ITEM steals the reference
+    PyList_SET_ITEM(objects.get(), i, value);
+  }
+  return Py_BuildValue("(OOO)", Py_None, objects.get(), Py_None);
+}
+
 }  // namespace sf
@@ -56,7 +56,6 @@ class CArrowChunkIterator : public CArrowIterator {
   /** row index inside current record batch (start from 0) */
   int m_rowIndexInBatch;
 
- private:
   /** number of columns */
   int m_columnCount;
 
@@ -79,6 +78,7 @@ class CArrowChunkIterator : public CArrowIterator {
    * in order to fail early on first python processing error */
   bool m_checkErrorOnEveryColumn;
 
+ private:
   void initColumnConverters();
 };
 
@@ -93,6 +93,46 @@ class DictCArrowChunkIterator : public CArrowChunkIterator {
   void createRowPyObject() override;
 };
 
+/**
+ * Arrow chunk iterator that returns a whole record batch at a time, column by
+ * column, for the python side to wrap into numpy arrays without copying.
+ *
+ * For every column a tuple (dtype, values, mask) is returned. values is a
+ * bytearray with the fixed width values of the numpy dtype, and mask a
+ * bytearray with one byte per row, 1 for NULL, or None if the column has no
+ * NULL. Columns without a fixed width numpy representation are returned as
+ * (None, list, None), the list holding the python objects row iteration
+ * returns.
+ */
+class CArrowColumnIterator : public CArrowChunkIterator {
+ public:
+  CArrowColumnIterator(PyObject* context, char* arrow_bytes,
+                       int64_t arrow_bytes_size, bool number_to_decimal);
+
+  ~CArrowColumnIterator() = default;
+
+  /**
+   * @return a python list with a tuple per column of the next record batch
+   */
+  ReturnVal next() override;
+
+ private:
+  /** convert scaled fixed numbers to Decimal objects instead of float64 */
+  const bool m_convertNumberToDecimal;
+
+  /**
+   * @return the (dtype, values, mask) tuple of a column, or nullptr with
+   * the python error set
+   */
+  PyObject* createColumnPyObject(ArrowSchema* schema, ArrowArrayView* array);
+
+  /**
+   * @return a (None, list, None) tuple with the values row iteration returns
+   */
+  PyObject* createObjectColumnPyObject(ArrowSchema* schema,
+                                       ArrowArrayView* array);
+};
+
 }  // namespace sf
 
 #endif  // PC_ARROWCHUNKITERATOR_HPP
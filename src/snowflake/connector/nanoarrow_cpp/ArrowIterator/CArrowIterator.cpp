@@ -51,15 +51,29 @@ const char* const NANOARROW_TYPE_ENUM_STRING[] = {
 Logger* CArrowIterator::logger =
     new Logger("snowflake.connector.CArrowIterator");
 
+/**
+ * The arrow bytes are owned by the Python caller, so the input buffer borrows
+ * them and must not free them.
+ */
+static void borrowedBufferFree(ArrowBufferAllocator* allocator, uint8_t* ptr,
+                               int64_t size) {}
+
 CArrowIterator::CArrowIterator(char* arrow_bytes, int64_t arrow_bytes_size) {
   int returnCode = 0;
+  // The IPC stream reader copies every message body it reads, so the input can
+  // be read in place instead of from a copy. It is released at the end of the
+  // constructor, while the caller still holds the arrow bytes.
   ArrowBuffer input_buffer;
   ArrowBufferInit(&input_buffer);
-  returnCode = ArrowBufferAppend(&input_buffer, arrow_bytes, arrow_bytes_size);
+  returnCode = ArrowBufferSetAllocator(
+      &input_buffer, ArrowBufferDeallocator(&borrowedBufferFree, nullptr));
   SF_CHECK_ARROW_RC(
       returnCode,
       "[Snowflake Exception] error loading arrow bytes, error code: %d",
       returnCode);
+  input_buffer.data = reinterpret_cast<uint8_t*>(arrow_bytes);
+  input_buffer.size_bytes = arrow_bytes_size;
+  input_buffer.capacity_bytes = arrow_bytes_size;
   ArrowIpcInputStream input;
   returnCode = ArrowIpcInputStreamInitBuffer(&input, &input_buffer);
   SF_CHECK_ARROW_RC(returnCode,
@@ -15,7 +15,7 @@
     std::string errorInfo =                                         \
         Logger::formatString(format_string, ##__VA_ARGS__);         \
     logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str()); \
-    PyErr_SetString(PyExc_Exception, errorInfo.c_str());            \
+    py::setPyError(PyExc_Exception, errorInfo.c_str());             \
     return;                                                         \
   }
 
@@ -25,7 +25,7 @@
     std::string errorInfo =                                                \
         Logger::formatString(format_string, ##__VA_ARGS__);                \
     logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());        \
-    PyErr_SetString(PyExc_Exception, errorInfo.c_str());                   \
+    py::setPyError(PyExc_Exception, errorInfo.c_str());                    \
     return ret_val;                                                        \
   }
 
@@ -38,7 +38,7 @@
     std::string fullErrorInfo =                                          \
         Logger::formatString(errorInfo.c_str(), ##__VA_ARGS__);          \
     logger->error(__FILE__, __func__, __LINE__, fullErrorInfo.c_str());  \
-    PyErr_SetString(PyExc_Exception, fullErrorInfo.c_str());             \
+    py::setPyError(PyExc_Exception, fullErrorInfo.c_str());              \
     stream.release(&stream);                                             \
     return;                                                              \
   }
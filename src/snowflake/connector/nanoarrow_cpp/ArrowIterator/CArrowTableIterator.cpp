@@ -57,6 +57,32 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
                       scale, columnSchemaView.type);
         convertScaledFixedNumberColumn_nanoarrow(&columnSchemaView, columnArray,
                                                  scale);
+      } else if (m_widen_fixed_numbers) {
+        int precision = 38;
+        struct ArrowStringView precisionString = ArrowCharView(nullptr);
+        if (metadata != nullptr &&
+            ArrowMetadataGetValue(metadata, ArrowCharView("precision"),
+                                  &precisionString) == NANOARROW_OK &&
+            precisionString.data != nullptr) {
+          precision = std::stoi(
+              std::string(precisionString.data, precisionString.size_bytes));
+        }
+        if (columnSchemaView.type == ArrowType::NANOARROW_TYPE_DECIMAL128) {
+          // the data of decimals does not depend on their precision
+          returnCode = ArrowSchemaSetTypeDecimal(
+              columnSchema, NANOARROW_TYPE_DECIMAL128, 38, scale);
+          SF_CHECK_ARROW_RC(returnCode,
+                            "[Snowflake Exception] error setting arrow schema "
+                            "type decimal, error code: %d",
+                            returnCode);
+        } else if (precision > 18) {
+          // chunks with big values of this column are stored as decimals
+          convertScaledFixedNumberColumnToDecimalColumn_nanoarrow(
+              &columnSchemaView, columnArray, 0);
+        } else if (columnSchemaView.type != ArrowType::NANOARROW_TYPE_INT64) {
+          convertFixedNumberColumnToInt64Column_nanoarrow(&columnSchemaView,
+                                                          columnArray);
+        }
       }
       break;
     }
@@ -89,7 +115,7 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
                 "schema child, but got %d",
                 columnSchemaView.schema->n_children);
             logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-            PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+            py::setPyError(PyExc_Exception, errorInfo.c_str());
             break;
           }
 
@@ -105,7 +131,7 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
               NANOARROW_TYPE_ENUM_STRING[columnSchemaView.type],
               columnSchemaView.schema->name);
           logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-          PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+          py::setPyError(PyExc_Exception, errorInfo.c_str());
           break;
         }
       }
@@ -119,7 +145,7 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
             "schema child, but got %d",
             columnSchemaView.schema->n_children);
         logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-        PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+        py::setPyError(PyExc_Exception, errorInfo.c_str());
         break;
       }
 
@@ -131,7 +157,7 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
             "expected 2 entries, but got %d",
             entries->n_children);
         logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-        PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+        py::setPyError(PyExc_Exception, errorInfo.c_str());
         break;
       }
 
@@ -168,7 +194,7 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
               NANOARROW_TYPE_ENUM_STRING[columnSchemaView.type],
               columnSchemaView.schema->name);
           logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-          PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+          py::setPyError(PyExc_Exception, errorInfo.c_str());
           break;
         }
       }
@@ -285,7 +311,7 @@ void CArrowTableIterator::convertIfNeeded(ArrowSchema* columnSchema,
           "[Snowflake Exception] unknown snowflake data type : %s",
           snowflakeLogicalType.data);
       logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-      PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+      py::setPyError(PyExc_Exception, errorInfo.c_str());
       return;
     }
   }
@@ -335,10 +361,12 @@ void CArrowTableIterator::reconstructRecordBatches_nanoarrow() {
 
 CArrowTableIterator::CArrowTableIterator(PyObject* context, char* arrow_bytes,
                                          int64_t arrow_bytes_size,
-                                         const bool number_to_decimal)
+                                         const bool number_to_decimal,
+                                         const bool widen_fixed_numbers)
     : CArrowIterator(arrow_bytes, arrow_bytes_size),
       m_context(context),
-      m_convert_number_to_decimal(number_to_decimal) {
+      m_convert_number_to_decimal(number_to_decimal),
+      m_widen_fixed_numbers(widen_fixed_numbers) {
   if (py::checkPyError()) {
     return;
   }
@@ -460,6 +488,69 @@ void CArrowTableIterator::
   ArrowArrayMove(newArray, columnArray->array);
 }
 
+void CArrowTableIterator::convertFixedNumberColumnToInt64Column_nanoarrow(
+    ArrowSchemaView* field, ArrowArrayView* columnArray) {
+  int returnCode = 0;
+  nanoarrow::UniqueSchema newUniqueField;
+  nanoarrow::UniqueArray newUniqueArray;
+  ArrowSchema* newSchema = newUniqueField.get();
+  ArrowArray* newArray = newUniqueArray.get();
+
+  // create new schema
+  ArrowSchemaInit(newSchema);
+  newSchema->flags &=
+      (field->schema->flags & ARROW_FLAG_NULLABLE);  // map to nullable()
+  returnCode = ArrowSchemaSetType(newSchema, NANOARROW_TYPE_INT64);
+  SF_CHECK_ARROW_RC(returnCode,
+                    "[Snowflake Exception] error setting arrow schema type "
+                    "int64, error code: %d",
+                    returnCode);
+  returnCode = ArrowSchemaSetName(newSchema, field->schema->name);
+  SF_CHECK_ARROW_RC(
+      returnCode,
+      "[Snowflake Exception] error setting schema name, error code: %d",
+      returnCode);
+
+  ArrowError error;
+  returnCode = ArrowArrayInitFromSchema(newArray, newSchema, &error);
+  SF_CHECK_ARROW_RC(returnCode,
+                    "[Snowflake Exception] error initializing ArrowArrayView "
+                    "from schema : %s, error code: %d",
+                    ArrowErrorMessage(&error), returnCode);
+
+  returnCode = ArrowArrayStartAppending(newArray);
+  SF_CHECK_ARROW_RC(
+      returnCode,
+      "[Snowflake Exception] error appending arrow array, error code: %d",
+      returnCode);
+
+  for (int64_t rowIdx = 0; rowIdx < columnArray->array->length; rowIdx++) {
+    if (ArrowArrayViewIsNull(columnArray, rowIdx)) {
+      returnCode = ArrowArrayAppendNull(newArray, 1);
+      SF_CHECK_ARROW_RC(returnCode,
+                        "[Snowflake Exception] error appending null to arrow "
+                        "array, error code: %d",
+                        returnCode);
+    } else {
+      returnCode = ArrowArrayAppendInt(
+          newArray, ArrowArrayViewGetIntUnsafe(columnArray, rowIdx));
+      SF_CHECK_ARROW_RC(returnCode,
+                        "[Snowflake Exception] error appending int to arrow "
+                        "array, error code: %d",
+                        returnCode);
+    }
+  }
+  returnCode = ArrowArrayFinishBuildingDefault(newArray, &error);
+  SF_CHECK_ARROW_RC(returnCode,
+                    "[Snowflake Exception] error finishing building arrow "
+                    "array: %s, error code: %d",
+                    ArrowErrorMessage(&error), returnCode);
+  field->schema->release(field->schema);
+  ArrowSchemaMove(newSchema, field->schema);
+  columnArray->array->release(columnArray->array);
+  ArrowArrayMove(newArray, columnArray->array);
+}
+
 void CArrowTableIterator::
     convertScaledFixedNumberColumnToDoubleColumn_nanoarrow(
         ArrowSchemaView* field, ArrowArrayView* columnArray,
@@ -1083,7 +1174,7 @@ void CArrowTableIterator::convertTimestampTZColumn_nanoarrow(
             "for TIMESTAMP_TZ data",
             NANOARROW_TYPE_ENUM_STRING[field->type]);
         logger->error(__FILE__, __func__, __LINE__, errorInfo.c_str());
-        PyErr_SetString(PyExc_Exception, errorInfo.c_str());
+        py::setPyError(PyExc_Exception, errorInfo.c_str());
         return;
       }
     } else {
@@ -1109,6 +1200,10 @@ void CArrowTableIterator::convertTimestampTZColumn_nanoarrow(
 bool CArrowTableIterator::convertRecordBatchesToTable_nanoarrow() {
   // only do conversion once and there exist some record batches
   if (!m_tableConverted && m_ipcArrowArrayViewVec.size() > 0) {
+    // The conversion only touches arrow buffers, so other python threads, e.g.
+    // the ones converting other result chunks, can run in the meantime.
+    // Logging and error reporting acquire the GIL again when needed.
+    py::PyUniqueUnlock unlock;
     reconstructRecordBatches_nanoarrow();
     return true;
   }
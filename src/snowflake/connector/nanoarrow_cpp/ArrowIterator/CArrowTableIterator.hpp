@@ -23,7 +23,8 @@ class CArrowTableIterator : public CArrowIterator {
    * Constructor
    */
   CArrowTableIterator(PyObject* context, char* arrow_bytes,
-                      int64_t arrow_bytes_size, bool number_to_decimal);
+                      int64_t arrow_bytes_size, bool number_to_decimal,
+                      bool widen_fixed_numbers = false);
 
   /**
    * Destructor
@@ -50,6 +51,13 @@ class CArrowTableIterator : public CArrowIterator {
   char* m_timezone;
   const bool m_convert_number_to_decimal;
 
+  /**
+   * convert the fixed number columns of every chunk to the same types: int64,
+   * or decimal128 with a precision of 38 for more than 18 digits, whatever
+   * integer width or precision the chunk is stored in
+   */
+  const bool m_widen_fixed_numbers;
+
   /**
    * Reconstruct record batches with type conversion in place
    */
@@ -78,6 +86,12 @@ class CArrowTableIterator : public CArrowIterator {
       ArrowSchemaView* field, ArrowArrayView* columnArray,
       const unsigned int scale);
 
+  /**
+   * convert fixed number column of a narrower integer type to int64 column
+   */
+  void convertFixedNumberColumnToInt64Column_nanoarrow(
+      ArrowSchemaView* field, ArrowArrayView* columnArray);
+
   /**
    * convert scaled fixed number column to Double column
    */
@@ -89,6 +89,38 @@ class PyUniqueLock {
   PyGILState_STATE m_state;
 };
 
+/**
+ * A RAII class to release the python GIL while pure native code runs, so
+ * other python threads can run at the same time. The semantics are like
+ * std::unique_lock, but inverted.
+ * Only a thread holding the GIL may create it, and no Python/C API may be
+ * called while it is alive unless the GIL is acquired again with a
+ * PyUniqueLock.
+ */
+class PyUniqueUnlock {
+ public:
+  PyUniqueUnlock(const PyUniqueUnlock&) = delete;
+  PyUniqueUnlock& operator=(const PyUniqueUnlock&) = delete;
+  PyUniqueUnlock(PyUniqueUnlock&&) = delete;
+  PyUniqueUnlock& operator=(PyUniqueUnlock&&) = delete;
+
+  PyUniqueUnlock() { m_state = PyEval_SaveThread(); }
+
+  ~PyUniqueUnlock() { PyEval_RestoreThread(m_state); }
+
+ private:
+  PyThreadState* m_state;
+};
+
+/**
+ * Set the python error indicator, acquiring the GIL first if the calling
+ * thread released it.
+ */
+inline void setPyError(PyObject* type, const char* message) {
+  PyUniqueLock lock;
+  PyErr_SetString(type, message);
+}
+
 }  // namespace py
 }  // namespace sf
 
@@ -1,5 +1,8 @@
 #include "TimeStampConverter.hpp"
 
+#include <datetime.h>
+
+#include <climits>
 #include <cstdint>
 #include <cstring>
 #include <memory>
@@ -54,8 +57,221 @@ Logger* TwoFieldTimeStampTZConverter::logger =
 Logger* ThreeFieldTimeStampTZConverter::logger =
     new Logger("snowflake.connector.ThreeFieldTimeStampTZConverter");
 
+namespace {
+
+constexpr int64_t NANOSECONDS_PER_SECOND = 1000000000;
+
+/** numpy.datetime64 with nanosecond precision, or nullptr if it could not be
+ * created without going through python */
+PyObject* createDatetime64(int64_t nanoseconds) {
+  static py::UniqueRef pyDatetime64;
+  static py::UniqueRef pyUnit;
+  if (pyDatetime64.empty()) {
+    py::UniqueRef pyNumpyModule(PyImport_ImportModule("numpy"));
+    if (pyNumpyModule.empty()) {
+      PyErr_Clear();
+      return nullptr;
+    }
+    pyDatetime64.reset(
+        PyObject_GetAttrString(pyNumpyModule.get(), "datetime64"));
+    pyUnit.reset(PyUnicode_FromString("ns"));
+    if (pyDatetime64.empty() || pyUnit.empty()) {
+      PyErr_Clear();
+      pyDatetime64.reset();
+      return nullptr;
+    }
+  }
+  py::UniqueRef pyNanoseconds(PyLong_FromLongLong(nanoseconds));
+  if (pyNanoseconds.empty()) {
+    return nullptr;
+  }
+  return PyObject_CallFunctionObjArgs(pyDatetime64.get(), pyNanoseconds.get(),
+                                      pyUnit.get(), nullptr);
+}
+
+}  // namespace
+
 TimeStampBaseConverter::TimeStampBaseConverter(PyObject* context, int32_t scale)
-    : m_context(context), m_scale(scale) {}
+    : m_context(context), m_scale(scale) {
+  if (PyDateTimeAPI == nullptr) {
+    PyDateTime_IMPORT;
+  }
+}
+
+PyObject* TimeStampBaseConverter::createDateTime(int64_t microseconds,
+                                                 PyObject* tzinfo) {
+  internal::DateTimeFields fields;
+  if (!internal::epochMicrosecondsToFields(microseconds, fields)) {
+    return nullptr;
+  }
+  return PyDateTimeAPI->DateTime_FromDateAndTime(
+      fields.year, fields.month, fields.day, fields.hour, fields.minute,
+      fields.second, fields.microsecond, tzinfo, PyDateTimeAPI->DateTimeType);
+}
+
+PyObject* TimeStampBaseConverter::toNaiveDateTime(int64_t seconds,
+                                                  int64_t microseconds) const {
+  int64_t epochMicroseconds;
+  int64_t intermediate;
+  if (internal::toEpochMicroseconds(seconds, microseconds, epochMicroseconds) &&
+      internal::toEpochMicroseconds(seconds, 0, intermediate)) {
+    PyObject* result = createDateTime(epochMicroseconds, Py_None);
+    if (result != nullptr || PyErr_Occurred()) {
+      return result;
+    }
+  }
+  // out of the range of datetime, python raises the error
+  static constexpr FormatArgs2<decltype(seconds), decltype(microseconds)>
+      format;
+#ifdef _WIN32
+  return PyObject_CallMethod(m_context, "TIMESTAMP_NTZ_to_python_windows",
+                             format.format, seconds, microseconds);
+#else
+  return PyObject_CallMethod(m_context, "TIMESTAMP_NTZ_to_python",
+                             format.format, seconds, microseconds);
+#endif
+}
+
+TimeStampLTZBaseConverter::TimeStampLTZBaseConverter(PyObject* context,
+                                                     int32_t scale)
+    : TimeStampBaseConverter(context, scale),
+      m_tzinfo(
+          PyObject_CallMethod(context, "TIMESTAMP_LTZ_to_tzinfo", nullptr)) {
+  if (m_tzinfo.empty()) {
+    // every value goes through ArrowConverterContext, which reports the error
+    PyErr_Clear();
+    return;
+  }
+  py::UniqueRef offset(
+      PyObject_CallMethod(m_tzinfo.get(), "utcoffset", "O", Py_None));
+  if (offset.empty()) {
+    PyErr_Clear();
+    return;
+  }
+  if (PyDelta_Check(offset.get())) {
+    m_fixedOffset = true;
+    m_offsetMicroseconds =
+        (static_cast<int64_t>(PyDateTime_DELTA_GET_DAYS(offset.get())) *
+             internal::HOURS_PER_DAY * internal::SECONDS_PER_HOUR +
+         PyDateTime_DELTA_GET_SECONDS(offset.get())) *
+            internal::MICROSECONDS_PER_SECOND +
+        PyDateTime_DELTA_GET_MICROSECONDS(offset.get());
+  }
+}
+
+PyObject* TimeStampLTZBaseConverter::toLocalDateTime(
+    int64_t seconds, int64_t microseconds) const {
+  int64_t epochMicroseconds;
+  int64_t utcMicroseconds;
+  if (!m_tzinfo.empty() &&
+      internal::toEpochMicroseconds(seconds, microseconds, epochMicroseconds) &&
+      internal::toEpochMicroseconds(seconds, 0, utcMicroseconds)) {
+#ifdef _WIN32
+    // the windows conversion localizes the whole timestamp
+    utcMicroseconds = epochMicroseconds;
+#endif
+    int64_t localMicroseconds;
+    if (m_fixedOffset) {
+      if (internal::toEpochMicroseconds(
+              0, utcMicroseconds + m_offsetMicroseconds, localMicroseconds)) {
+        PyObject* result = createDateTime(
+            epochMicroseconds + m_offsetMicroseconds, m_tzinfo.get());
+        if (result != nullptr || PyErr_Occurred()) {
+          return result;
+        }
+      }
+    } else {
+      // the utc offset depends on the time, the tzinfo resolves it
+      py::UniqueRef utc(createDateTime(utcMicroseconds, m_tzinfo.get()));
+      py::UniqueRef local;
+      if (!utc.empty()) {
+        local.reset(
+            PyObject_CallMethod(m_tzinfo.get(), "fromutc", "O", utc.get()));
+      }
+      if (!local.empty()) {
+        if (epochMicroseconds == utcMicroseconds) {
+          return local.release();
+        }
+        // the rest is added to the local time, like a timedelta is
+        internal::DateTimeFields fields{
+            PyDateTime_GET_YEAR(local.get()),
+            PyDateTime_GET_MONTH(local.get()),
+            PyDateTime_GET_DAY(local.get()),
+            PyDateTime_DATE_GET_HOUR(local.get()),
+            PyDateTime_DATE_GET_MINUTE(local.get()),
+            PyDateTime_DATE_GET_SECOND(local.get()),
+            PyDateTime_DATE_GET_MICROSECOND(local.get())};
+        py::UniqueRef localTzinfo(
+            PyObject_GetAttrString(local.get(), "tzinfo"));
+        if (localTzinfo.empty()) {
+          return nullptr;
+        }
+        PyObject* result =
+            createDateTime(internal::fieldsToEpochMicroseconds(fields) +
+                               epochMicroseconds - utcMicroseconds,
+                           localTzinfo.get());
+        if (result != nullptr || PyErr_Occurred()) {
+          return result;
+        }
+      }
+      PyErr_Clear();
+    }
+  }
+  // out of the range of datetime, python raises the error or falls back
+  static constexpr FormatArgs2<decltype(seconds), decltype(microseconds)>
+      format;
+#ifdef _WIN32
+  return PyObject_CallMethod(m_context, "TIMESTAMP_LTZ_to_python_windows",
+                             format.format, seconds, microseconds);
+#else
+  return PyObject_CallMethod(m_context, "TIMESTAMP_LTZ_to_python",
+                             format.format, seconds, microseconds);
+#endif
+}
+
+PyObject* TimeStampTZBaseConverter::toOffsetDateTime(int64_t seconds,
+                                                     int64_t microseconds,
+                                                     int32_t timezone) const {
+  auto it = m_tzinfos.find(timezone);
+  if (it == m_tzinfos.end()) {
+    py::UniqueRef tzinfo(PyObject_CallMethod(
+        m_context, "TIMESTAMP_TZ_to_tzinfo", "i", timezone));
+    if (tzinfo.empty()) {
+      return nullptr;
+    }
+    it = m_tzinfos.emplace(timezone, std::move(tzinfo)).first;
+  }
+  // the timezone is the utc offset in minutes, shifted by a day
+  const int64_t offsetMicroseconds = static_cast<int64_t>(timezone - 1440) *
+                                     internal::SECONDS_PER_MINUTE *
+                                     internal::MICROSECONDS_PER_SECOND;
+  int64_t epochMicroseconds;
+  int64_t intermediate;
+  if (internal::toEpochMicroseconds(seconds, microseconds, epochMicroseconds) &&
+#ifdef _WIN32
+      internal::toEpochMicroseconds(0, epochMicroseconds, intermediate)
+#else
+      internal::toEpochMicroseconds(seconds, offsetMicroseconds, intermediate)
+#endif
+  ) {
+    PyObject* result = createDateTime(epochMicroseconds + offsetMicroseconds,
+                                      it->second.get());
+    if (result != nullptr || PyErr_Occurred()) {
+      return result;
+    }
+  }
+  // out of the range of datetime, python raises the error
+  static constexpr FormatArgs3<decltype(seconds), decltype(microseconds),
+                               decltype(timezone)>
+      format;
+#if _WIN32
+  return PyObject_CallMethod(m_context, "TIMESTAMP_TZ_to_python_windows",
+                             format.format, seconds, microseconds, timezone);
+#else
+  return PyObject_CallMethod(m_context, "TIMESTAMP_TZ_to_python", format.format,
+                             seconds, microseconds, timezone);
+#endif
+}
 
 OneFieldTimeStampNTZConverter::OneFieldTimeStampNTZConverter(
     ArrowArrayView* array, int32_t scale, PyObject* context)
@@ -67,16 +283,7 @@ PyObject* OneFieldTimeStampNTZConverter::toPyObject(int64_t rowIndex) const {
   }
   int64_t val = ArrowArrayViewGetIntUnsafe(m_array, rowIndex);
   internal::TimeSpec ts(val, m_scale);
-
-  static constexpr FormatArgs2<decltype(ts.seconds), decltype(ts.microseconds)>
-      format;
-#ifdef _WIN32
-  return PyObject_CallMethod(m_context, "TIMESTAMP_NTZ_to_python_windows",
-                             format.format, ts.seconds, ts.microseconds);
-#else
-  return PyObject_CallMethod(m_context, "TIMESTAMP_NTZ_to_python",
-                             format.format, ts.seconds, ts.microseconds);
-#endif
+  return toNaiveDateTime(ts.seconds, ts.microseconds);
 }
 
 NumpyOneFieldTimeStampNTZConverter::NumpyOneFieldTimeStampNTZConverter(
@@ -89,6 +296,13 @@ PyObject* NumpyOneFieldTimeStampNTZConverter::toPyObject(
     Py_RETURN_NONE;
   }
   int64_t val = ArrowArrayViewGetIntUnsafe(m_array, rowIndex);
+  const int64_t factor = internal::powTenSB4[internal::NANOSEC_DIGIT - m_scale];
+  if (val <= LLONG_MAX / factor && val >= LLONG_MIN / factor) {
+    PyObject* result = createDatetime64(val * factor);
+    if (result != nullptr || PyErr_Occurred()) {
+      return result;
+    }
+  }
   return PyObject_CallMethod(m_context,
                              "TIMESTAMP_NTZ_ONE_FIELD_to_numpy_datetime64",
                              "Li", val, m_scale);
@@ -127,16 +341,7 @@ PyObject* TwoFieldTimeStampNTZConverter::toPyObject(int64_t rowIndex) const {
   int64_t seconds = ArrowArrayViewGetIntUnsafe(m_epoch, rowIndex);
   int64_t microseconds =
       ArrowArrayViewGetIntUnsafe(m_fraction, rowIndex) / 1000;
-
-  static constexpr FormatArgs2<decltype(seconds), decltype(microseconds)>
-      format;
-#ifdef _WIN32
-  return PyObject_CallMethod(m_context, "TIMESTAMP_NTZ_to_python_windows",
-                             format.format, seconds, microseconds);
-#else
-  return PyObject_CallMethod(m_context, "TIMESTAMP_NTZ_to_python",
-                             format.format, seconds, microseconds);
-#endif
+  return toNaiveDateTime(seconds, microseconds);
 }
 
 NumpyTwoFieldTimeStampNTZConverter::NumpyTwoFieldTimeStampNTZConverter(
@@ -172,6 +377,13 @@ PyObject* NumpyTwoFieldTimeStampNTZConverter::toPyObject(
   }
   int64_t epoch = ArrowArrayViewGetIntUnsafe(m_epoch, rowIndex);
   int32_t frac = ArrowArrayViewGetIntUnsafe(m_fraction, rowIndex);
+  if (epoch < LLONG_MAX / NANOSECONDS_PER_SECOND &&
+      epoch > LLONG_MIN / NANOSECONDS_PER_SECOND) {
+    PyObject* result = createDatetime64(epoch * NANOSECONDS_PER_SECOND + frac);
+    if (result != nullptr || PyErr_Occurred()) {
+      return result;
+    }
+  }
   return PyObject_CallMethod(m_context,
                              "TIMESTAMP_NTZ_TWO_FIELD_to_numpy_datetime64",
                              "Li", epoch, frac);
@@ -179,7 +391,7 @@ PyObject* NumpyTwoFieldTimeStampNTZConverter::toPyObject(
 
 OneFieldTimeStampLTZConverter::OneFieldTimeStampLTZConverter(
     ArrowArrayView* array, int32_t scale, PyObject* context)
-    : TimeStampBaseConverter(context, scale), m_array(array) {}
+    : TimeStampLTZBaseConverter(context, scale), m_array(array) {}
 
 PyObject* OneFieldTimeStampLTZConverter::toPyObject(int64_t rowIndex) const {
   if (ArrowArrayViewIsNull(m_array, rowIndex)) {
@@ -187,23 +399,13 @@ PyObject* OneFieldTimeStampLTZConverter::toPyObject(int64_t rowIndex) const {
   }
   int64_t val = ArrowArrayViewGetIntUnsafe(m_array, rowIndex);
   internal::TimeSpec ts(val, m_scale);
-
-  static constexpr FormatArgs2<decltype(ts.seconds), decltype(ts.microseconds)>
-      format;
-
-#ifdef _WIN32
-  return PyObject_CallMethod(m_context, "TIMESTAMP_LTZ_to_python_windows",
-                             format.format, ts.seconds, ts.microseconds);
-#else
-  return PyObject_CallMethod(m_context, "TIMESTAMP_LTZ_to_python",
-                             format.format, ts.seconds, ts.microseconds);
-#endif
+  return toLocalDateTime(ts.seconds, ts.microseconds);
 }
 
 TwoFieldTimeStampLTZConverter::TwoFieldTimeStampLTZConverter(
     ArrowArrayView* array, ArrowSchemaView* schema, int32_t scale,
     PyObject* context)
-    : TimeStampBaseConverter(context, scale), m_array(array) {
+    : TimeStampLTZBaseConverter(context, scale), m_array(array) {
   if (schema->schema->n_children != 2) {
     std::string errorInfo = Logger::formatString(
         "[Snowflake Exception] arrow schema field number does not match, "
@@ -233,22 +435,13 @@ PyObject* TwoFieldTimeStampLTZConverter::toPyObject(int64_t rowIndex) const {
   int64_t seconds = ArrowArrayViewGetIntUnsafe(m_epoch, rowIndex);
   int64_t microseconds =
       ArrowArrayViewGetIntUnsafe(m_fraction, rowIndex) / 1000;
-
-  static constexpr FormatArgs2<decltype(seconds), decltype(microseconds)>
-      format;
-#ifdef _WIN32
-  return PyObject_CallMethod(m_context, "TIMESTAMP_LTZ_to_python_windows",
-                             format.format, seconds, microseconds);
-#else
-  return PyObject_CallMethod(m_context, "TIMESTAMP_LTZ_to_python",
-                             format.format, seconds, microseconds);
-#endif
+  return toLocalDateTime(seconds, microseconds);
 }
 
 TwoFieldTimeStampTZConverter::TwoFieldTimeStampTZConverter(
     ArrowArrayView* array, ArrowSchemaView* schema, int32_t scale,
     PyObject* context)
-    : TimeStampBaseConverter(context, scale), m_array(array) {
+    : TimeStampTZBaseConverter(context, scale), m_array(array) {
   if (schema->schema->n_children != 2) {
     std::string errorInfo = Logger::formatString(
         "[Snowflake Exception] arrow schema field number does not match, "
@@ -278,24 +471,13 @@ PyObject* TwoFieldTimeStampTZConverter::toPyObject(int64_t rowIndex) const {
 
   int32_t timezone = ArrowArrayViewGetIntUnsafe(m_timezone, rowIndex);
   internal::TimeSpec ts(ArrowArrayViewGetIntUnsafe(m_epoch, rowIndex), m_scale);
-
-  static constexpr FormatArgs3<decltype(ts.seconds), decltype(ts.microseconds),
-                               decltype(timezone)>
-      format;
-#if _WIN32
-  return PyObject_CallMethod(m_context, "TIMESTAMP_TZ_to_python_windows",
-                             format.format, ts.seconds, ts.microseconds,
-                             timezone);
-#else
-  return PyObject_CallMethod(m_context, "TIMESTAMP_TZ_to_python", format.format,
-                             ts.seconds, ts.microseconds, timezone);
-#endif
+  return toOffsetDateTime(ts.seconds, ts.microseconds, timezone);
 }
 
 ThreeFieldTimeStampTZConverter::ThreeFieldTimeStampTZConverter(
     ArrowArrayView* array, ArrowSchemaView* schema, int32_t scale,
     PyObject* context)
-    : TimeStampBaseConverter(context, scale), m_array(array) {
+    : TimeStampTZBaseConverter(context, scale), m_array(array) {
   if (schema->schema->n_children != 3) {
     std::string errorInfo = Logger::formatString(
         "[Snowflake Exception] arrow schema field number does not match, "
@@ -330,17 +512,7 @@ PyObject* ThreeFieldTimeStampTZConverter::toPyObject(int64_t rowIndex) const {
   int64_t seconds = ArrowArrayViewGetIntUnsafe(m_epoch, rowIndex);
   int64_t microseconds =
       ArrowArrayViewGetIntUnsafe(m_fraction, rowIndex) / 1000;
-
-  static constexpr FormatArgs3<decltype(seconds), decltype(microseconds),
-                               decltype(timezone)>
-      format;
-#ifdef _WIN32
-  return PyObject_CallMethod(m_context, "TIMESTAMP_TZ_to_python_windows",
-                             format.format, seconds, microseconds, timezone);
-#else
-  return PyObject_CallMethod(m_context, "TIMESTAMP_TZ_to_python", format.format,
-                             seconds, microseconds, timezone);
-#endif
+  return toOffsetDateTime(seconds, microseconds, timezone);
 }
 
 }  // namespace sf
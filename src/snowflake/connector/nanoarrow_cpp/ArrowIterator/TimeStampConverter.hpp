@@ -2,6 +2,7 @@
 #define PC_TIMESTAMPCONVERTER_HPP
 
 #include <memory>
+#include <unordered_map>
 
 #include "IColumnConverter.hpp"
 #include "Python/Common.hpp"
@@ -21,11 +22,51 @@ class TimeStampBaseConverter : public IColumnConverter {
   virtual ~TimeStampBaseConverter() = default;
 
  protected:
+  /** creates a datetime.datetime from microseconds since the epoch in the
+   * local time of tzinfo, returns nullptr without setting a python error if it
+   * is out of the range of datetime.datetime */
+  static PyObject* createDateTime(int64_t microseconds, PyObject* tzinfo);
+
+  /** converts to a naive datetime.datetime like
+   * ArrowConverterContext.TIMESTAMP_NTZ_to_python does */
+  PyObject* toNaiveDateTime(int64_t seconds, int64_t microseconds) const;
+
   PyObject* m_context;
 
   int32_t m_scale;
 };
 
+/** converts TIMESTAMP_LTZ values into the session timezone, which is resolved
+ * once per converter instead of once per value */
+class TimeStampLTZBaseConverter : public TimeStampBaseConverter {
+ public:
+  TimeStampLTZBaseConverter(PyObject* context, int32_t scale);
+
+ protected:
+  PyObject* toLocalDateTime(int64_t seconds, int64_t microseconds) const;
+
+ private:
+  py::UniqueRef m_tzinfo;
+
+  /** whether the session timezone has a fixed utc offset */
+  bool m_fixedOffset = false;
+
+  int64_t m_offsetMicroseconds = 0;
+};
+
+/** converts TIMESTAMP_TZ values, caching a tzinfo for each timezone offset */
+class TimeStampTZBaseConverter : public TimeStampBaseConverter {
+ public:
+  using TimeStampBaseConverter::TimeStampBaseConverter;
+
+ protected:
+  PyObject* toOffsetDateTime(int64_t seconds, int64_t microseconds,
+                             int32_t timezone) const;
+
+ private:
+  mutable std::unordered_map<int32_t, py::UniqueRef> m_tzinfos;
+};
+
 class OneFieldTimeStampNTZConverter : public TimeStampBaseConverter {
  public:
   explicit OneFieldTimeStampNTZConverter(ArrowArrayView* array, int32_t scale,
@@ -80,7 +121,7 @@ class NumpyTwoFieldTimeStampNTZConverter : public TimeStampBaseConverter {
   static Logger* logger;
 };
 
-class OneFieldTimeStampLTZConverter : public TimeStampBaseConverter {
+class OneFieldTimeStampLTZConverter : public TimeStampLTZBaseConverter {
  public:
   explicit OneFieldTimeStampLTZConverter(ArrowArrayView* array, int32_t scale,
                                          PyObject* context);
@@ -91,7 +132,7 @@ class OneFieldTimeStampLTZConverter : public TimeStampBaseConverter {
   ArrowArrayView* m_array;
 };
 
-class TwoFieldTimeStampLTZConverter : public TimeStampBaseConverter {
+class TwoFieldTimeStampLTZConverter : public TimeStampLTZBaseConverter {
  public:
   explicit TwoFieldTimeStampLTZConverter(ArrowArrayView* array,
                                          ArrowSchemaView* schema, int32_t scale,
@@ -107,7 +148,7 @@ class TwoFieldTimeStampLTZConverter : public TimeStampBaseConverter {
   static Logger* logger;
 };
 
-class TwoFieldTimeStampTZConverter : public TimeStampBaseConverter {
+class TwoFieldTimeStampTZConverter : public TimeStampTZBaseConverter {
  public:
   explicit TwoFieldTimeStampTZConverter(ArrowArrayView* array,
                                         ArrowSchemaView* schema, int32_t scale,
@@ -123,7 +164,7 @@ class TwoFieldTimeStampTZConverter : public TimeStampBaseConverter {
   static Logger* logger;
 };
 
-class ThreeFieldTimeStampTZConverter : public TimeStampBaseConverter {
+class ThreeFieldTimeStampTZConverter : public TimeStampTZBaseConverter {
  public:
   explicit ThreeFieldTimeStampTZConverter(ArrowArrayView* array,
                                           ArrowSchemaView* schema,
@@ -63,5 +63,81 @@ TimeSpec::TimeSpec(int64_t units, int32_t scale) {
   }
 }
 
+namespace {
+
+// civil calendar algorithms from
+// http://howardhinnant.github.io/date_algorithms.html
+int64_t daysFromCivil(int64_t year, int64_t month, int64_t day) {
+  year -= month <= 2;
+  const int64_t era = (year >= 0 ? year : year - 399) / 400;
+  const int64_t yearOfEra = year - era * 400;
+  const int64_t dayOfYear =
+      (153 * (month > 2 ? month - 3 : month + 9) + 2) / 5 + day - 1;
+  const int64_t dayOfEra =
+      yearOfEra * 365 + yearOfEra / 4 - yearOfEra / 100 + dayOfYear;
+  return era * 146097 + dayOfEra - 719468;
+}
+
+void civilFromDays(int64_t days, DateTimeFields& fields) {
+  days += 719468;
+  const int64_t era = (days >= 0 ? days : days - 146096) / 146097;
+  const int64_t dayOfEra = days - era * 146097;
+  const int64_t yearOfEra =
+      (dayOfEra - dayOfEra / 1460 + dayOfEra / 36524 - dayOfEra / 146096) / 365;
+  const int64_t dayOfYear =
+      dayOfEra - (365 * yearOfEra + yearOfEra / 4 - yearOfEra / 100);
+  const int64_t monthIndex = (5 * dayOfYear + 2) / 153;
+  fields.day = static_cast<int32_t>(dayOfYear - (153 * monthIndex + 2) / 5 + 1);
+  fields.month =
+      static_cast<int32_t>(monthIndex < 10 ? monthIndex + 3 : monthIndex - 9);
+  fields.year =
+      static_cast<int32_t>(yearOfEra + era * 400 + (fields.month <= 2));
+}
+
+}  // namespace
+
+bool toEpochMicroseconds(int64_t seconds, int64_t microseconds,
+                         int64_t& result) {
+  // both bounds keep the arithmetic below far from overflowing
+  constexpr int64_t maxSeconds = 1000000000000LL;
+  constexpr int64_t maxMicroseconds = maxSeconds * MICROSECONDS_PER_SECOND;
+  if (seconds < -maxSeconds || seconds > maxSeconds ||
+      microseconds < -maxMicroseconds || microseconds > maxMicroseconds) {
+    return false;
+  }
+  result = seconds * MICROSECONDS_PER_SECOND + microseconds;
+  return result >= MIN_DATETIME_MICROSECONDS &&
+         result <= MAX_DATETIME_MICROSECONDS;
+}
+
+bool epochMicrosecondsToFields(int64_t microseconds, DateTimeFields& fields) {
+  if (microseconds < MIN_DATETIME_MICROSECONDS ||
+      microseconds > MAX_DATETIME_MICROSECONDS) {
+    return false;
+  }
+  int64_t days = microseconds / MICROSECONDS_PER_DAY;
+  int64_t rest = microseconds % MICROSECONDS_PER_DAY;
+  if (rest < 0) {
+    days -= 1;
+    rest += MICROSECONDS_PER_DAY;
+  }
+  civilFromDays(days, fields);
+  int64_t secondOfDay = rest / MICROSECONDS_PER_SECOND;
+  fields.microsecond = static_cast<int32_t>(rest % MICROSECONDS_PER_SECOND);
+  fields.hour = static_cast<int32_t>(secondOfDay / SECONDS_PER_HOUR);
+  fields.minute =
+      static_cast<int32_t>(secondOfDay % SECONDS_PER_HOUR / SECONDS_PER_MINUTE);
+  fields.second = static_cast<int32_t>(secondOfDay % SECONDS_PER_MINUTE);
+  return true;
+}
+
+int64_t fieldsToEpochMicroseconds(const DateTimeFields& fields) {
+  int64_t days = daysFromCivil(fields.year, fields.month, fields.day);
+  int64_t seconds = days * HOURS_PER_DAY * SECONDS_PER_HOUR +
+                    fields.hour * SECONDS_PER_HOUR +
+                    fields.minute * SECONDS_PER_MINUTE + fields.second;
+  return seconds * MICROSECONDS_PER_SECOND + fields.microsecond;
+}
+
 }  // namespace internal
 }  // namespace sf
@@ -44,6 +44,38 @@ struct TimeSpec {
   TimeSpec(int64_t units, int32_t scale);
 };
 
+constexpr int64_t MICROSECONDS_PER_SECOND = 1000000;
+constexpr int64_t MICROSECONDS_PER_DAY = static_cast<int64_t>(HOURS_PER_DAY) *
+                                         SECONDS_PER_HOUR *
+                                         MICROSECONDS_PER_SECOND;
+
+/** the range of python datetime.datetime, in microseconds since the epoch */
+constexpr int64_t MIN_DATETIME_MICROSECONDS =
+    -62135596800LL * MICROSECONDS_PER_SECOND;
+constexpr int64_t MAX_DATETIME_MICROSECONDS =
+    253402300800LL * MICROSECONDS_PER_SECOND - 1;
+
+/** broken down fields of a python datetime.datetime */
+struct DateTimeFields {
+  int32_t year;
+  int32_t month;
+  int32_t day;
+  int32_t hour;
+  int32_t minute;
+  int32_t second;
+  int32_t microsecond;
+};
+
+/** combines seconds and microseconds since the epoch into microseconds,
+ * returns false if the result is out of the range of datetime.datetime */
+bool toEpochMicroseconds(int64_t seconds, int64_t microseconds,
+                         int64_t& result);
+
+/** returns false if microseconds is out of the range of datetime.datetime */
+bool epochMicrosecondsToFields(int64_t microseconds, DateTimeFields& fields);
+
+int64_t fieldsToEpochMicroseconds(const DateTimeFields& fields);
+
 // TODO: I think we can just keep int64_t version, since we can call the
 //  function with implicit conversion from int32 to int64
 int32_t getHourFromSeconds(int64_t seconds, int32_t scale);
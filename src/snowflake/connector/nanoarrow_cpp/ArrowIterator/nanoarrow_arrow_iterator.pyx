@@ -2,9 +2,14 @@
 # cython: language_level=3
 
 
-from cpython.ref cimport PyObject
+from cpython.exc cimport PyErr_Fetch, PyErr_Occurred
+from cpython.pycapsule cimport PyCapsule_GetPointer, PyCapsule_New
+from cpython.ref cimport Py_DECREF, Py_INCREF, Py_XDECREF, PyObject
 from cython.operator cimport dereference
+from libc.errno cimport EINVAL, EIO
 from libc.stdint cimport int64_t, uint8_t, uintptr_t
+from libc.stdlib cimport free, malloc
+from libc.string cimport strcmp
 from libcpp.vector cimport vector
 
 INSTALLED_PYARROW = False
@@ -14,6 +19,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from .constants import IterUnit
 from .errorcode import (
     ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE,
@@ -26,6 +36,41 @@ from .snow_logging import getSnowLogger
 snow_logger = getSnowLogger(__name__)
 
 
+cdef extern from "nanoarrow.h":
+    # Arrow C data interface, https://arrow.apache.org/docs/format/CDataInterface.html
+    cdef int64_t ARROW_FLAG_NULLABLE
+
+    cdef struct ArrowSchema:
+        const char* format
+        const char* name
+        int64_t flags
+        int64_t n_children
+        ArrowSchema** children
+        void (*release)(ArrowSchema*)
+
+    cdef struct ArrowArray:
+        void (*release)(ArrowArray*)
+
+    cdef struct ArrowArrayStream:
+        int (*get_schema)(ArrowArrayStream*, ArrowSchema*) noexcept
+        int (*get_next)(ArrowArrayStream*, ArrowArray*) noexcept
+        const char* (*get_last_error)(ArrowArrayStream*) noexcept
+        void (*release)(ArrowArrayStream*) noexcept
+        void* private_data
+
+    void ArrowSchemaInit(ArrowSchema* schema)
+    int ArrowSchemaSetFormat(ArrowSchema* schema, const char* format)
+    int ArrowSchemaSetName(ArrowSchema* schema, const char* name)
+    int ArrowSchemaAllocateChildren(ArrowSchema* schema, int64_t n_children)
+    int ArrowSchemaDeepCopy(const ArrowSchema* schema, ArrowSchema* schema_out)
+    int ArrowBasicArrayStreamInit(
+        ArrowArrayStream* array_stream, ArrowSchema* schema, int64_t n_arrays
+    )
+    void ArrowBasicArrayStreamSetArray(
+        ArrowArrayStream* array_stream, int64_t i, ArrowArray* array
+    )
+
+
 cdef extern from "CArrowIterator.hpp" namespace "sf":
     cdef cppclass ReturnVal:
         PyObject * successObj;
@@ -57,6 +102,14 @@ cdef extern from "CArrowChunkIterator.hpp" namespace "sf":
             PyObject* use_numpy
         ) except +
 
+    cdef cppclass CArrowColumnIterator(CArrowChunkIterator):
+        CArrowColumnIterator(
+            PyObject* context,
+            char* arrow_bytes,
+            int64_t arrow_bytes_size,
+            bint number_to_decimal,
+        ) except +
+
 cdef extern from "CArrowTableIterator.hpp" namespace "sf":
     cdef cppclass CArrowTableIterator(CArrowIterator):
         CArrowTableIterator(
@@ -64,6 +117,7 @@ cdef extern from "CArrowTableIterator.hpp" namespace "sf":
             char* arrow_bytes,
             int64_t arrow_bytes_size,
             bint number_to_decimal,
+            bint widen_fixed_numbers,
         ) except +
 
 
@@ -88,6 +142,9 @@ cdef class PyArrowIterator(EmptyPyArrowIterator):
     cdef vector[uintptr_t] nanoarrow_Table
     cdef vector[uintptr_t] nanoarrow_Schema
     cdef object table_returned
+    # any object supporting the buffer protocol, it is referenced here to keep the
+    # memory arrow_bytes points into alive
+    cdef object arrow_buffer
     cdef char* arrow_bytes
     cdef int64_t arrow_bytes_size
 
@@ -111,6 +168,7 @@ cdef class PyArrowIterator(EmptyPyArrowIterator):
             object number_to_decimal,
             object check_error_on_every_column
     ):
+        cdef const uint8_t[::1] arrow_view = arrow_bytes
         self.context = arrow_context
         self.cIterator = NULL
         self.use_dict_result = use_dict_result
@@ -120,8 +178,9 @@ cdef class PyArrowIterator(EmptyPyArrowIterator):
         self.number_to_decimal = number_to_decimal
         self.pyarrow_table = None
         self.table_returned = False
-        self.arrow_bytes = <char*>arrow_bytes
-        self.arrow_bytes_size = len(arrow_bytes)
+        self.arrow_buffer = arrow_bytes
+        self.arrow_bytes_size = arrow_view.shape[0]
+        self.arrow_bytes = <char*>&arrow_view[0] if self.arrow_bytes_size > 0 else NULL
 
     def __dealloc__(self):
         del self.cIterator
@@ -225,6 +284,7 @@ cdef class PyArrowTableIterator(PyArrowIterator):
             self.arrow_bytes,
             self.arrow_bytes_size,
             self.number_to_decimal,
+            False,
         )
         cdef ReturnVal cret = self.cIterator.checkInitializationStatus()
         if cret.exception:
@@ -254,3 +314,340 @@ cdef class PyArrowTableIterator(PyArrowIterator):
             self.table_returned = True
             return self.pyarrow_table
         raise StopIteration
+
+
+cdef void _release_schema_capsule(object capsule) noexcept:
+    cdef ArrowSchema* schema = <ArrowSchema*>PyCapsule_GetPointer(capsule, "arrow_schema")
+    if schema.release != NULL:
+        schema.release(schema)
+    free(schema)
+
+
+cdef void _release_stream_capsule(object capsule) noexcept:
+    cdef ArrowArrayStream* stream = <ArrowArrayStream*>PyCapsule_GetPointer(
+        capsule, "arrow_array_stream"
+    )
+    if stream.release != NULL:
+        stream.release(stream)
+    free(stream)
+
+
+cdef object _new_schema_capsule():
+    cdef ArrowSchema* schema = <ArrowSchema*>malloc(sizeof(ArrowSchema))
+    if schema == NULL:
+        raise MemoryError()
+    schema.release = NULL
+    return PyCapsule_New(schema, "arrow_schema", _release_schema_capsule)
+
+
+cdef object _new_stream_capsule():
+    cdef ArrowArrayStream* stream = <ArrowArrayStream*>malloc(sizeof(ArrowArrayStream))
+    if stream == NULL:
+        raise MemoryError()
+    stream.release = NULL
+    return PyCapsule_New(stream, "arrow_array_stream", _release_stream_capsule)
+
+
+cdef inline ArrowSchema* _schema_of(object capsule):
+    return <ArrowSchema*>PyCapsule_GetPointer(capsule, "arrow_schema")
+
+
+cdef inline ArrowArrayStream* _stream_of(object capsule):
+    return <ArrowArrayStream*>PyCapsule_GetPointer(capsule, "arrow_array_stream")
+
+
+cdef void _check_arrow_rc(int return_code, str action) except *:
+    if return_code != 0:
+        raise MemoryError(f"Failed to {action}, error code: {return_code}")
+
+
+cdef void _set_schema(ArrowSchema* schema, tuple field) except *:
+    name, arrow_format, nullable, children = field
+    ArrowSchemaInit(schema)
+    _check_arrow_rc(ArrowSchemaSetFormat(schema, arrow_format.encode()), "set format")
+    if name is not None:
+        _check_arrow_rc(ArrowSchemaSetName(schema, name.encode()), "set name")
+    if not nullable:
+        schema.flags &= ~ARROW_FLAG_NULLABLE
+    _check_arrow_rc(
+        ArrowSchemaAllocateChildren(schema, len(children)), "allocate children"
+    )
+    for i, child in enumerate(children):
+        _set_schema(schema.children[i], child)
+
+
+def create_arrow_schema(list fields):
+    """Creates an "arrow_schema" PyCapsule of a struct with the given fields.
+
+    Fields are (name, format, nullable, children) tuples, with the formats of the
+    Arrow C data interface. It describes results without pyarrow when there is no
+    Arrow data to take the schema from.
+    """
+    capsule = _new_schema_capsule()
+    _set_schema(_schema_of(capsule), ("", "+s", False, fields))
+    return capsule
+
+
+cdef bint _same_types(ArrowSchema* schema, ArrowSchema* other):
+    if strcmp(schema.format, other.format) != 0 or schema.n_children != other.n_children:
+        return False
+    for i in range(schema.n_children):
+        if not _same_types(schema.children[i], other.children[i]):
+            return False
+    return True
+
+
+cdef class _ArrowArrayStreamChain:
+    """State of an ArrowArrayStream which yields the arrays of several streams.
+
+    The streams are pulled from a Python iterator of "arrow_array_stream" capsules
+    only when their arrays are asked for, so result chunks are still downloaded
+    while the consumer reads the ones before.
+    """
+    cdef object streams
+    cdef object current
+    cdef object schema
+    cdef bytes last_error
+
+    cdef int next_stream(self) except -1:
+        self.current = next(self.streams, None)
+        if self.current is None:
+            return 0
+        schema = _new_schema_capsule()
+        stream = _stream_of(self.current)
+        if stream.get_schema(stream, _schema_of(schema)) != 0:
+            raise InterfaceError(
+                f"Failed to get the schema of a result chunk: "
+                f"{stream.get_last_error(stream).decode(errors='replace')}"
+            )
+        if self.schema is None:
+            self.schema = schema
+        elif not _same_types(_schema_of(self.schema), _schema_of(schema)):
+            raise InterfaceError(
+                "The Arrow types of a result chunk differ from the ones of the "
+                "first chunk"
+            )
+        return 0
+
+
+cdef int _chain_get_schema(ArrowArrayStream* stream, ArrowSchema* out) noexcept with gil:
+    cdef _ArrowArrayStreamChain chain = <_ArrowArrayStreamChain>stream.private_data
+    return ArrowSchemaDeepCopy(_schema_of(chain.schema), out)
+
+
+cdef int _chain_get_next(ArrowArrayStream* stream, ArrowArray* out) noexcept with gil:
+    cdef _ArrowArrayStreamChain chain = <_ArrowArrayStreamChain>stream.private_data
+    cdef ArrowArrayStream* current
+    cdef int return_code
+    while chain.current is not None:
+        current = _stream_of(chain.current)
+        return_code = current.get_next(current, out)
+        if return_code != 0:
+            error = current.get_last_error(current)
+            chain.last_error = error if error != NULL else b""
+            return return_code
+        if out.release != NULL:
+            return 0
+        try:
+            chain.next_stream()
+        except Exception as e:
+            chain.last_error = str(e).encode()
+            return EINVAL if isinstance(e, InterfaceError) else EIO
+    out.release = NULL
+    return 0
+
+
+cdef const char* _chain_get_last_error(ArrowArrayStream* stream) noexcept with gil:
+    cdef _ArrowArrayStreamChain chain = <_ArrowArrayStreamChain>stream.private_data
+    if chain.last_error is None:
+        return NULL
+    return chain.last_error
+
+
+cdef void _chain_release(ArrowArrayStream* stream) noexcept with gil:
+    Py_DECREF(<object>stream.private_data)
+    stream.release = NULL
+
+
+def chain_arrow_array_streams(object streams, object create_schema):
+    """Chains "arrow_array_stream" capsules into a single "arrow_array_stream" capsule.
+
+    The schema is taken from the first stream, or from ``create_schema`` when there
+    is none. Errors of the iterator are raised here for the first stream and reported
+    by the returned stream for later ones.
+    """
+    cdef _ArrowArrayStreamChain chain = _ArrowArrayStreamChain()
+    chain.streams = iter(streams)
+    chain.next_stream()
+    if chain.schema is None:
+        chain.schema = create_schema()
+    capsule = _new_stream_capsule()
+    cdef ArrowArrayStream* stream = _stream_of(capsule)
+    Py_INCREF(chain)
+    stream.private_data = <void*>chain
+    stream.get_schema = _chain_get_schema
+    stream.get_next = _chain_get_next
+    stream.get_last_error = _chain_get_last_error
+    stream.release = _chain_release
+    return capsule
+
+
+cdef class PyArrowStreamIterator(PyArrowIterator):
+    """Yields the converted record batches of an Arrow chunk as one "arrow_array_stream" PyCapsule.
+
+    The record batches are converted like the ones of PyArrowTableIterator, but are
+    moved into a stream of the Arrow PyCapsule interface instead of into a pyarrow
+    Table, so pyarrow is not needed. NUMBER columns are widened to int64 or to
+    decimals with a precision of 38, so the streams of all chunks have the same
+    types whatever integers the back-end stored a chunk in. Nothing is yielded for
+    chunks without record batches.
+    """
+    def __cinit__(
+        self,
+        object cursor,
+        object py_inputstream,
+        object arrow_context,
+        object use_dict_result,
+        object numpy,
+        object number_to_decimal,
+        object check_error_on_every_column
+    ):
+        super().__init__(cursor, py_inputstream, arrow_context, use_dict_result, numpy, number_to_decimal, check_error_on_every_column)
+        if self.cIterator is not NULL:
+            return
+
+        self.cIterator = new CArrowTableIterator(
+            <PyObject *> self.context,
+            self.arrow_bytes,
+            self.arrow_bytes_size,
+            self.number_to_decimal,
+            True,
+        )
+        cdef ReturnVal cret = self.cIterator.checkInitializationStatus()
+        if cret.exception:
+            Error.errorhandler_wrapper(
+                self.cursor.connection if self.cursor is not None else None,
+                self.cursor,
+                OperationalError,
+                {
+                    'msg': f'Failed to open arrow stream: {str(<object>cret.exception)}',
+                    'errno': ER_FAILED_TO_READ_ARROW_STREAM
+                })
+        self.cIterator.next()
+        # the conversion reports errors by setting the python error indicator
+        cdef PyObject* error_type
+        cdef PyObject* error_value
+        cdef PyObject* error_traceback
+        if PyErr_Occurred() != NULL:
+            PyErr_Fetch(&error_type, &error_value, &error_traceback)
+            cause = <object>error_value if error_value != NULL else None
+            Py_XDECREF(error_type)
+            Py_XDECREF(error_value)
+            Py_XDECREF(error_traceback)
+            Error.errorhandler_wrapper(
+                self.cursor.connection if self.cursor is not None else None,
+                self.cursor,
+                InterfaceError,
+                {
+                    'msg': f'Failed to convert current record batch, cause: {cause}',
+                    'errno': ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE
+                }
+            )
+        self.nanoarrow_Table = self.cIterator.getArrowArrayPtrs()
+        self.nanoarrow_Schema = self.cIterator.getArrowSchemaPtrs()
+        snow_logger.debug(msg=f"Batches read: {self.nanoarrow_Table.size()}", path_name=__file__, func_name="__cinit__")
+
+    def __next__(self):
+        if self.table_returned or self.nanoarrow_Table.empty():
+            raise StopIteration
+        self.table_returned = True
+        capsule = _new_stream_capsule()
+        cdef ArrowSchema schema
+        # the record batches share their types, the stream takes the ones of the first
+        _check_arrow_rc(
+            ArrowSchemaDeepCopy(<ArrowSchema*>self.nanoarrow_Schema[0], &schema),
+            "copy schema",
+        )
+        cdef ArrowArrayStream* stream = _stream_of(capsule)
+        cdef int return_code = ArrowBasicArrayStreamInit(
+            stream, &schema, self.nanoarrow_Table.size()
+        )
+        if return_code != 0:
+            schema.release(&schema)
+            _check_arrow_rc(return_code, "create stream")
+        for i in range(self.nanoarrow_Table.size()):
+            # the stream takes over the arrays, so they are not copied
+            ArrowBasicArrayStreamSetArray(stream, i, <ArrowArray*>self.nanoarrow_Table[i])
+        return capsule
+
+
+cdef object _to_numpy_array(object dtype, object values, object mask):
+    cdef Py_ssize_t i
+    if dtype is None:
+        # a list can not be handed to numpy.array, values that are lists themselves
+        # would become a second dimension
+        array = numpy.empty(len(values), dtype=object)
+        for i in range(len(values)):
+            array[i] = values[i]
+        return array
+    array = numpy.frombuffer(values, dtype=dtype)
+    if mask is not None:
+        return numpy.ma.MaskedArray(array, mask=numpy.frombuffer(mask, dtype=bool))
+    return array
+
+
+cdef class PyArrowColumnIterator(PyArrowIterator):
+    """Iterates over the record batches of an Arrow chunk as lists of numpy arrays.
+
+    The arrays are created from the values CArrowColumnIterator converted natively,
+    without copying them again. Fixed width columns with NULL values become numpy
+    masked arrays.
+    """
+    def __cinit__(
+        self,
+        object cursor,
+        object py_inputstream,
+        object arrow_context,
+        object use_dict_result,
+        object numpy,
+        object number_to_decimal,
+        object check_error_on_every_column,
+    ):
+        super().__init__(cursor, py_inputstream, arrow_context, use_dict_result, numpy, number_to_decimal, check_error_on_every_column)
+        if self.cIterator is not NULL:
+            return
+
+        self.cIterator = new CArrowColumnIterator(
+            <PyObject *> self.context,
+            self.arrow_bytes,
+            self.arrow_bytes_size,
+            self.number_to_decimal,
+        )
+        cdef ReturnVal cret = self.cIterator.checkInitializationStatus()
+        if cret.exception:
+            Error.errorhandler_wrapper(
+                self.cursor.connection if self.cursor is not None else None,
+                self.cursor,
+                OperationalError,
+                {
+                    'msg': f'Failed to open arrow stream: {str(<object>cret.exception)}',
+                    'errno': ER_FAILED_TO_READ_ARROW_STREAM
+                })
+
+    def __next__(self):
+        cdef ReturnVal cret = self.cIterator.next()
+        if not cret.successObj:
+            Error.errorhandler_wrapper(
+                self.cursor.connection if self.cursor is not None else None,
+                self.cursor,
+                InterfaceError,
+                {
+                    'msg': f'Failed to convert current record batch, cause: {<object>cret.exception}',
+                    'errno': ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE
+                }
+            )
+        ret = <object>cret.successObj
+
+        if ret is None:
+            raise StopIteration
+        return [_to_numpy_array(dtype, values, mask) for dtype, values, mask in ret]
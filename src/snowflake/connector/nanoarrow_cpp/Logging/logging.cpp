@@ -28,6 +28,8 @@ Logger::Logger(const char *name) : m_name(name) {}
 
 void Logger::log(int level, const char *path_name, const char *func_name,
                  int line_num, const char *msg) {
+  // callers may have released the GIL, e.g. while converting arrow tables
+  py::PyUniqueLock lock;
   if (m_pyLogger.get() == nullptr) {
     setupPyLogger();
   }
@@ -148,6 +148,16 @@ def _import_or_missing_boto_option() -> tuple[ModuleLikeObject, ModuleLikeObject
         return MissingBotocore(), MissingBoto3(), False
 
 
+def import_pyarrow_parquet() -> ModuleLikeObject:
+    """This function imports pyarrow.parquet, which is only loaded when it is needed.
+
+    If pyarrow is unavailable it returns a MissingPandas instead.
+    """
+    if not installed_pandas:
+        return MissingPandas()
+    return importlib.import_module("pyarrow.parquet")
+
+
 # Create actual constants to be imported from this file
 pandas, pyarrow, installed_pandas = _import_or_missing_pandas_option()
 keyring, installed_keyring = _import_or_missing_keyring_option()
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import abc
-import json
+import mmap
+import os
+import queue
+import struct
+import tempfile
+import threading
 import time
 from base64 import b64decode
+from contextlib import contextmanager
 from enum import Enum, unique
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, Sequence
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
 
 from typing_extensions import Self
 
@@ -16,6 +32,7 @@ from .compat import OK, UNAUTHORIZED, urlparse
 from .constants import FIELD_TYPES, IterUnit
 from .errorcode import ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE, ER_NO_PYARROW
 from .errors import Error, InterfaceError, NotSupportedError, ProgrammingError
+from .json_result_decoder import JSONResultDecoder
 from .network import (
     RetryRequest,
     get_http_retryable_error,
@@ -25,23 +42,35 @@ from .network import (
 )
 from .options import installed_pandas
 from .options import pyarrow as pa
+from .result_chunk_cache import (
+    ResultChunkKey,
+    current_result_chunk_cache,
+    get_result_chunk_cache,
+)
 from .secret_detector import SecretDetector
 from .session_manager import HttpConfig, SessionManager, SessionManagerFactory
 from .time_util import TimerContextManager
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 logger = getLogger(__name__)
 
 MAX_DOWNLOAD_RETRY = 10
 DOWNLOAD_TIMEOUT = 7  # seconds
+STREAM_READ_SIZE = 1 << 20  # bytes read at a time when streaming a result batch
 
 if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
     from pandas import DataFrame
-    from pyarrow import DataType, Table
+    from pyarrow import DataType, Schema, Table
 
     from .connection import SnowflakeConnection
-    from .converter import SnowflakeConverterType
-    from .cursor import ResultMetadataV2, SnowflakeCursor
-    from .vendored.requests import Response
+    from .converter import SnowflakeColumnConverterType, SnowflakeConverterType
+    from .cursor import ResultMetadata, ResultMetadataV2, SnowflakeCursor
+    from .vendored.requests import Response, Session
 
 
 # emtpy pyarrow type array corresponding to FIELD_TYPES
@@ -54,7 +83,7 @@ SSE_C_AES = "AES256"
 
 
 def _create_nanoarrow_iterator(
-    data: bytes,
+    data: bytes | memoryview,
     context: ArrowConverterContext,
     use_dict_result: bool,
     numpy: bool,
@@ -62,30 +91,169 @@ def _create_nanoarrow_iterator(
     row_unit: IterUnit,
     check_error_on_every_column: bool = True,
 ):
-    from .nanoarrow_arrow_iterator import PyArrowRowIterator, PyArrowTableIterator
+    from .nanoarrow_arrow_iterator import (
+        PyArrowColumnIterator,
+        PyArrowRowIterator,
+        PyArrowStreamIterator,
+        PyArrowTableIterator,
+    )
 
     logger.debug("Using nanoarrow as the arrow data converter")
-    return (
-        PyArrowRowIterator(
-            None,
-            data,
-            context,
-            use_dict_result,
-            numpy,
-            number_to_decimal,
-            check_error_on_every_column,
-        )
-        if row_unit == IterUnit.ROW_UNIT
-        else PyArrowTableIterator(
-            None,
-            data,
-            context,
-            use_dict_result,
-            numpy,
-            number_to_decimal,
-            check_error_on_every_column,
+    iterator_class = {
+        IterUnit.ROW_UNIT: PyArrowRowIterator,
+        IterUnit.TABLE_UNIT: PyArrowTableIterator,
+        IterUnit.COLUMN_UNIT: PyArrowColumnIterator,
+        IterUnit.STREAM_UNIT: PyArrowStreamIterator,
+    }[row_unit]
+    return iterator_class(
+        None,
+        data,
+        context,
+        use_dict_result,
+        numpy,
+        number_to_decimal,
+        check_error_on_every_column,
+    )
+
+
+# numpy dtypes of the columns that are not object arrays in fetch_numpy_* results
+NUMPY_DTYPES = {
+    "FIXED": "int64",
+    "REAL": "float64",
+    "BOOLEAN": "bool",
+    "DATE": "datetime64[D]",
+    "TIMESTAMP_NTZ": "datetime64[ns]",
+    "TIMESTAMP_LTZ": "datetime64[ns]",
+    "TIMESTAMP_TZ": "datetime64[ns]",
+}
+
+
+# Arrow C data interface formats of the types ``FieldType.pa_type`` gives columns,
+# they describe empty results without pyarrow
+ARROW_FORMATS = {
+    "FIXED": "l",
+    "REAL": "g",
+    "DATE": "tdm",
+    "TIMESTAMP": "ttn",
+    "TIMESTAMP_LTZ": "tsn:",
+    "TIMESTAMP_TZ": "tsn:",
+    "TIMESTAMP_NTZ": "tsn:",
+    "BINARY": "z",
+    "TIME": "ttn",
+    "BOOLEAN": "b",
+    "INTERVAL_YEAR_MONTH": "l",
+    "INTERVAL_DAY_TIME": "l",
+}
+
+
+def arrow_field(column: ResultMetadataV2, name: str | None) -> tuple:
+    """Describes the Arrow field of a column as a (name, format, nullable, children) tuple."""
+    type_name = FIELD_TYPES[column.type_code].name
+    fields = column.fields or []
+    if type_name == "OBJECT" and fields:
+        return name, "+s", True, [arrow_field(field, field.name) for field in fields]
+    if type_name == "ARRAY" and fields:
+        return name, "+l", True, [arrow_field(fields[0], "item")]
+    if type_name == "MAP" and fields:
+        key, value = arrow_field(fields[0], "key"), arrow_field(fields[1], "value")
+        entries = ("entries", "+s", False, [key[:2] + (False,) + key[3:], value])
+        return name, "+m", True, [entries]
+    if type_name == "VECTOR":
+        return (
+            name,
+            f"+w:{column.vector_dimension}",
+            True,
+            [arrow_field(fields[0], "item")],
         )
+    return name, ARROW_FORMATS.get(type_name, "u"), True, []
+
+
+def concatenate_numpy_arrays(arrays: list[ndarray]) -> ndarray:
+    """Concatenates the arrays of a column, the result is masked if any of them is."""
+    if len(arrays) == 1:
+        return arrays[0]
+    if any(isinstance(array, numpy.ma.MaskedArray) for array in arrays):
+        return numpy.ma.concatenate(arrays)
+    return numpy.concatenate(arrays)
+
+
+# Arrow IPC stream framing, see https://arrow.apache.org/docs/format/Columnar.html#encapsulated-message-format
+IPC_CONTINUATION_MARKER = b"\xff\xff\xff\xff"
+IPC_END_OF_STREAM = IPC_CONTINUATION_MARKER + b"\x00\x00\x00\x00"
+IPC_MESSAGE_HEADER_RECORD_BATCH = 3
+
+
+def _read_ipc_message_header(metadata: bytes) -> tuple[int, int]:
+    """Reads the header type and the body length of an IPC ``Message`` flatbuffer."""
+    (table,) = struct.unpack_from("<I", metadata, 0)
+    (vtable_offset,) = struct.unpack_from("<i", metadata, table)
+    vtable = table - vtable_offset
+    (vtable_size,) = struct.unpack_from("<H", metadata, vtable)
+
+    def field_offset(field_id: int) -> int:
+        pos = 4 + 2 * field_id
+        if pos >= vtable_size:
+            return 0
+        return struct.unpack_from("<H", metadata, vtable + pos)[0]
+
+    # Message fields: version, header_type, header, bodyLength, custom_metadata
+    header_type_offset = field_offset(1)
+    header_type = metadata[table + header_type_offset] if header_type_offset else 0
+    body_length_offset = field_offset(3)
+    body_length = (
+        struct.unpack_from("<q", metadata, table + body_length_offset)[0]
+        if body_length_offset
+        else 0
     )
+    return header_type, body_length
+
+
+def split_arrow_ipc_stream(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    """Splits an Arrow IPC stream arriving in arbitrary pieces into record batches.
+
+    Every yielded value is a complete IPC stream holding the schema (and any
+    dictionary) messages followed by a single record batch, so it can be handed to a
+    ``PyArrowIterator`` as soon as that record batch has fully arrived.
+
+    Trailing data that does not form a complete message is yielded as is, so that the
+    Arrow reader can report the stream as malformed.
+    """
+    pieces = iter(pieces)
+    buffer = bytearray()
+    prefix = bytearray()
+
+    def fill(size: int) -> bool:
+        while len(buffer) < size:
+            piece = next(pieces, None)
+            if piece is None:
+                return False
+            buffer.extend(piece)
+        return True
+
+    while fill(4):
+        header_size = 8 if buffer[:4] == IPC_CONTINUATION_MARKER else 4
+        if not fill(header_size):
+            break
+        (metadata_size,) = struct.unpack_from("<i", buffer, header_size - 4)
+        if metadata_size == 0:
+            # end of stream marker
+            return
+        if not fill(header_size + metadata_size):
+            break
+        header_type, body_length = _read_ipc_message_header(
+            bytes(buffer[header_size : header_size + metadata_size])
+        )
+        message_size = header_size + metadata_size + body_length
+        if not fill(message_size):
+            break
+        message = bytes(buffer[:message_size])
+        del buffer[:message_size]
+        if header_type == IPC_MESSAGE_HEADER_RECORD_BATCH:
+            yield b"".join((prefix, message, IPC_END_OF_STREAM))
+        else:
+            prefix.extend(message)
+    if buffer:
+        yield bytes(prefix + buffer)
 
 
 @unique
@@ -95,6 +263,30 @@ class DownloadMetrics(Enum):
     download = "download"  # Download time in milliseconds
     parse = "parse"  # Parsing time to final data types
     load = "load"  # Parsing time from initial type to intermediate types
+    spilled = "spilled"  # Bytes written to disk instead of being held in memory
+
+
+class DownloadCancelled(Exception):
+    """Raised by the download of a ``ResultBatch`` whose iterator was closed."""
+
+
+# the event that cancels the downloads of the current thread
+_download_state = threading.local()
+
+
+@contextmanager
+def cancellable_downloads(cancelled: threading.Event | None) -> Iterator[None]:
+    """Stops the downloads of result batches in this thread once ``cancelled`` is set.
+
+    The downloads check it between the pieces they read and before retrying, a
+    cancelled download raises ``DownloadCancelled`` instead of being retried.
+    """
+    previous = getattr(_download_state, "cancelled", None)
+    _download_state.cancelled = cancelled
+    try:
+        yield
+    finally:
+        _download_state.cancelled = previous
 
 
 class RemoteChunkInfo(NamedTuple):
@@ -105,6 +297,23 @@ class RemoteChunkInfo(NamedTuple):
     compressedSize: int
 
 
+class SharedData(NamedTuple):
+    """Where a worker process left the data of a ``ResultBatch`` in shared memory."""
+
+    name: str
+    size: int
+
+
+# Windows frees shared memory with its last handle, so the segment a worker process
+# wrote could be gone before the parent process opens it
+SHARED_DATA_SUPPORTED = os.name != "nt"
+
+
+def _discard_shared_memory(shared_memory: SharedMemory) -> None:
+    shared_memory.close()
+    shared_memory.unlink()
+
+
 def create_batches_from_response(
     cursor: SnowflakeCursor,
     _format: str,
@@ -112,6 +321,7 @@ def create_batches_from_response(
     schema: Sequence[ResultMetadataV2],
 ) -> list[ResultBatch]:
     column_converters: list[tuple[str, SnowflakeConverterType]] = []
+    vectorized_converters: list[SnowflakeColumnConverterType | None] = []
     arrow_context: ArrowConverterContext | None = None
     rowtypes = data["rowtype"]
     total_len: int = data.get("total", 0)
@@ -127,9 +337,16 @@ def create_batches_from_response(
             return type_name, python_method
 
         column_converters = [col_to_converter(c) for c in rowtypes]
+        vectorized_converters = [
+            cursor._connection.converter.to_python_column_method(c["type"].upper(), c)
+            for c in rowtypes
+        ]
     else:
         rowset_b64 = data.get("rowsetBase64")
         arrow_context = ArrowConverterContext(cursor._connection._session_parameters)
+    # every batch of the response shares one stateless copy of the connection's
+    # session manager, cloning one per batch gets expensive for thousands of chunks
+    session_manager = cursor._connection._session_manager.clone()
     if "chunks" in data:
         chunks = data["chunks"]
         logger.debug(f"chunk size={len(chunks)}")
@@ -166,7 +383,9 @@ def create_batches_from_response(
                     column_converters,
                     cursor._use_dict_result,
                     json_result_force_utf8_decoding=cursor._connection._json_result_force_utf8_decoding,
-                    session_manager=cursor._connection._session_manager.clone(),
+                    json_decoder=cursor._connection._json_result_decoder,
+                    vectorized_converters=vectorized_converters,
+                    session_manager=session_manager,
                 )
                 for c in chunks
             ]
@@ -181,10 +400,21 @@ def create_batches_from_response(
                     cursor._connection._numpy,
                     schema,
                     cursor._connection._arrow_number_to_decimal,
-                    session_manager=cursor._connection._session_manager.clone(),
+                    session_manager=session_manager,
                 )
                 for c in chunks
             ]
+            query_id = data.get("queryId") or cursor.sfqid
+            if cursor._connection.client_result_chunk_cache_size and query_id:
+                get_result_chunk_cache(
+                    cursor._connection.client_result_chunk_cache_directory,
+                    cursor._connection.client_result_chunk_cache_size,
+                    cursor._connection.client_result_chunk_cache_memory_size,
+                )
+                for index, (batch, c) in enumerate(zip(rest_of_chunks, chunks)):
+                    batch._cache_key = ResultChunkKey(
+                        query_id, index, c["compressedSize"]
+                    )
     for c in rest_of_chunks:
         first_chunk_len -= c.rowcount
     if _format == "json":
@@ -194,7 +424,8 @@ def create_batches_from_response(
             schema,
             column_converters,
             cursor._use_dict_result,
-            session_manager=cursor._connection._session_manager.clone(),
+            session_manager=session_manager,
+            vectorized_converters=vectorized_converters,
         )
     elif rowset_b64 is not None:
         first_chunk = ArrowResultBatch.from_data(
@@ -205,7 +436,7 @@ def create_batches_from_response(
             cursor._connection._numpy,
             schema,
             cursor._connection._arrow_number_to_decimal,
-            session_manager=cursor._connection._session_manager.clone(),
+            session_manager=session_manager,
         )
     else:
         logger.error(f"Don't know how to construct ResultBatches from response: {data}")
@@ -217,7 +448,7 @@ def create_batches_from_response(
             cursor._connection._numpy,
             schema,
             cursor._connection._arrow_number_to_decimal,
-            session_manager=cursor._connection._session_manager.clone(),
+            session_manager=session_manager,
         )
 
     return [first_chunk] + rest_of_chunks
@@ -257,15 +488,19 @@ class ResultBatch(abc.ABC):
         self._chunk_headers = chunk_headers
         self._remote_chunk_info = remote_chunk_info
         self._schema = schema
-        self.schema = (
-            [s._to_result_metadata_v1() for s in schema] if schema is not None else None
-        )
+        # converted when first asked for, see schema
+        self._schema_v1: list[ResultMetadata] | None = None
         self._use_dict_result = use_dict_result
         # Passed to contain the configured Http behavior in case the connectio is no longer active for the download
-        # Can be overridden with setters if needed.
+        # Can be overridden with setters if needed. It is shared by all batches of a
+        # result set, so it must not be changed in place.
         self._session_manager = session_manager
         self._metrics: dict[str, int] = {}
         self._data: str | list[tuple[Any, ...]] | None = None
+        # set when the downloaded data may be kept in the result chunk cache
+        self._cache_key: ResultChunkKey | None = None
+        # downloaded ahead of time, used by the next iterator over this batch
+        self._prefetched_data: memoryview | list | None = None
         if self._remote_chunk_info:
             parsed_url = urlparse(self._remote_chunk_info.url)
             path_parts = parsed_url.path.rsplit("/", 1)
@@ -298,6 +533,12 @@ class ResultBatch(abc.ABC):
             return None
         return self._remote_chunk_info.uncompressedSize
 
+    @property
+    def schema(self) -> list[ResultMetadata] | None:
+        if self._schema_v1 is None and self._schema is not None:
+            self._schema_v1 = [s._to_result_metadata_v1() for s in self._schema]
+        return self._schema_v1
+
     @property
     def column_names(self) -> list[str]:
         return [col.name for col in self._schema]
@@ -317,10 +558,30 @@ class ResultBatch(abc.ABC):
     @http_config.setter
     def http_config(self, config: HttpConfig) -> None:
         if self._session_manager:
-            self._session_manager.config = config
+            # the session manager is shared with the other batches of the result set
+            self._session_manager = self._session_manager.from_config(config)
         else:
             self._session_manager = SessionManagerFactory.get_manager(config=config)
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # prefetched data is only meant for the next iterator in this process
+        state["_prefetched_data"] = None
+        state["_schema_v1"] = None
+        if self._session_manager is not None:
+            # only the configuration is sent, not the sessions of the manager
+            state["_session_manager"] = (
+                type(self._session_manager),
+                self._session_manager.config,
+            )
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        if state.get("_session_manager") is not None:
+            manager_class, config = state["_session_manager"]
+            state["_session_manager"] = manager_class.from_config(config)
+        self.__dict__.update(state)
+
     def __iter__(
         self,
     ) -> Iterator[dict | Exception] | Iterator[tuple | Exception]:
@@ -332,6 +593,22 @@ class ResultBatch(abc.ABC):
         """
         return self.create_iter()
 
+    def _check_cancelled(self) -> None:
+        """Raises ``DownloadCancelled`` once this thread's downloads are cancelled."""
+        cancelled = getattr(_download_state, "cancelled", None)
+        if cancelled is not None and cancelled.is_set():
+            logger.debug(f"download of result batch id: {self.id} was cancelled")
+            raise DownloadCancelled(self.id)
+
+    def _backoff_sleep(self, sleep_timer: float) -> None:
+        """Sleeps before retrying a download, waking up early if it is cancelled."""
+        cancelled = getattr(_download_state, "cancelled", None)
+        if cancelled is None:
+            time.sleep(sleep_timer)
+        else:
+            cancelled.wait(sleep_timer)
+            self._check_cancelled()
+
     def _download(
         self, connection: SnowflakeConnection | None = None, **kwargs
     ) -> Response:
@@ -343,6 +620,7 @@ class ResultBatch(abc.ABC):
             else exponential_backoff()()
         )
         for retry in range(MAX_DOWNLOAD_RETRY):
+            self._check_cancelled()
             try:
                 with TimerContextManager() as download_metric:
                     logger.debug(f"started downloading result batch id: {self.id}")
@@ -351,6 +629,8 @@ class ResultBatch(abc.ABC):
                         "url": chunk_url,
                         "headers": self._chunk_headers,
                         "timeout": DOWNLOAD_TIMEOUT,
+                        # the body is read in pieces so that it can be cancelled
+                        "stream": True,
                     }
                     # Try to reuse a connection if possible
 
@@ -367,12 +647,14 @@ class ResultBatch(abc.ABC):
                                 f"downloading result batch id: {self.id} with existing session {session}"
                             )
                             response = session.request("get", **request_data)
+                            self._read_content(response)
                     elif self._session_manager is not None:
                         # If connection is not accessible or was already closed, but cursors are now used to fetch the data - we will only reuse the http setup (through cloned SessionManager without session pooling)
                         with self._session_manager.use_session(
                             request_data["url"]
                         ) as session:
                             response = session.request("get", **request_data)
+                            self._read_content(response)
                     else:
                         # If there was no session manager cloned, then we are using a default Session Manager setup, since it is very unlikely to enter this part outside of testing
                         logger.debug(
@@ -381,7 +663,11 @@ class ResultBatch(abc.ABC):
                         local_session_manager = SessionManagerFactory.get_manager(
                             use_pooling=False
                         )
-                        response = local_session_manager.get(**request_data)
+                        with local_session_manager.use_session(
+                            request_data["url"]
+                        ) as session:
+                            response = session.get(**request_data)
+                            self._read_content(response)
 
                     if response.status_code == OK:
                         logger.debug(
@@ -390,16 +676,10 @@ class ResultBatch(abc.ABC):
                         break
 
                     # Raise error here to correctly go in to exception clause
-                    if is_retryable_http_code(response.status_code):
-                        # retryable server exceptions
-                        error: Error = get_http_retryable_error(response.status_code)
-                        raise RetryRequest(error)
-                    elif response.status_code == UNAUTHORIZED:
-                        # make a unauthorized error
-                        raise_okta_unauthorized_error(None, response)
-                    else:
-                        raise_failed_request_error(None, chunk_url, "get", response)
+                    self._raise_download_error(response)
 
+            except DownloadCancelled:
+                raise
             except (RetryRequest, Exception) as e:
                 if retry == MAX_DOWNLOAD_RETRY - 1:
                     # Re-throw if we failed on the last retry
@@ -411,13 +691,180 @@ class ResultBatch(abc.ABC):
                     f"{self.id} for the {retry + 1} th time, "
                     f"backing off for {sleep_timer}s for the reason: '{e}'"
                 )
-                time.sleep(sleep_timer)
+                self._backoff_sleep(sleep_timer)
 
         self._metrics[DownloadMetrics.download.value] = (
             download_metric.get_timing_millis()
         )
         return response
 
+    def _read_content(self, response: Response) -> None:
+        """Reads the body of a streamed response into its ``content``.
+
+        The body is read in pieces, a cancelled download stops reading at the next one.
+        """
+        pieces = []
+        try:
+            if response.status_code == OK:
+                for piece in response.iter_content(STREAM_READ_SIZE):
+                    # closing the response aborts the rest of the read
+                    self._check_cancelled()
+                    pieces.append(piece)
+            else:
+                # error bodies are small, they are read at once for the error message
+                pieces.append(response.content or b"")
+        finally:
+            response.close()
+        response._content = b"".join(pieces)
+
+    def _raise_download_error(self, response: Response) -> None:
+        """Raises the error matching a download response that was not OK."""
+        if is_retryable_http_code(response.status_code):
+            # retryable server exceptions
+            error: Error = get_http_retryable_error(response.status_code)
+            raise RetryRequest(error)
+        elif response.status_code == UNAUTHORIZED:
+            # make a unauthorized error
+            raise_okta_unauthorized_error(None, response)
+        else:
+            raise_failed_request_error(
+                None, self._remote_chunk_info.url, "get", response
+            )
+
+    @contextmanager
+    def _download_session(
+        self, connection: SnowflakeConnection | None, url: str
+    ) -> Iterator[Session]:
+        """Picks the session to download with, the same way ``_download`` does."""
+        if connection and connection.rest and connection.rest.session_manager is not None:
+            with connection.rest.use_requests_session(url) as session:
+                yield session
+        elif self._session_manager is not None:
+            with self._session_manager.use_session(url) as session:
+                yield session
+        else:
+            with SessionManagerFactory.get_manager(use_pooling=False).use_session(
+                url
+            ) as session:
+                yield session
+
+    def _download_stream(
+        self, connection: SnowflakeConnection | None = None
+    ) -> Iterator[bytes]:
+        """Returns the decompressed data that the ``ResultBatch`` is pointing at.
+
+        When the batch can be cached and the process has a result chunk cache, the data
+        is read from the cache if it is there and added to it when it is downloaded.
+        """
+        cache = current_result_chunk_cache() if self._cache_key is not None else None
+        if cache is None:
+            return self._download_remote_stream(connection=connection)
+        cached = cache.get(self._cache_key)
+        if cached is not None:
+            logger.debug(f"result batch id: {self.id} is cached")
+            return cached
+        return cache.store(
+            self._cache_key, self._download_remote_stream(connection=connection)
+        )
+
+    def _download_remote_stream(
+        self, connection: SnowflakeConnection | None = None
+    ) -> Iterator[bytes]:
+        """Downloads the data that the ``ResultBatch`` is pointing at piece by piece.
+
+        The decompressed pieces are yielded as soon as they arrive. If the download
+        breaks after some pieces were yielded it is retried and the bytes that were
+        already yielded are skipped.
+        """
+        backoff = (
+            connection._backoff_generator
+            if connection is not None
+            else exponential_backoff()()
+        )
+        chunk_url = self._remote_chunk_info.url
+        request_data = {
+            "url": chunk_url,
+            "headers": self._chunk_headers,
+            "timeout": DOWNLOAD_TIMEOUT,
+            "stream": True,
+        }
+        yielded = 0
+        download_time = 0.0
+        for retry in range(MAX_DOWNLOAD_RETRY):
+            self._check_cancelled()
+            try:
+                logger.debug(f"started streaming result batch id: {self.id}")
+                with self._download_session(connection, chunk_url) as session:
+                    start = time.perf_counter()
+                    response = session.request("get", **request_data)
+                    try:
+                        if response.status_code != OK:
+                            self._raise_download_error(response)
+                        to_skip = yielded
+                        pieces = response.iter_content(STREAM_READ_SIZE)
+                        while True:
+                            piece = next(pieces, None)
+                            download_time += time.perf_counter() - start
+                            if piece is None:
+                                break
+                            # closing the response aborts the rest of the read
+                            self._check_cancelled()
+                            if to_skip:
+                                skipped = min(to_skip, len(piece))
+                                to_skip -= skipped
+                                piece = piece[skipped:]
+                            if piece:
+                                yielded += len(piece)
+                                yield piece
+                            start = time.perf_counter()
+                    finally:
+                        response.close()
+                logger.debug(f"successfully streamed result batch id: {self.id}")
+                break
+            except DownloadCancelled:
+                raise
+            except (RetryRequest, Exception) as e:
+                if retry == MAX_DOWNLOAD_RETRY - 1:
+                    # Re-throw if we failed on the last retry
+                    e = e.args[0] if isinstance(e, RetryRequest) else e
+                    raise e
+                sleep_timer = next(backoff)
+                logger.exception(
+                    f"Failed to stream the large result set batch "
+                    f"{self.id} for the {retry + 1} th time, "
+                    f"backing off for {sleep_timer}s for the reason: '{e}'"
+                )
+                self._backoff_sleep(sleep_timer)
+        # Only the time spent waiting for the network is counted, not the time the
+        # consumer spent on the pieces
+        self._metrics[DownloadMetrics.download.value] = int(download_time * 1000)
+
+    def _download_to_buffer(
+        self,
+        connection: SnowflakeConnection | None = None,
+        prefix: bytes = b"",
+        suffix: bytes = b"",
+    ) -> memoryview:
+        """Downloads the data that the ``ResultBatch`` is pointing at into one buffer.
+
+        The buffer is allocated up front from the uncompressed size reported by the
+        back-end and the pieces are written into it as they arrive. This avoids
+        holding all pieces and the ``bytes`` they are joined into at the same time.
+        ``prefix`` and ``suffix`` are written around the downloaded data.
+        """
+        buffer = bytearray(
+            len(prefix) + self._remote_chunk_info.uncompressedSize + len(suffix)
+        )
+        buffer[: len(prefix)] = prefix
+        size = len(prefix)
+        for piece in self._download_stream(connection=connection):
+            # grows the buffer in case the reported size was too small
+            buffer[size : size + len(piece)] = piece
+            size += len(piece)
+        buffer[size : size + len(suffix)] = suffix
+        size += len(suffix)
+        return memoryview(buffer)[:size]
+
     @abc.abstractmethod
     def create_iter(
         self, **kwargs
@@ -426,6 +873,7 @@ class ResultBatch(abc.ABC):
         | Iterator[tuple | Exception]
         | Iterator[Table]
         | Iterator[DataFrame]
+        | Iterator[dict[str, ndarray]]
     ):
         """Downloads the data from from blob storage that this ResultChunk points at.
 
@@ -469,6 +917,22 @@ class ResultBatch(abc.ABC):
         Returns the instance itself."""
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def prefetch_data(
+        self, connection: SnowflakeConnection | None = None, **kwargs
+    ) -> Self:
+        """Downloads the data that the ``ResultBatch`` is pointing at ahead of time.
+
+        Unlike ``populate_data`` the data is only kept until the next iterator over
+        this batch is created, whichever way the batch is iterated over. Returns the
+        instance itself.
+        """
+        raise NotImplementedError()
+
+    def release_prefetched_data(self) -> None:
+        """Drops the prefetched data of a batch that will not be iterated over."""
+        self._prefetched_data = None
+
 
 class JSONResultBatch(ResultBatch):
     def __init__(
@@ -481,6 +945,10 @@ class JSONResultBatch(ResultBatch):
         use_dict_result: bool,
         *,
         json_result_force_utf8_decoding: bool = False,
+        json_decoder: JSONResultDecoder | None = None,
+        vectorized_converters: (
+            Sequence[SnowflakeColumnConverterType | None] | None
+        ) = None,
         session_manager: SessionManager | None = None,
     ) -> None:
         super().__init__(
@@ -492,7 +960,9 @@ class JSONResultBatch(ResultBatch):
             session_manager,
         )
         self._json_result_force_utf8_decoding = json_result_force_utf8_decoding
+        self._json_decoder = json_decoder or JSONResultDecoder()
         self.column_converters = column_converters
+        self._vectorized_converters = vectorized_converters
 
     @classmethod
     def from_data(
@@ -503,6 +973,9 @@ class JSONResultBatch(ResultBatch):
         column_converters: Sequence[tuple[str, SnowflakeConverterType]],
         use_dict_result: bool,
         session_manager: SessionManager | None = None,
+        vectorized_converters: (
+            Sequence[SnowflakeColumnConverterType | None] | None
+        ) = None,
     ):
         """Initializes a ``JSONResultBatch`` from static, local data."""
         new_chunk = cls(
@@ -512,6 +985,7 @@ class JSONResultBatch(ResultBatch):
             schema,
             column_converters,
             use_dict_result,
+            vectorized_converters=vectorized_converters,
             session_manager=session_manager,
         )
         new_chunk._data = new_chunk._parse(data)
@@ -527,73 +1001,101 @@ class JSONResultBatch(ResultBatch):
         """
         # if users specify how to decode the data, we decode the bytes using the specified encoding
         if self._json_result_force_utf8_decoding:
-            try:
-                read_data = str(response.content, "utf-8", errors="strict")
-            except Exception as exc:
-                err_msg = f"failed to decode json result content due to error {exc!r}"
-                logger.error(err_msg)
-                raise Error(msg=err_msg)
-        else:
-            # note: SNOW-787480 response.apparent_encoding is unreliable, chardet.detect can be wrong which is used by
-            # response.text to decode content, check issue: https://github.com/chardet/chardet/issues/148
-            read_data = response.text
-        return json.loads("".join(["[", read_data, "]"]))
+            return self._load_utf8(b"".join([b"[", response.content, b"]"]))
+        # note: SNOW-787480 response.apparent_encoding is unreliable, chardet.detect can be wrong which is used by
+        # response.text to decode content, check issue: https://github.com/chardet/chardet/issues/148
+        read_data = response.text
+        return self._json_decoder.loads("".join(["[", read_data, "]"]))
+
+    def _load_utf8(self, data: bytes | bytearray | memoryview) -> list:
+        """Loads UTF-8 encoded rows that are already framed as a JSON array."""
+        try:
+            return self._json_decoder.loads_utf8(data)
+        except ValueError as exc:
+            err_msg = f"failed to decode json result content due to error {exc!r}"
+            logger.error(err_msg)
+            raise Error(msg=err_msg)
 
     def _parse(
         self, downloaded_data
     ) -> list[dict | Exception] | list[tuple | Exception]:
-        """Parses downloaded data into its final form."""
+        """Parses downloaded data into its final form.
+
+        The rows are transposed once and every column is converted as a whole, with
+        its vectorized converter if it has one. Rows that can not be converted are
+        replaced by the error of their first failing column.
+        """
         logger.debug(f"parsing for result batch id: {self.id}")
-        result_list = []
-        if self._use_dict_result:
-            for row in downloaded_data:
-                row_result = {}
-                try:
-                    for (_t, c), v, col in zip(
-                        self.column_converters,
-                        row,
-                        self._schema,
-                    ):
-                        row_result[col.name] = v if c is None or v is None else c(v)
-                    result_list.append(row_result)
-                except Exception as error:
-                    msg = f"Failed to convert: field {col.name}: {_t}::{v}, Error: {error}"
-                    logger.exception(msg)
-                    result_list.append(
-                        Error.errorhandler_make_exception(
-                            InterfaceError,
-                            {
-                                "msg": msg,
-                                "errno": ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE,
-                            },
-                        )
-                    )
+        vectorized_converters = self._vectorized_converters or [None] * len(
+            self.column_converters
+        )
+        errors: dict[int, Exception] = {}
+        columns = [
+            self._convert_column(values, converter, vectorized_converter, col, errors)
+            for values, converter, vectorized_converter, col in zip(
+                zip(*downloaded_data),
+                self.column_converters,
+                vectorized_converters,
+                self._schema,
+            )
+        ]
+        if not columns:
+            rows = [() for _ in downloaded_data]
+        elif self._use_dict_result:
+            names = [col.name for col in self._schema]
+            rows = [dict(zip(names, row)) for row in zip(*columns)]
         else:
-            for row in downloaded_data:
-                row_result = [None] * len(self._schema)
-                try:
-                    idx = 0
-                    for (_t, c), v, _col in zip(
-                        self.column_converters,
-                        row,
-                        self._schema,
-                    ):
-                        row_result[idx] = v if c is None or v is None else c(v)
-                        idx += 1
-                    result_list.append(tuple(row_result))
-                except Exception as error:
-                    msg = f"Failed to convert: field {_col.name}: {_t}::{v}, Error: {error}"
-                    logger.exception(msg)
-                    result_list.append(
-                        Error.errorhandler_make_exception(
-                            InterfaceError,
-                            {
-                                "msg": msg,
-                                "errno": ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE,
-                            },
-                        )
-                    )
-        return result_list
+            rows = list(zip(*columns))
+        for idx, error in errors.items():
+            rows[idx] = error
+        return rows
+
+    @staticmethod
+    def _convert_column(
+        values: Sequence[Any],
+        converter: tuple[str, SnowflakeConverterType],
+        vectorized_converter: SnowflakeColumnConverterType | None,
+        col: ResultMetadataV2,
+        errors: dict[int, Exception],
+    ) -> Sequence[Any]:
+        """Converts the values of one column, recording the rows that fail into errors."""
+        _t, c = converter
+        if c is None:
+            return values
+        has_nulls = None in values
+        try:
+            if vectorized_converter is not None:
+                if not has_nulls:
+                    return vectorized_converter(list(values))
+                converted = iter(
+                    vectorized_converter([v for v in values if v is not None])
+                )
+                return [None if v is None else next(converted) for v in values]
+            if not has_nulls:
+                return list(map(c, values))
+            return [None if v is None else c(v) for v in values]
+        except Exception:
+            # convert the values one by one, to find the ones that fail
+            pass
+        result = []
+        for idx, v in enumerate(values):
+            try:
+                result.append(None if v is None else c(v))
+            except Exception as error:
+                result.append(None)
+                if idx in errors:
+                    # the first failing column of the row is reported
+                    continue
+                msg = f"Failed to convert: field {col.name}: {_t}::{v}, Error: {error}"
+                logger.exception(msg)
+                errors[idx] = Error.errorhandler_make_exception(
+                    InterfaceError,
+                    {
+                        "msg": msg,
+                        "errno": ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE,
+                    },
+                )
+        return result
 
     def __repr__(self) -> str:
         return f"JSONResultChunk({self.id})"
@@ -601,11 +1103,20 @@ class JSONResultBatch(ResultBatch):
     def _fetch_data(
         self, connection: SnowflakeConnection | None = None, **kwargs
     ) -> list[dict | Exception] | list[tuple | Exception]:
-        response = self._download(connection=connection)
+        if self._json_result_force_utf8_decoding:
+            # the encoding is known, so the rows are downloaded straight into a
+            # buffer that frames them as a JSON array for the decoder
+            data = self._download_to_buffer(
+                connection=connection, prefix=b"[", suffix=b"]"
+            )
+            load = self._load_utf8
+        else:
+            data = self._download(connection=connection)
+            load = self._load
         # Load data to a intermediate form
         logger.debug(f"started loading result batch id: {self.id}")
         with TimerContextManager() as load_metric:
-            downloaded_data = self._load(response)
+            downloaded_data = load(data)
         logger.debug(f"finished loading result batch id: {self.id}")
         self._metrics[DownloadMetrics.load.value] = load_metric.get_timing_millis()
         # Process downloaded data
@@ -620,11 +1131,20 @@ class JSONResultBatch(ResultBatch):
         self._data = self._fetch_data(connection=connection, **kwargs)
         return self
 
+    def prefetch_data(
+        self, connection: SnowflakeConnection | None = None, **kwargs
+    ) -> Self:
+        self._prefetched_data = self._fetch_data(connection=connection, **kwargs)
+        return self
+
     def create_iter(
         self, connection: SnowflakeConnection | None = None, **kwargs
     ) -> Iterator[dict | Exception] | Iterator[tuple | Exception]:
         if self._local:
             return iter(self._data)
+        if self._prefetched_data is not None:
+            rows, self._prefetched_data = self._prefetched_data, None
+            return iter(rows)
         return iter(self._fetch_data(connection=connection, **kwargs))
 
     def _arrow_fetching_error(self):
@@ -664,10 +1184,148 @@ class ArrowResultBatch(ResultBatch):
         self._context = context
         self._numpy = numpy
         self._number_to_decimal = number_to_decimal
+        self._shared_data: SharedData | None = None
+        self._spill_file: str | None = None
 
     def __repr__(self) -> str:
         return f"ArrowResultChunk({self.id})"
 
+    def _download_to_shared_memory(
+        self, connection: SnowflakeConnection | None = None
+    ) -> SharedData:
+        """Downloads the data that the ``ResultBatch`` is pointing at into a new segment.
+
+        Like ``_download_to_buffer`` the segment is sized from the uncompressed size
+        reported by the back-end.
+        """
+        shared_memory = SharedMemory(
+            create=True, size=max(1, self._remote_chunk_info.uncompressedSize)
+        )
+        size = 0
+        try:
+            for piece in self._download_stream(connection=connection):
+                if size + len(piece) > shared_memory.size:
+                    # the reported size was too small
+                    bigger = SharedMemory(create=True, size=2 * (size + len(piece)))
+                    bigger.buf[:size] = shared_memory.buf[:size]
+                    _discard_shared_memory(shared_memory)
+                    shared_memory = bigger
+                shared_memory.buf[size : size + len(piece)] = piece
+                size += len(piece)
+        except BaseException:
+            _discard_shared_memory(shared_memory)
+            raise
+        # the process that reads the data unlinks the segment, the resource tracker must
+        # not do so when the worker process that created it exits
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+        shared_memory.close()
+        return SharedData(shared_memory.name, size)
+
+    def populate_shared_data(
+        self, connection: SnowflakeConnection | None = None, **kwargs
+    ) -> Self:
+        """Downloads the data that the ``ResultBatch`` is pointing at for another process.
+
+        This is what the worker processes of ``client_fetch_use_mp`` run. Only the name
+        of the shared memory segment is pickled back to the parent process, which reads
+        the data in place when it creates an iterator over this batch. Returns the
+        instance itself.
+        """
+        self._shared_data = self._download_to_shared_memory(connection=connection)
+        return self
+
+    def release_shared_data(self) -> None:
+        """Frees the shared memory of a batch that will not be iterated over."""
+        if self._shared_data is None:
+            return
+        shared_data, self._shared_data = self._shared_data, None
+        try:
+            _discard_shared_memory(SharedMemory(shared_data.name))
+        except FileNotFoundError:
+            pass
+
+    def _load_shared_data(
+        self, iter_unit: IterUnit
+    ) -> Iterator[dict | Exception] | Iterator[tuple | Exception] | Iterator[Table]:
+        shared_data, self._shared_data = self._shared_data, None
+        shared_memory = SharedMemory(shared_data.name)
+        data = shared_memory.buf[: shared_data.size]
+        logger.debug(f"started loading result batch id: {self.id}")
+        try:
+            # the nanoarrow iterators copy what they keep of the data while being
+            # created, so the segment can be freed right after
+            with TimerContextManager() as load_metric:
+                loaded_data = self._load_data(data, iter_unit)
+        finally:
+            data.release()
+            _discard_shared_memory(shared_memory)
+        logger.debug(f"finished loading result batch id: {self.id}")
+        self._metrics[DownloadMetrics.load.value] = load_metric.get_timing_millis()
+        return loaded_data
+
+    def populate_spilled_data(
+        self,
+        directory: str | None = None,
+        connection: SnowflakeConnection | None = None,
+        **kwargs,
+    ) -> Self:
+        """Downloads the data that the ``ResultBatch`` is pointing at into a file.
+
+        The downloaded Arrow IPC stream is written to a new file in ``directory``, or in
+        the default temporary directory, instead of being held in memory. The file is
+        memory-mapped and removed when an iterator over this batch is created. Returns
+        the instance itself.
+        """
+        fd, path = tempfile.mkstemp(
+            prefix="snowflake_result_", suffix=".arrows", dir=directory
+        )
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as spill_file:
+                for piece in self._download_stream(connection=connection):
+                    spill_file.write(piece)
+                    size += len(piece)
+        except BaseException:
+            os.unlink(path)
+            raise
+        logger.debug(f"spilled {size} bytes of result batch id: {self.id} to disk")
+        self._metrics[DownloadMetrics.spilled.value] = size
+        self._spill_file = path
+        return self
+
+    def release_spilled_data(self) -> None:
+        """Removes the file of a spilled batch that will not be iterated over."""
+        if self._spill_file is None:
+            return
+        path, self._spill_file = self._spill_file, None
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def _load_spilled_data(
+        self, iter_unit: IterUnit
+    ) -> Iterator[dict | Exception] | Iterator[tuple | Exception] | Iterator[Table]:
+        path, self._spill_file = self._spill_file, None
+        logger.debug(f"started loading result batch id: {self.id}")
+        try:
+            with open(path, "rb") as spill_file, mmap.mmap(
+                spill_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                data = memoryview(mapped)
+                try:
+                    # like with shared memory, the file is only read while the
+                    # nanoarrow iterator is created
+                    with TimerContextManager() as load_metric:
+                        loaded_data = self._load_data(data, iter_unit)
+                finally:
+                    data.release()
+        finally:
+            os.unlink(path)
+        logger.debug(f"finished loading result batch id: {self.id}")
+        self._metrics[DownloadMetrics.load.value] = load_metric.get_timing_millis()
+        return loaded_data
+
     def _load(
         self, response: Response, row_unit: IterUnit
     ) -> Iterator[dict | Exception] | Iterator[tuple | Exception]:
@@ -676,8 +1334,13 @@ class ArrowResultBatch(ResultBatch):
         This is used to iterate through results in different ways depending on which
         mode that ``PyArrowIterator`` is in.
         """
+        return self._load_data(response.content, row_unit)
+
+    def _load_data(
+        self, data: bytes | memoryview, row_unit: IterUnit
+    ) -> Iterator[dict | Exception] | Iterator[tuple | Exception]:
         return _create_nanoarrow_iterator(
-            response.content,
+            data,
             self._context,
             self._use_dict_result,
             self._numpy,
@@ -744,6 +1407,18 @@ class ArrowResultBatch(ResultBatch):
         self, iter_unit: IterUnit, connection: SnowflakeConnection | None = None
     ) -> Iterator[dict | Exception] | Iterator[tuple | Exception] | Iterator[Table]:
         """Create an iterator for the ResultBatch. Used by get_arrow_iter."""
+        if self._shared_data is not None:
+            return self._load_shared_data(iter_unit)
+        if self._spill_file is not None:
+            return self._load_spilled_data(iter_unit)
+        if (
+            not self._local
+            and self._prefetched_data is None
+            and iter_unit == IterUnit.ROW_UNIT
+            and connection is not None
+            and connection.client_fetch_arrow_streaming
+        ):
+            return self._create_streaming_iter(connection)
         if self._local:
             try:
                 return self._from_data(
@@ -759,25 +1434,134 @@ class ArrowResultBatch(ResultBatch):
                 if connection and getattr(connection, "_debug_arrow_chunk", False):
                     logger.debug(f"arrow data can not be parsed: {self._data}")
                 raise
-        response = self._download(connection=connection)
+        if self._prefetched_data is not None:
+            data, self._prefetched_data = self._prefetched_data, None
+        else:
+            data = self._download_to_buffer(connection=connection)
         logger.debug(f"started loading result batch id: {self.id}")
         with TimerContextManager() as load_metric:
             try:
-                loaded_data = self._load(response, iter_unit)
+                loaded_data = self._load_data(data, iter_unit)
             except Exception:
                 if connection and getattr(connection, "_debug_arrow_chunk", False):
-                    logger.debug(f"arrow data can not be parsed: {response}")
+                    logger.debug(f"arrow data can not be parsed: {bytes(data)}")
                 raise
         logger.debug(f"finished loading result batch id: {self.id}")
         self._metrics[DownloadMetrics.load.value] = load_metric.get_timing_millis()
         return loaded_data
 
+    def _create_streaming_iter(
+        self, connection: SnowflakeConnection
+    ) -> Iterator[dict | Exception] | Iterator[tuple | Exception]:
+        """Create a row iterator that decodes record batches while downloading.
+
+        The chunk is downloaded by a thread of its own into a queue of record batches,
+        whether the returned iterator is consumed or not, so that the download overlaps
+        the consumption of the batches before this one. This only returns once the first
+        record batch has arrived. The download stops when the iterator is closed, or
+        when the downloads of the calling thread are cancelled.
+        """
+        # record batches, then None at the end of the chunk or the download error
+        record_batches: queue.SimpleQueue[bytes | BaseException | None] = (
+            queue.SimpleQueue()
+        )
+        closed = threading.Event()
+        cancelled = getattr(_download_state, "cancelled", None)
+
+        def download() -> None:
+            try:
+                with cancellable_downloads(cancelled):
+                    pieces = self._download_stream(connection=connection)
+                    try:
+                        for data in split_arrow_ipc_stream(pieces):
+                            if closed.is_set():
+                                break
+                            record_batches.put(data)
+                    finally:
+                        # closing the stream closes its response
+                        close = getattr(pieces, "close", None)
+                        if close is not None:
+                            close()
+            except BaseException as e:
+                record_batches.put(e)
+            else:
+                record_batches.put(None)
+
+        threading.Thread(
+            target=download, name=f"SnowflakeStream-{self.id}", daemon=True
+        ).start()
+        first_record_batch = record_batches.get()
+        if isinstance(first_record_batch, BaseException):
+            raise first_record_batch
+
+        def rows() -> Iterator[dict | Exception] | Iterator[tuple | Exception]:
+            load_time = 0.0
+            data = first_record_batch
+            try:
+                while data is not None:
+                    if isinstance(data, BaseException):
+                        raise data
+                    start = time.perf_counter()
+                    try:
+                        loaded_data = self._load_data(data, IterUnit.ROW_UNIT)
+                    except Exception:
+                        if getattr(connection, "_debug_arrow_chunk", False):
+                            logger.debug(f"arrow data can not be parsed: {data}")
+                        raise
+                    load_time += time.perf_counter() - start
+                    yield from loaded_data
+                    data = record_batches.get()
+            finally:
+                closed.set()
+            logger.debug(f"finished loading result batch id: {self.id}")
+            self._metrics[DownloadMetrics.load.value] = int(load_time * 1000)
+
+        return rows()
+
     def _get_arrow_iter(
         self, connection: SnowflakeConnection | None = None
     ) -> Iterator[Table]:
         """Returns an iterator for this batch which yields a pyarrow Table"""
         return self._create_iter(iter_unit=IterUnit.TABLE_UNIT, connection=connection)
 
+    def _get_arrow_stream_iter(
+        self, connection: SnowflakeConnection | None = None
+    ) -> Iterator[object]:
+        """Returns an iterator for this batch which yields an "arrow_array_stream" PyCapsule"""
+        return self._create_iter(iter_unit=IterUnit.STREAM_UNIT, connection=connection)
+
+    def _create_empty_arrow_schema(self) -> object:
+        """Returns an "arrow_schema" PyCapsule based on schema, like the one of ``_create_empty_table``
+
+        NUMBER columns have the types the chunks of a stream are widened to.
+        """
+        from .nanoarrow_arrow_iterator import create_arrow_schema
+
+        return create_arrow_schema(
+            [
+                (
+                    (column.name, self._arrow_number_format(column), True, [])
+                    if FIELD_TYPES[column.type_code].name == "FIXED"
+                    else arrow_field(column, column.name)
+                )
+                for column in self._schema
+            ]
+        )
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        """Exports this batch as an "arrow_array_stream" PyCapsule.
+
+        This implements the Arrow PyCapsule interface, so that libraries like polars or
+        duckdb read the converted record batches directly, without pyarrow. The record
+        batches are not copied, a batch can be exported once. ``requested_schema`` is
+        ignored, the consumer gets the types ``to_arrow`` returns.
+        """
+        from .nanoarrow_arrow_iterator import chain_arrow_array_streams
+
+        return chain_arrow_array_streams(
+            self._get_arrow_stream_iter(), self._create_empty_arrow_schema
+        )
+
     def _create_empty_table(self) -> Table:
         """Returns empty Arrow table based on schema"""
         if installed_pandas:
@@ -796,6 +1580,78 @@ class ArrowResultBatch(ResultBatch):
             return val
         return self._create_empty_table()
 
+    def _numpy_dtype(self, column: ResultMetadataV2) -> str:
+        """Returns the numpy dtype that a column of this batch is converted to."""
+        type_name = FIELD_TYPES[column.type_code].name
+        if type_name == "FIXED" and column.scale:
+            return "object" if self._number_to_decimal else "float64"
+        if type_name == "FIXED" and (column.precision or 0) > 18:
+            # the back-end stores a chunk of these as int64 or as decimals depending
+            # on its values, CArrowColumnIterator returns objects for both
+            return "object"
+        return NUMPY_DTYPES.get(type_name, "object")
+
+    def _arrow_number_format(self, column: ResultMetadataV2) -> str:
+        """Returns the Arrow format of a NUMBER column that the values of every chunk fit in.
+
+        The back-end stores every chunk in the narrowest integers its values fit in,
+        or as decimals for big values, so chunks can have different types.
+        """
+        if column.scale:
+            return f"d:38,{column.scale}" if self._number_to_decimal else "g"
+        if (column.precision or 0) > 18:
+            return "d:38,0"
+        return "l"
+
+    def _declare_number_types(self, schema: Schema) -> Schema:
+        """Returns ``schema`` with the types of its NUMBER columns taken from the metadata."""
+        number_types = {"l": pa.int64(), "g": pa.float64()}
+        fields = []
+        for field, column in zip(schema, self._schema):
+            if FIELD_TYPES[column.type_code].name == "FIXED":
+                field = field.with_type(
+                    number_types.get(self._arrow_number_format(column))
+                    or pa.decimal128(38, column.scale or 0)
+                )
+            fields.append(field)
+        return pa.schema(fields, schema.metadata)
+
+    def _create_empty_numpy(self) -> dict[str, ndarray]:
+        """Returns empty numpy arrays based on schema"""
+        return {
+            column.name: numpy.empty(0, dtype=self._numpy_dtype(column))
+            for column in self._schema
+        }
+
+    def to_numpy(
+        self, connection: SnowflakeConnection | None = None
+    ) -> dict[str, ndarray]:
+        """Returns this batch as a dict with a numpy array per column.
+
+        The arrays are created from the Arrow data without pyarrow or pandas.
+        """
+        record_batches = list(
+            self._create_iter(iter_unit=IterUnit.COLUMN_UNIT, connection=connection)
+        )
+        if not record_batches:
+            return self._create_empty_numpy()
+        return {
+            column.name: concatenate_numpy_arrays(
+                [arrays[i] for arrays in record_batches]
+            )
+            for i, column in enumerate(self._schema)
+        }
+
+    def _get_numpy_iter(
+        self, connection: SnowflakeConnection | None = None
+    ) -> Iterator[dict[str, ndarray]]:
+        """An iterator for this batch which yields a dict of numpy arrays"""
+        iterator_data = []
+        arrays = self.to_numpy(connection=connection)
+        if any(len(array) for array in arrays.values()):
+            iterator_data.append(arrays)
+        return iter(iterator_data)
+
     def to_pandas(
         self, connection: SnowflakeConnection | None = None, **kwargs
     ) -> DataFrame:
@@ -821,6 +1677,7 @@ class ArrowResultBatch(ResultBatch):
         | Iterator[tuple | Exception]
         | Iterator[Table]
         | Iterator[DataFrame]
+        | Iterator[dict[str, ndarray]]
     ):
         """The interface used by ResultSet to create an iterator for this ResultBatch."""
         iter_unit: IterUnit = kwargs.pop("iter_unit", IterUnit.ROW_UNIT)
@@ -828,6 +1685,8 @@ class ArrowResultBatch(ResultBatch):
             structure = kwargs.pop("structure", "pandas")
             if structure == "pandas":
                 return self._get_pandas_iter(connection=connection, **kwargs)
+            elif structure == "numpy":
+                return self._get_numpy_iter(connection=connection)
             else:
                 return self._get_arrow_iter(connection=connection)
         else:
@@ -838,3 +1697,9 @@ class ArrowResultBatch(ResultBatch):
     ) -> Self:
         self._data = self._download(connection=connection).content
         return self
+
+    def prefetch_data(
+        self, connection: SnowflakeConnection | None = None, **kwargs
+    ) -> Self:
+        self._prefetched_data = self._download_to_buffer(connection=connection)
+        return self
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import platform
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from .crl_cache import _get_windows_home_path
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 1 << 20  # bytes read at a time from a cached file
+# bytes of cached chunks that are kept in memory by default
+DEFAULT_RESULT_CHUNK_CACHE_MEMORY_SIZE = 64 << 20
+
+
+class ResultChunkKey(NamedTuple):
+    """Identifies a downloaded result chunk in the ``ResultChunkCache``."""
+
+    query_id: str
+    index: int
+    compressed_size: int
+
+    @property
+    def file_name(self) -> str:
+        digest = hashlib.sha256(f"{self.query_id}/{self.index}".encode()).hexdigest()
+        # the compressed size is part of the name, so a chunk that changed is a miss
+        return f"chunk_{digest}_{self.compressed_size}.arrows"
+
+
+class ResultChunkCache:
+    """A local cache of the decompressed data of downloaded result chunks.
+
+    The chunks are kept in files in ``cache_dir``, up to ``max_size`` bytes. Once
+    that is exceeded, the least recently used files are removed. Chunks of up to
+    ``memory_size`` bytes in total are kept in memory as well, so that repeated reads
+    of the same results do not need to touch the disk.
+
+    Files are written under a temporary name and renamed when a chunk was downloaded
+    completely, so several processes can share a cache directory. Every process only
+    evicts the files it knows about, which are the ones that were in the directory
+    when it created the cache and the ones it wrote itself.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_size: int = 0,
+        memory_size: int = DEFAULT_RESULT_CHUNK_CACHE_MEMORY_SIZE,
+    ) -> None:
+        self._cache_dir = cache_dir or _get_default_result_chunk_cache_path()
+        self.max_size = max_size
+        self.memory_size = memory_size
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[ResultChunkKey, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._file_bytes = 0
+        self.telemetry = {
+            "memory_hit": 0,
+            "disk_hit": 0,
+            "miss": 0,
+            "evicted": 0,
+        }
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_files()
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def _load_files(self) -> None:
+        """Picks up the files that are already in the cache directory, oldest first."""
+        files = []
+        for file in self._cache_dir.glob("chunk_*.arrows"):
+            try:
+                stat_info = file.stat()
+            except OSError:
+                continue
+            files.append((stat_info.st_mtime, file.name, stat_info.st_size))
+        for _, name, size in sorted(files):
+            self._files[name] = size
+            self._file_bytes += size
+        with self._lock:
+            self._evict_files()
+
+    def get(self, key: ResultChunkKey) -> Iterator[bytes] | None:
+        """Returns the pieces of a cached chunk, or None if it is not cached."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.telemetry["memory_hit"] += 1
+                return iter([data])
+            if key.file_name in self._files:
+                self._files.move_to_end(key.file_name)
+        path = self._cache_dir / key.file_name
+        try:
+            cached_file = open(path, "rb")
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.telemetry["miss"] += 1
+                self._forget_file(key.file_name)
+            return None
+        with self._lock:
+            self.telemetry["disk_hit"] += 1
+            if key.file_name not in self._files:
+                # written by another process
+                self._files[key.file_name] = os.fstat(cached_file.fileno()).st_size
+                self._file_bytes += self._files[key.file_name]
+        logger.debug(f"reading result chunk {key.index} of {key.query_id} from disk")
+        return self._read_file(cached_file)
+
+    @staticmethod
+    def _read_file(cached_file) -> Iterator[bytes]:
+        with cached_file:
+            while True:
+                piece = cached_file.read(READ_SIZE)
+                if not piece:
+                    return
+                yield piece
+
+    def store(self, key: ResultChunkKey, pieces: Iterable[bytes]) -> Iterator[bytes]:
+        """Passes the downloaded ``pieces`` of a chunk through and caches them.
+
+        The chunk is only added to the cache once all pieces were consumed. Failing to
+        write the cache file is logged and does not fail the download.
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                prefix="chunk_", suffix=".tmp", dir=self._cache_dir
+            )
+        except OSError as e:
+            logger.warning(f"Failed to cache result chunk {key.index}: {e}")
+            yield from pieces
+            return
+        cached_file = os.fdopen(fd, "wb")
+        keep_in_memory: list[bytes] | None = [] if self.memory_size else None
+        size = 0
+        written = False
+        try:
+            for piece in pieces:
+                if not cached_file.closed:
+                    try:
+                        cached_file.write(piece)
+                    except OSError as e:
+                        logger.warning(f"Failed to cache result chunk {key.index}: {e}")
+                        cached_file.close()
+                size += len(piece)
+                if keep_in_memory is not None:
+                    if size > self.memory_size:
+                        keep_in_memory = None
+                    else:
+                        keep_in_memory.append(bytes(piece))
+                yield piece
+            written = not cached_file.closed
+        finally:
+            cached_file.close()
+            if not written:
+                os.unlink(temp_path)
+        stored = False
+        if written:
+            try:
+                os.replace(temp_path, self._cache_dir / key.file_name)
+                stored = True
+            except OSError as e:
+                logger.warning(f"Failed to cache result chunk {key.index}: {e}")
+                os.unlink(temp_path)
+        with self._lock:
+            if stored:
+                self._forget_file(key.file_name)
+                self._files[key.file_name] = size
+                self._file_bytes += size
+                self._evict_files()
+            if keep_in_memory is not None:
+                self._put_in_memory(key, b"".join(keep_in_memory))
+
+    def _put_in_memory(self, key: ResultChunkKey, data: bytes) -> None:
+        """Adds a chunk to the memory tier, must be called while holding the lock."""
+        self._memory_bytes -= len(self._memory.pop(key, b""))
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        self._evict_memory()
+
+    def _evict_memory(self) -> None:
+        """Drops the least recently used chunks over the memory size.
+
+        Must be called while holding the lock.
+        """
+        while self._memory and self._memory_bytes > self.memory_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _forget_file(self, name: str) -> None:
+        """Must be called while holding the lock."""
+        self._file_bytes -= self._files.pop(name, 0)
+
+    def _evict_files(self) -> None:
+        """Removes the least recently used files over the size limit.
+
+        Must be called while holding the lock.
+        """
+        while self._files and self._file_bytes > self.max_size:
+            name, size = self._files.popitem(last=False)
+            self._file_bytes -= size
+            self.telemetry["evicted"] += 1
+            try:
+                (self._cache_dir / name).unlink()
+            except OSError:
+                pass
+
+    def resize(self, max_size: int, memory_size: int) -> None:
+        with self._lock:
+            self.max_size = max_size
+            self.memory_size = memory_size
+            self._evict_files()
+            self._evict_memory()
+
+    def clear(self) -> None:
+        """Removes every cached chunk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            max_size, self.max_size = self.max_size, 0
+            self._evict_files()
+            self.max_size = max_size
+
+
+_result_chunk_cache: ResultChunkCache | None = None
+_result_chunk_cache_lock = threading.Lock()
+
+
+def get_result_chunk_cache(
+    cache_dir: Path | str | None,
+    max_size: int,
+    memory_size: int = DEFAULT_RESULT_CHUNK_CACHE_MEMORY_SIZE,
+) -> ResultChunkCache:
+    """Returns the process-wide result chunk cache, creating it if necessary.
+
+    The cache takes the sizes it was last requested with. Only one cache directory is
+    used per process, requests for another one are logged and get the existing cache.
+    """
+    global _result_chunk_cache
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    with _result_chunk_cache_lock:
+        if _result_chunk_cache is None:
+            _result_chunk_cache = ResultChunkCache(cache_dir, max_size, memory_size)
+        else:
+            if cache_dir is not None and cache_dir != _result_chunk_cache.cache_dir:
+                logger.warning(
+                    f"result chunk cache is already using "
+                    f"{_result_chunk_cache.cache_dir}, ignoring {cache_dir}"
+                )
+            _result_chunk_cache.resize(max_size, memory_size)
+        return _result_chunk_cache
+
+
+def current_result_chunk_cache() -> ResultChunkCache | None:
+    """Returns the process-wide result chunk cache if one was created."""
+    return _result_chunk_cache
+
+
+def _get_default_result_chunk_cache_path() -> Path:
+    """Return the default path to cache result chunks in."""
+    if platform.system() == "Windows":
+        return (
+            _get_windows_home_path()
+            / "AppData"
+            / "Local"
+            / "Snowflake"
+            / "Caches"
+            / "result_chunks"
+        )
+    elif platform.system() == "Darwin":
+        return Path.home() / "Library" / "Caches" / "Snowflake" / "result_chunks"
+    else:
+        return Path.home() / ".cache" / "Snowflake" / "result_chunks"
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import bisect
 import inspect
+import itertools
+import threading
 from collections import deque
-from concurrent.futures import ALL_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, wait
 from concurrent.futures.thread import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from logging import getLogger
 from typing import (
     TYPE_CHECKING,
@@ -16,28 +21,214 @@ from typing import (
     overload,
 )
 
+from ._download_executor import (
+    DownloadQueue,
+    SharedDownloadExecutor,
+    get_shared_download_executor,
+    get_shared_process_pool,
+)
 from .constants import IterUnit
 from .errors import NotSupportedError
 from .options import pandas
 from .options import pyarrow as pa
 from .result_batch import (
+    SHARED_DATA_SUPPORTED,
     ArrowResultBatch,
+    DownloadCancelled,
     DownloadMetrics,
     JSONResultBatch,
     ResultBatch,
+    cancellable_downloads,
+    concatenate_numpy_arrays,
 )
 from .telemetry import TelemetryField
 from .time_util import get_time_millis
 
 if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
     from pandas import DataFrame
-    from pyarrow import Table
+    from pyarrow import RecordBatch, RecordBatchReader, Table
 
     from snowflake.connector.cursor import SnowflakeCursor
 
 logger = getLogger(__name__)
 
 
+class PrefetchWindow:
+    """Decides how many ``ResultBatch`` downloads may be in flight at once.
+
+    Without a memory limit this is a fixed window of ``max_size`` batches, which is
+    how result sets have always been prefetched.
+
+    With a memory limit, batches are only scheduled while the uncompressed size of
+    every batch that was submitted but not yet consumed fits into the limit. A single
+    batch is always allowed so that iteration can make progress. The window is also
+    adapted to the consumer: if the consumer had to wait for a download the window
+    grows, if downloads are piling up faster than they are consumed it shrinks.
+    """
+
+    def __init__(self, max_size: int, memory_limit: int | None = None) -> None:
+        self.max_size = max(1, max_size)
+        self.memory_limit = memory_limit
+        self.size = self.max_size
+        self._in_flight: Deque[int] = deque()
+        self._consuming = 0
+        self.bytes_in_flight = 0
+
+    @property
+    def adaptive(self) -> bool:
+        return self.memory_limit is not None
+
+    def can_submit(self, batch: ResultBatch) -> bool:
+        """Whether a download of ``batch`` may be started right now."""
+        if len(self._in_flight) >= self.size:
+            return False
+        if not self.adaptive or (not self._in_flight and not self._consuming):
+            return True
+        return self.bytes_in_flight + _batch_size(batch) <= self.memory_limit
+
+    def submitted(self, batch: ResultBatch) -> None:
+        size = _batch_size(batch)
+        self._in_flight.append(size)
+        self.bytes_in_flight += size
+
+    def start_consuming(
+        self, waited: bool, next_ready: bool, position: int = 0
+    ) -> None:
+        """Moves an in-flight batch into consumption and adapts the window.
+
+        ``position`` is the index of the batch among the in-flight ones, batches are
+        consumed oldest first unless they are consumed in completion order.
+        ``waited`` tells whether its download was still running when the consumer
+        asked for it and ``next_ready`` whether another batch already finished.
+        """
+        self._consuming = self._in_flight[position]
+        del self._in_flight[position]
+        if not self.adaptive:
+            return
+        if waited and self.size < self.max_size:
+            self.size += 1
+            logger.debug(f"consumer is waiting on downloads, prefetching {self.size}")
+        elif not waited and next_ready and self.size > 1:
+            self.size -= 1
+            logger.debug(f"consumer is behind downloads, prefetching {self.size}")
+
+    def finish_consuming(self) -> None:
+        self.bytes_in_flight -= self._consuming
+        self._consuming = 0
+
+
+class SpillBudget:
+    """Decides which downloaded ``ArrowResultBatch`` es are spilled to disk.
+
+    Batches are downloaded into memory as long as the uncompressed size of the batches
+    that were downloaded into memory but not consumed yet fits into ``memory_limit``.
+    The ones after that are written to files in ``directory`` and memory-mapped back
+    when the consumer reaches them.
+    """
+
+    def __init__(self, memory_limit: int, directory: str | None = None) -> None:
+        self.memory_limit = memory_limit
+        self.directory = directory
+        self.bytes_held = 0
+        self._held: dict[Future, int] = {}
+
+    def should_spill(self, batch: ResultBatch) -> bool:
+        return (
+            isinstance(batch, ArrowResultBatch)
+            and self.bytes_held + _batch_size(batch) > self.memory_limit
+        )
+
+    def submitted(self, future: Future, batch: ResultBatch, spilled: bool) -> None:
+        if not spilled:
+            self._held[future] = _batch_size(batch)
+            self.bytes_held += self._held[future]
+
+    def consumed(self, future: Future) -> None:
+        self.bytes_held -= self._held.pop(future, 0)
+
+
+def _release_unconsumed_batches(
+    unconsumed_batches: Iterable[Future[Iterator[tuple]]],
+) -> None:
+    """Frees shared memory and spill files of batches that were never consumed.
+
+    Leaving the pool executor waited for the downloads, so the futures are done.
+    """
+    for future in unconsumed_batches:
+        if future.cancelled() or future.exception():
+            continue
+        batch = future.result()
+        if isinstance(batch, ResultBatch):
+            batch.release_prefetched_data()
+        if isinstance(batch, ArrowResultBatch):
+            batch.release_shared_data()
+            batch.release_spilled_data()
+
+
+def _drop_downloads(futures: Iterable[Future[ResultBatch]]) -> None:
+    """Cancels downloads that are not going to be consumed.
+
+    The ones that already started are released once they finish.
+    """
+    for future in futures:
+        if not future.cancel():
+            future.add_done_callback(lambda done: _release_unconsumed_batches([done]))
+
+
+def _batch_size(batch: ResultBatch) -> int:
+    return batch.uncompressed_size or 0
+
+
+def _run_cancellable(
+    cancelled: threading.Event, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+) -> Any:
+    with cancellable_downloads(cancelled):
+        return fn(*args, **kwargs)
+
+
+def partition_batches(
+    batches: list[ResultBatch], num_partitions: int
+) -> list[list[ResultBatch]]:
+    """Splits ``batches`` into up to ``num_partitions`` lists of about the same size.
+
+    The biggest batches are handed out first, each to the partition with the fewest
+    bytes so far, by the uncompressed sizes the back-end reported. Every partition
+    keeps the batches in result order and none of them is empty.
+    """
+    partitions: list[list[int]] = [[] for _ in range(min(num_partitions, len(batches)))]
+    sizes = [0] * len(partitions)
+    for idx in sorted(
+        range(len(batches)), key=lambda idx: _batch_size(batches[idx]), reverse=True
+    ):
+        target = min(
+            range(len(partitions)),
+            key=lambda part: (sizes[part], len(partitions[part])),
+        )
+        partitions[target].append(idx)
+        sizes[target] += _batch_size(batches[idx])
+    return [[batches[idx] for idx in sorted(indexes)] for indexes in partitions]
+
+
+def _next_future(
+    futures: Deque[Future[Iterator[tuple]]], ordered: bool
+) -> tuple[int, bool, bool]:
+    """Picks the future to consume next out of ``futures``.
+
+    Returns its position, whether it was still running when the consumer asked for it,
+    and whether another one is done already. Unless ``ordered``, this is the oldest
+    future that is done, waiting for the first one to finish if none is.
+    """
+    if ordered:
+        waited = not futures[0].done()
+        return 0, waited, len(futures) > 1 and futures[1].done()
+    waited = not any(future.done() for future in futures)
+    if waited:
+        wait(futures, return_when=FIRST_COMPLETED)
+    done = [position for position, future in enumerate(futures) if future.done()]
+    return done[0], waited, len(done) > 1
+
+
 def result_set_iterator(
     first_batch_iter: Iterator[tuple],
     unconsumed_batches: Deque[Future[Iterator[tuple]]],
@@ -45,6 +236,13 @@ def result_set_iterator(
     final: Callable[[], None],
     prefetch_thread_num: int,
     use_mp: bool,
+    prefetch_memory_limit: int | None = None,
+    download_executor: SharedDownloadExecutor | None = None,
+    ordered: bool = True,
+    spill_budget: SpillBudget | None = None,
+    prefetched: Iterable[tuple[ResultBatch, Future[ResultBatch]]] = (),
+    on_cancel: Callable[[int], None] | None = None,
+    cancelled: threading.Event | None = None,
     **kw: Any,
 ) -> Iterator[dict | Exception] | Iterator[tuple | Exception] | Iterator[Table]:
     """Creates an iterator over some other iterators.
@@ -57,15 +255,80 @@ def result_set_iterator(
 
     Just like ``ResultBatch`` iterator, this might yield an ``Exception`` to allow users
     to continue iterating through the rest of the ``ResultBatch``.
+
+    When a shared ``download_executor`` is given, downloads are submitted into a fair
+    queue of it rather than into a thread pool owned by this iterator.
+
+    With ``use_mp`` the downloads run in the process-wide pool of worker processes,
+    which hand Arrow batches back in shared memory instead of pickling their data.
+
+    Unless ``ordered``, downloaded batches are consumed in the order their downloads
+    finish, so a slow download does not hold back the batches after it.
+
+    With a ``spill_budget``, Arrow batches that do not fit into its memory limit are
+    downloaded to disk and read back from there when they are consumed.
+
+    ``prefetched`` are the downloads of the batches before ``unfetched_batches`` that
+    were already started by ``ResultSet.prefetch``, they are consumed first.
+
+    If the iterator is closed before all batches were consumed, the downloads that
+    did not start yet are dropped and the ones in threads are stopped without being
+    retried, by setting ``cancelled``. The ``prefetched`` downloads have to watch the
+    same event. ``on_cancel`` is called with the uncompressed size of their batches.
     """
     is_fetch_all = kw.pop("is_fetch_all", False)
+    if cancelled is None:
+        cancelled = threading.Event()
+    # the batches of the futures in unconsumed_batches
+    submitted_batches: dict[Future, ResultBatch] = {}
+
+    def cancel_downloads() -> None:
+        if not unconsumed_batches:
+            return
+        cancelled.set()
+        for future in unconsumed_batches:
+            future.cancel()
+
+    def report_cancelled() -> None:
+        if not cancelled.is_set() or on_cancel is None:
+            return
+        # the downloads of this iterator that never started or were stopped
+        on_cancel(
+            sum(
+                _batch_size(submitted_batches[future])
+                for future in unconsumed_batches
+                if future.cancelled()
+                or (
+                    future.done()
+                    and isinstance(future.exception(), DownloadCancelled)
+                )
+            )
+        )
+
+    @contextmanager
+    def create_pool_executor() -> Iterator[ThreadPoolExecutor | DownloadQueue]:
+        try:
+            with open_pool() as pool:
+                try:
+                    yield pool
+                finally:
+                    # stop the downloads nobody is going to consume before the pool
+                    # waits for them
+                    cancel_downloads()
+        finally:
+            # batches that were not consumed because iteration stopped early
+            # still hold shared memory or spill files
+            _release_unconsumed_batches(unconsumed_batches)
+            report_cancelled()
 
     if use_mp:
 
-        def create_pool_executor() -> ProcessPoolExecutor:
-            return ProcessPoolExecutor(prefetch_thread_num)
+        def open_pool() -> DownloadQueue:
+            return get_shared_process_pool(prefetch_thread_num).queue()
 
         def create_fetch_task(batch: ResultBatch):
+            if SHARED_DATA_SUPPORTED and isinstance(batch, ArrowResultBatch):
+                return batch.populate_shared_data
             return batch.populate_data
 
         def get_fetch_result(future_result: ResultBatch):
@@ -74,48 +337,80 @@ def result_set_iterator(
         kw["connection"] = None
     else:
 
-        def create_pool_executor() -> ThreadPoolExecutor:
+        def open_pool() -> ThreadPoolExecutor | DownloadQueue:
+            if download_executor is not None:
+                return download_executor.queue()
             return ThreadPoolExecutor(prefetch_thread_num)
 
         def create_fetch_task(batch: ResultBatch):
             return batch.create_iter
 
-        def get_fetch_result(future_result: Iterator):
+        def get_fetch_result(future_result: Iterator | ResultBatch):
+            if isinstance(future_result, ResultBatch):
+                # the batch was spilled to disk or prefetched
+                return future_result.create_iter(**kw)
             return future_result
 
+    def submit(
+        pool: ThreadPoolExecutor | DownloadQueue, batch: ResultBatch
+    ) -> Future[Iterator[tuple]]:
+        logger.debug(f"queuing download of result batch id: {batch.id}")
+        spilled = spill_budget is not None and spill_budget.should_spill(batch)
+        if spilled:
+            task = partial(batch.populate_spilled_data, spill_budget.directory)
+        else:
+            task = create_fetch_task(batch)
+        if not use_mp:
+            # the downloads of a thread can be stopped, unlike the ones of a process
+            task = partial(_run_cancellable, cancelled, task)
+        future = pool.submit(task, **kw)
+        submitted_batches[future] = batch
+        if spill_budget is not None:
+            spill_budget.submitted(future, batch, spilled)
+        return future
+
+    def consumed(future: Future[Iterator[tuple]]) -> None:
+        del submitted_batches[future]
+        if spill_budget is not None:
+            spill_budget.consumed(future)
+
+    prefetched = list(prefetched)
+    for batch, future in prefetched:
+        unconsumed_batches.append(future)
+        submitted_batches[future] = batch
+        if spill_budget is not None:
+            spill_budget.submitted(future, batch, False)
+
     if is_fetch_all:
         with create_pool_executor() as pool:
             logger.debug("beginning to schedule result batch downloads")
             yield from first_batch_iter
             while unfetched_batches:
-                logger.debug(
-                    f"queuing download of result batch id: {unfetched_batches[0].id}"
-                )
-                future = pool.submit(
-                    create_fetch_task(unfetched_batches.popleft()), **kw
-                )
-                unconsumed_batches.append(future)
+                unconsumed_batches.append(submit(pool, unfetched_batches.popleft()))
             _, _ = wait(unconsumed_batches, return_when=ALL_COMPLETED)
             i = 1
             while unconsumed_batches:
                 logger.debug(f"user began consuming result batch {i}")
-                yield from get_fetch_result(unconsumed_batches.popleft().result())
+                future = unconsumed_batches.popleft()
+                yield from get_fetch_result(future.result())
+                consumed(future)
                 logger.debug(f"user began consuming result batch {i}")
                 i += 1
         final()
     else:
+        window = PrefetchWindow(prefetch_thread_num, prefetch_memory_limit)
+        for batch, _ in prefetched:
+            window.submitted(batch)
         with create_pool_executor() as pool:
-            # Fill up window
 
-            logger.debug("beginning to schedule result batch downloads")
+            def fill_window() -> None:
+                while unfetched_batches and window.can_submit(unfetched_batches[0]):
+                    batch = unfetched_batches.popleft()
+                    unconsumed_batches.append(submit(pool, batch))
+                    window.submitted(batch)
 
-            for _ in range(min(prefetch_thread_num, len(unfetched_batches))):
-                logger.debug(
-                    f"queuing download of result batch id: {unfetched_batches[0].id}"
-                )
-                unconsumed_batches.append(
-                    pool.submit(create_fetch_task(unfetched_batches.popleft()), **kw)
-                )
+            logger.debug("beginning to schedule result batch downloads")
+            fill_window()
 
             yield from first_batch_iter
 
@@ -123,17 +418,14 @@ def result_set_iterator(
             while unconsumed_batches:
                 logger.debug(f"user requesting to consume result batch {i}")
 
-                # Submit the next un-fetched batch to the pool
-                if unfetched_batches:
-                    logger.debug(
-                        f"queuing download of result batch id: {unfetched_batches[0].id}"
-                    )
-                    future = pool.submit(
-                        create_fetch_task(unfetched_batches.popleft()), **kw
-                    )
-                    unconsumed_batches.append(future)
-
-                future = unconsumed_batches.popleft()
+                position, waited, next_ready = _next_future(
+                    unconsumed_batches, ordered
+                )
+                future = unconsumed_batches[position]
+                del unconsumed_batches[position]
+                window.start_consuming(waited, next_ready, position)
+                # Submit the next un-fetched batches to the pool
+                fill_window()
 
                 # this will raise an exception if one has occurred
                 batch_iterator = get_fetch_result(future.result())
@@ -142,6 +434,11 @@ def result_set_iterator(
                 yield from batch_iterator
                 logger.debug(f"user finished consuming result batch {i}")
 
+                window.finish_consuming()
+                consumed(future)
+                # The consumed batch might have been the only thing holding back
+                # the next download when running with a memory limit
+                fill_window()
                 i += 1
         final()
 
@@ -158,6 +455,13 @@ class ResultSet(Iterable[list]):
 
     Currently we do not support mixing multiple ``ResultBatch`` types and having
     different column definitions types per ``ResultBatch``.
+
+    With a ``spill_memory_limit``, downloaded Arrow batches that have not been
+    consumed yet are written to ``spill_directory`` once their uncompressed sizes
+    exceed the limit, see ``SpillBudget``.
+
+    ``prefetch`` starts downloading the first batches before an iterator is created,
+    the first iterator picks up those downloads.
     """
 
     def __init__(
@@ -166,17 +470,103 @@ class ResultSet(Iterable[list]):
         result_chunks: list[JSONResultBatch] | list[ArrowResultBatch],
         prefetch_thread_num: int,
         use_mp: bool,
+        prefetch_memory_limit: int | None = None,
+        download_executor: SharedDownloadExecutor | None = None,
+        spill_memory_limit: int | None = None,
+        spill_directory: str | None = None,
     ) -> None:
         self.batches = result_chunks
         self._cursor = cursor
         self.prefetch_thread_num = prefetch_thread_num
         self._use_mp = use_mp
+        self.prefetch_memory_limit = prefetch_memory_limit
+        self._download_executor = download_executor
+        self.spill_memory_limit = spill_memory_limit
+        self.spill_directory = spill_directory
+        # downloads started by prefetch, by the index of their batch
+        self._prefetched: dict[int, Future[ResultBatch]] = {}
+        # stops the downloads started by prefetch
+        self._prefetch_cancelled = threading.Event()
+        # the index of the first row of every batch, built when first seeking
+        self._row_offsets: list[int] | None = None
+
+    def prefetch(self) -> None:
+        """Starts downloading the first remote batches in the background.
+
+        As many batches are downloaded as the prefetch window of an iterator would
+        start with, so the memory held by them is bounded by ``prefetch_thread_num``
+        and ``prefetch_memory_limit`` as well.
+        """
+        if self._prefetched:
+            return
+        window = PrefetchWindow(self.prefetch_thread_num, self.prefetch_memory_limit)
+        remote_batches = []
+        for index, batch in enumerate(self.batches):
+            if batch._local and index == 0:
+                # the first batch usually came with the response
+                continue
+            if batch._local or not window.can_submit(batch):
+                break
+            window.submitted(batch)
+            remote_batches.append((index, batch))
+        if not remote_batches:
+            return
+        if self._download_executor is not None:
+            pool = self._download_executor.queue()
+        else:
+            pool = ThreadPoolExecutor(len(remote_batches))
+        connection = self._cursor.connection
+        cancelled = self._prefetch_cancelled
+        for index, batch in remote_batches:
+            logger.debug(f"prefetching result batch id: {batch.id}")
+            self._prefetched[index] = pool.submit(
+                partial(_run_cancellable, cancelled, batch.prefetch_data),
+                connection=connection,
+            )
+        # the downloads keep running, the threads exit once they are done
+        pool.shutdown(wait=False)
+
+    def _wait_for_prefetch(self, first: int = 0) -> dict[int, Future[ResultBatch]]:
+        """Hands the prefetched downloads over, waiting for the one of the first batch.
+
+        The batch at index ``first`` is iterated over right away instead of through a
+        future. The downloads watch the event that was ``_prefetch_cancelled`` before.
+        """
+        prefetched, self._prefetched = self._prefetched, {}
+        self._prefetch_cancelled = threading.Event()
+        if first in prefetched:
+            wait([prefetched.pop(first)])
+        return prefetched
+
+    def cancel_prefetch(self) -> None:
+        """Stops the downloads started by ``prefetch`` that were not handed over to an
+        iterator, and releases their data."""
+        prefetched, self._prefetched = self._prefetched, {}
+        if not prefetched:
+            return
+        logger.debug(f"cancelling {len(prefetched)} prefetched result batch downloads")
+        self._prefetch_cancelled.set()
+        _drop_downloads(prefetched.values())
+
+    def _find_batch(self, row: int) -> tuple[int, int]:
+        """Returns the index of the batch holding ``row`` and the index of its first row.
+
+        The row counts of the batches are known from the query response, so this does
+        not download anything. Rows past the end are looked up in the last batch.
+        """
+        if self._row_offsets is None:
+            row_counts = (batch.rowcount for batch in self.batches)
+            self._row_offsets = list(itertools.accumulate(row_counts, initial=0))
+        index = min(
+            bisect.bisect_right(self._row_offsets, row) - 1, len(self.batches) - 1
+        )
+        return index, self._row_offsets[index]
 
     def _report_metrics(self) -> None:
         """Report all metrics totalled up.
 
-        This includes TIME_CONSUME_LAST_RESULT, TIME_DOWNLOADING_CHUNKS and
-        TIME_PARSING_CHUNKS in that order.
+        This includes TIME_CONSUME_LAST_RESULT, TIME_DOWNLOADING_CHUNKS,
+        TIME_PARSING_CHUNKS and BYTES_SPILLED_CHUNKS in that order.
         """
         if self._cursor._first_chunk_time is not None:
             time_consume_last_result = (
@@ -196,6 +586,59 @@ class ResultSet(Iterable[list]):
                 TelemetryField.TIME_PARSING_CHUNKS,
                 metrics.get(DownloadMetrics.parse.value),
             )
+        if DownloadMetrics.spilled.value in metrics:
+            logger.debug(
+                f"spilled {metrics[DownloadMetrics.spilled.value]} bytes of result "
+                f"batches to disk"
+            )
+            self._cursor._log_telemetry_job_data(
+                TelemetryField.BYTES_SPILLED_CHUNKS,
+                metrics.get(DownloadMetrics.spilled.value),
+            )
+
+    def _report_cancelled(self, cancelled_bytes: int) -> None:
+        """Reports the size of the batches whose downloads an iterator cancelled."""
+        logger.debug(
+            f"cancelled downloading {cancelled_bytes} bytes of result batches that "
+            f"were not consumed"
+        )
+        self._cursor._log_telemetry_job_data(
+            TelemetryField.BYTES_CANCELLED_CHUNKS, cancelled_bytes
+        )
+
+    def _partition(self, num_partitions: int) -> list[ResultSet]:
+        """Splits the batches into up to ``num_partitions`` independent result sets.
+
+        The result sets download their batches through one shared executor and split
+        the prefetch window and memory limits of this result set between them.
+        """
+        # the partitions iterate the batches on their own, the prefetched data is
+        # used once the downloads finished
+        wait(list(self._wait_for_prefetch().values()))
+        partitions = partition_batches(self.batches, num_partitions)
+        if not partitions:
+            return []
+        prefetch_thread_num = -(-self.prefetch_thread_num // len(partitions))
+        memory_limit, spill_memory_limit = (
+            limit // len(partitions) if limit is not None else None
+            for limit in (self.prefetch_memory_limit, self.spill_memory_limit)
+        )
+        download_executor = self._download_executor or get_shared_download_executor(
+            self.prefetch_thread_num
+        )
+        return [
+            ResultSet(
+                self._cursor,
+                batches,
+                prefetch_thread_num,
+                self._use_mp,
+                memory_limit,
+                download_executor=download_executor,
+                spill_memory_limit=spill_memory_limit,
+                spill_directory=self.spill_directory,
+            )
+            for batches in partitions
+        ]
 
     def _finish_iterating(self) -> None:
         """Used for any cleanup after the result set iterator is done."""
@@ -214,10 +657,13 @@ class ResultSet(Iterable[list]):
 
     def _fetch_arrow_batches(
         self,
+        ordered: bool = True,
     ) -> Iterator[Table]:
         """Fetches all the results as Arrow Tables, chunked by Snowflake back-end."""
         self._can_create_arrow_iter()
-        return self._create_iter(iter_unit=IterUnit.TABLE_UNIT, structure="arrow")
+        return self._create_iter(
+            iter_unit=IterUnit.TABLE_UNIT, structure="arrow", ordered=ordered
+        )
 
     @overload
     def _fetch_arrow_all(self, force_return_table: Literal[False]) -> Table | None: ...
@@ -233,6 +679,68 @@ class ResultSet(Iterable[list]):
         else:
             return self.batches[0].to_arrow() if force_return_table else None
 
+    def _fetch_arrow_reader(self) -> RecordBatchReader:
+        """Fetches all the results as a pyarrow RecordBatchReader.
+
+        The types of the NUMBER columns are declared by the result metadata, the
+        other ones are taken from the first result batch, which is converted when the
+        reader is created. The other batches are downloaded while the reader is read,
+        their record batches are cast to that schema if they were converted to other
+        types, for example narrower integers.
+        """
+        tables = self._fetch_arrow_batches()
+        first_table = next(tables, None)
+        if first_table is None:
+            return pa.RecordBatchReader.from_batches(
+                self.batches[0]._declare_number_types(
+                    self.batches[0]._create_empty_table().schema
+                ),
+                [],
+            )
+        schema = self.batches[0]._declare_number_types(first_table.schema)
+
+        def record_batches(table: Table | None) -> Iterator[RecordBatch]:
+            # tables are dropped once their record batches were read
+            while table is not None:
+                if not table.schema.equals(schema):
+                    table = table.cast(schema)
+                yield from table.to_batches()
+                table = next(tables, None)
+
+        return pa.RecordBatchReader.from_batches(schema, record_batches(first_table))
+
+    def _fetch_arrow_stream(self) -> object:
+        """Fetches all the results as one "arrow_array_stream" PyCapsule.
+
+        Result batches are downloaded while the consumer reads the stream.
+        """
+        from .nanoarrow_arrow_iterator import chain_arrow_array_streams
+
+        self._can_create_arrow_iter()
+        return chain_arrow_array_streams(
+            self._create_iter(iter_unit=IterUnit.STREAM_UNIT),
+            self.batches[0]._create_empty_arrow_schema,
+        )
+
+    def _fetch_numpy_batches(
+        self, ordered: bool = True
+    ) -> Iterator[dict[str, ndarray]]:
+        """Fetches all the results as dicts of NumPy arrays, chunked by Snowflake back-end."""
+        self._can_create_arrow_iter()
+        return self._create_iter(
+            iter_unit=IterUnit.TABLE_UNIT, structure="numpy", ordered=ordered
+        )
+
+    def _fetch_numpy_all(self) -> dict[str, ndarray]:
+        """Fetches a single dict of NumPy arrays from all of the ``ResultBatch``."""
+        batches = list(self._fetch_numpy_batches())
+        if batches:
+            return {
+                name: concatenate_numpy_arrays([arrays[name] for arrays in batches])
+                for name in batches[0]
+            }
+        return self.batches[0].to_numpy()
+
     def _fetch_pandas_batches(self, **kwargs) -> Iterator[DataFrame]:
         """Fetches Pandas dataframes in batches, where batch refers to Snowflake Chunk.
 
@@ -283,22 +791,45 @@ class ResultSet(Iterable[list]):
 
         This function is a helper function to ``__iter__`` and it was introduced for the
         cases where we need to propagate some values to later ``_download`` calls.
+
+        With a ``start_row`` keyword argument the iterator starts at that row, the
+        batches before the one holding it are not downloaded.
         """
-        # pop is_fetch_all and pass it to result_set_iterator
+        # pop is_fetch_all and ordered and pass them to result_set_iterator
         is_fetch_all = kwargs.pop("is_fetch_all", False)
+        ordered = kwargs.pop("ordered", True)
+        start_row = kwargs.pop("start_row", 0)
 
         # add connection so that result batches can use sessions
         kwargs["connection"] = self._cursor.connection
 
-        first_batch_iter = self.batches[0].create_iter(**kwargs)
+        first, first_batch_row = self._find_batch(start_row) if start_row else (0, 0)
+        # the iterator stops the prefetched downloads when it is closed
+        cancelled = self._prefetch_cancelled
+        prefetched = self._wait_for_prefetch(first)
+        first_batch_iter = self.batches[first].create_iter(**kwargs)
+        if start_row > first_batch_row:
+            first_batch_iter = itertools.islice(
+                first_batch_iter, start_row - first_batch_row, None
+            )
 
         # Iterator[Tuple] Futures that have not been consumed by the user
         unconsumed_batches: Deque[Future[Iterator[tuple]]] = deque()
 
         # batches that have not been fetched
-        unfetched_batches = deque(self.batches[1:])
-        for num, batch in enumerate(unfetched_batches):
+        unfetched_batches = deque(self.batches[first + 1 :])
+        for num, batch in enumerate(unfetched_batches, first):
             logger.debug(f"result batch {num + 1} has id: {batch.id}")
+        # the leading ones of them might already be downloading
+        prefetched_batches = []
+        index = first + 1
+        while index in prefetched:
+            prefetched_batches.append(
+                (unfetched_batches.popleft(), prefetched.pop(index))
+            )
+            index += 1
+        # the ones of the batches before the start row are not consumed
+        _drop_downloads(prefetched.values())
 
         return result_set_iterator(
             first_batch_iter,
@@ -307,7 +838,18 @@ class ResultSet(Iterable[list]):
             self._finish_iterating,
             self.prefetch_thread_num,
             is_fetch_all=is_fetch_all,
+            ordered=ordered,
             use_mp=self._use_mp,
+            prefetch_memory_limit=self.prefetch_memory_limit,
+            download_executor=self._download_executor,
+            spill_budget=(
+                SpillBudget(self.spill_memory_limit, self.spill_directory)
+                if self.spill_memory_limit is not None
+                else None
+            ),
+            prefetched=prefetched_batches,
+            on_cancel=self._report_cancelled,
+            cancelled=cancelled,
             **kwargs,
         )
 
@@ -317,3 +859,42 @@ class ResultSet(Iterable[list]):
         for p in self.batches:
             total += p.rowcount
         return total
+
+
+class ResultPartition:
+    """A share of the results of a query, see ``SnowflakeCursor.partition_results``.
+
+    Iterating a partition yields its rows, the ``fetch_*_batches`` methods yield its
+    result chunks like the ones of ``SnowflakeCursor``. Every iteration starts from
+    the first batch of the partition again. Partitions can be iterated in separate
+    threads, to consume them in other processes send ``batches`` to them.
+    """
+
+    def __init__(self, result_set: ResultSet) -> None:
+        self._result_set = result_set
+
+    @property
+    def batches(self) -> list[ResultBatch]:
+        """The ``ResultBatch`` es of this partition, in result order."""
+        return self._result_set.batches
+
+    @property
+    def rowcount(self) -> int:
+        return self._result_set.total_row_index()
+
+    def __iter__(self) -> Iterator[tuple] | Iterator[dict]:
+        for row in self._result_set:
+            if isinstance(row, Exception):
+                raise row
+            yield row
+
+    def fetch_arrow_batches(self, ordered: bool = True) -> Iterator[Table]:
+        return self._result_set._fetch_arrow_batches(ordered=ordered)
+
+    def fetch_numpy_batches(self, ordered: bool = True) -> Iterator[dict[str, ndarray]]:
+        return self._result_set._fetch_numpy_batches(ordered=ordered)
+
+    def fetch_pandas_batches(
+        self, ordered: bool = True, **kwargs: Any
+    ) -> Iterator[DataFrame]:
+        return self._result_set._fetch_pandas_batches(ordered=ordered, **kwargs)
@@ -24,10 +24,13 @@ class TelemetryField(Enum):
     TIME_CONSUME_LAST_RESULT = "client_time_consume_last_result"
     TIME_DOWNLOADING_CHUNKS = "client_time_downloading_chunks"
     TIME_PARSING_CHUNKS = "client_time_parsing_chunks"
+    BYTES_SPILLED_CHUNKS = "client_bytes_spilled_chunks"
+    BYTES_CANCELLED_CHUNKS = "client_bytes_cancelled_chunks"
     SQL_EXCEPTION = "client_sql_exception"
     OCSP_EXCEPTION = "client_ocsp_exception"
     HTTP_EXCEPTION = "client_http_exception"
     GET_PARTITIONS_USED = "client_get_partitions_used"
+    PARTITION_RESULTS_USED = "client_partition_results_used"
     EMPTY_SEQ_INTERPOLATION = "client_pyformat_empty_seq_interpolation"
     # fetch_pandas_* usage
     PANDAS_FETCH_ALL = "client_fetch_pandas_all"
@@ -35,6 +38,11 @@ class TelemetryField(Enum):
     # fetch_arrow_* usage
     ARROW_FETCH_ALL = "client_fetch_arrow_all"
     ARROW_FETCH_BATCHES = "client_fetch_arrow_batches"
+    ARROW_FETCH_C_STREAM = "client_fetch_arrow_c_stream"
+    ARROW_FETCH_READER = "client_fetch_arrow_reader"
+    # fetch_numpy_* usage
+    NUMPY_FETCH_ALL = "client_fetch_numpy_all"
+    NUMPY_FETCH_BATCHES = "client_fetch_numpy_batches"
     # write_pandas usage
     PANDAS_WRITE = "client_write_pandas"
     # imported packages along with client
@@ -51,6 +51,8 @@ def create_mock_response(status_code: int) -> Mock:
     mock_resp = Mock()
     mock_resp.status_code = status_code
     mock_resp.raw = "success" if status_code == OK else "fail"
+    mock_resp.content = b""
+    mock_resp.iter_content.return_value = iter([])
     return mock_resp
 
 
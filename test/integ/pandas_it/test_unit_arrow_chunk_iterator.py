@@ -4,13 +4,16 @@ from __future__ import annotations
 import datetime
 import decimal
 import os
+import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pytest
 import pytz
 
 from snowflake.connector.arrow_context import ArrowConverterContext
+from snowflake.connector.errors import InterfaceError
 
 try:
     from snowflake.connector.options import installed_pandas
@@ -30,9 +33,15 @@ except ImportError:
     pass
 
 try:
+    from snowflake.connector.nanoarrow_arrow_iterator import (
+        PyArrowColumnIterator as NanoarrowPyArrowColumnIterator,
+    )
     from snowflake.connector.nanoarrow_arrow_iterator import (
         PyArrowRowIterator as NanoarrowPyArrowRowIterator,
     )
+    from snowflake.connector.nanoarrow_arrow_iterator import (
+        PyArrowTableIterator as NanoarrowPyArrowTableIterator,
+    )
 
     no_arrow_iterator_ext = False
 except ImportError:
@@ -366,6 +375,390 @@ def test_iterate_over_time_chunk():
     )
 
 
+def _time_spec(value, scale):
+    """Splits a one field timestamp like the TimeSpec of the C++ converters."""
+    if scale == 0:
+        return value, 0
+    if scale == 6:
+        return 0, value
+    if scale > 6:
+        return 0, value // 10 ** (scale - 6)
+    seconds, fraction = divmod(abs(value), 10**scale)
+    microseconds = fraction * 10 ** (6 - scale)
+    return (-seconds, -microseconds) if value < 0 else (seconds, microseconds)
+
+
+@pytest.mark.skipif(
+    not installed_pandas or no_arrow_iterator_ext,
+    reason="arrow_iterator extension is not built, or pandas option is not installed.",
+)
+@pytest.mark.parametrize("timezone", ["UTC", "America/Los_Angeles", "Asia/Kolkata"])
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_timestamp_conversion_matches_context(timezone, use_numpy):
+    """The native timestamp conversions produce what ArrowConverterContext does."""
+    random.seed(datetime.datetime.now().timestamp())
+    context = ArrowConverterContext({"TIMEZONE": timezone})
+    windows = "_windows" if os.name == "nt" else ""
+    # the edges of datetime, daylight saving time transitions and random values
+    first, last = (-(2**63) // 10**9 + 1, 2**63 // 10**9 - 2) if use_numpy else (
+        -62135596800 + 86400,
+        253402300799 - 86400,
+    )
+    epochs = [first, last, -1, 0, 1678611600, 1699174800]
+    epochs += [random.randint(first, last) for _ in range(200)]
+    epochs += [random.randint(-(10**9), 2 * 10**9) for _ in range(200)]
+    fractions = [random.randint(0, 999999999) for _ in epochs]
+    fractions[:2] = [0, 999999999]
+    timezones = [random.randint(1, 2879) for _ in epochs]
+    scale = 9
+
+    def one_field(scale):
+        return [
+            e * 10**scale + f // 10 ** (9 - scale)
+            for e, f in zip(epochs, fractions)
+            if abs(e * 10**9) < 2**63 - 10**9
+        ]
+
+    columns, expected = [], []
+    for one_field_scale in (0, 3, 6, 9):
+        values = one_field(one_field_scale)
+        columns.append(
+            (
+                pyarrow.array(values, pyarrow.int64()),
+                {"logicalType": "TIMESTAMP_NTZ", "scale": str(one_field_scale)},
+            )
+        )
+        if use_numpy:
+            expected.append(
+                [
+                    context.TIMESTAMP_NTZ_ONE_FIELD_to_numpy_datetime64(
+                        v, one_field_scale
+                    )
+                    for v in values
+                ]
+            )
+        else:
+            expected.append(
+                [
+                    getattr(context, f"TIMESTAMP_NTZ_to_python{windows}")(
+                        *_time_spec(v, one_field_scale)
+                    )
+                    for v in values
+                ]
+            )
+        if not use_numpy:
+            columns.append(
+                (
+                    pyarrow.array(values, pyarrow.int64()),
+                    {"logicalType": "TIMESTAMP_LTZ", "scale": str(one_field_scale)},
+                )
+            )
+            expected.append(
+                [
+                    getattr(context, f"TIMESTAMP_LTZ_to_python{windows}")(
+                        *_time_spec(v, one_field_scale)
+                    )
+                    for v in values
+                ]
+            )
+            columns.append(
+                (
+                    pyarrow.StructArray.from_arrays(
+                        [
+                            pyarrow.array(values, pyarrow.int64()),
+                            pyarrow.array(timezones[: len(values)], pyarrow.int32()),
+                        ],
+                        ["epoch", "timezone"],
+                    ),
+                    {
+                        "logicalType": "TIMESTAMP_TZ",
+                        "scale": str(one_field_scale),
+                        "byteLength": "8",
+                    },
+                )
+            )
+            expected.append(
+                [
+                    getattr(context, f"TIMESTAMP_TZ_to_python{windows}")(
+                        *_time_spec(v, one_field_scale), tz
+                    )
+                    for v, tz in zip(values, timezones)
+                ]
+            )
+
+    def two_field(logical_type, extra=None):
+        arrays = [
+            pyarrow.array(epochs, pyarrow.int64()),
+            pyarrow.array(fractions, pyarrow.int32()),
+        ]
+        names = ["epoch", "fraction"]
+        meta = {"logicalType": logical_type, "scale": str(scale)}
+        if extra:
+            arrays.append(pyarrow.array(timezones, pyarrow.int32()))
+            names.append("timezone")
+            meta["byteLength"] = "16"
+        return pyarrow.StructArray.from_arrays(arrays, names), meta
+
+    columns.append(two_field("TIMESTAMP_NTZ"))
+    if use_numpy:
+        expected.append(
+            [
+                context.TIMESTAMP_NTZ_TWO_FIELD_to_numpy_datetime64(e, f)
+                for e, f in zip(epochs, fractions)
+            ]
+        )
+    else:
+        expected.append(
+            [
+                getattr(context, f"TIMESTAMP_NTZ_to_python{windows}")(e, f // 1000)
+                for e, f in zip(epochs, fractions)
+            ]
+        )
+        columns.append(two_field("TIMESTAMP_LTZ"))
+        expected.append(
+            [
+                getattr(context, f"TIMESTAMP_LTZ_to_python{windows}")(e, f // 1000)
+                for e, f in zip(epochs, fractions)
+            ]
+        )
+        columns.append(two_field("TIMESTAMP_TZ", extra=True))
+        expected.append(
+            [
+                getattr(context, f"TIMESTAMP_TZ_to_python{windows}")(
+                    e, f // 1000, tz
+                )
+                for e, f, tz in zip(epochs, fractions, timezones)
+            ]
+        )
+
+    for (array, meta), expected_values in zip(columns, expected):
+        stream = BytesIO()
+        field = pyarrow.field("column", array.type, True, meta)
+        with RecordBatchStreamWriter(stream, pyarrow.schema([field])) as writer:
+            writer.write_batch(RecordBatch.from_arrays([array], ["column"]))
+        it = NanoarrowPyArrowRowIterator(
+            None, stream.getvalue(), context, False, use_numpy, False, True
+        )
+        values = [row[0] for row in it]
+        assert values == expected_values, meta
+        # the same tzinfo, so that utcoffset and dst behave the same way
+        assert [getattr(v, "tzinfo", None) for v in values] == [
+            getattr(v, "tzinfo", None) for v in expected_values
+        ], meta
+
+
+@pytest.mark.skipif(
+    not installed_pandas or no_arrow_iterator_ext,
+    reason="arrow_iterator extension is not built, or pandas option is not installed.",
+)
+@pytest.mark.parametrize(
+    "logical_type,use_numpy,value,error",
+    [
+        ("TIMESTAMP_NTZ", False, 253402300800, "year 10000 is out of range"),
+        ("TIMESTAMP_LTZ", False, -62135596800, "date value out of range"),
+        ("TIMESTAMP_NTZ", True, 2**62, "int too big to convert"),
+    ],
+)
+def test_timestamp_conversion_out_of_range(logical_type, use_numpy, value, error):
+    """Values that datetime can not represent raise the errors they used to."""
+    context = ArrowConverterContext({"TIMEZONE": "America/Los_Angeles"})
+    meta = {"logicalType": logical_type, "scale": "0"}
+    field = pyarrow.field("column", pyarrow.int64(), True, meta)
+    stream = BytesIO()
+    with RecordBatchStreamWriter(stream, pyarrow.schema([field])) as writer:
+        writer.write_batch(
+            RecordBatch.from_arrays(
+                [pyarrow.array([value], pyarrow.int64())], ["column"]
+            )
+        )
+    it = NanoarrowPyArrowRowIterator(
+        None, stream.getvalue(), context, False, use_numpy, False, True
+    )
+    with pytest.raises(InterfaceError, match=error):
+        next(it)
+
+
+@pytest.mark.skipif(
+    not installed_pandas or no_arrow_iterator_ext,
+    reason="arrow_iterator extension is not built, or pandas option is not installed.",
+)
+def test_table_conversion_in_threads(caplog):
+    """Tables converted concurrently, with the GIL released, match serial ones."""
+    context = ArrowConverterContext({"TIMEZONE": "America/Los_Angeles"})
+    row_count = 10000
+    epochs = [random.randint(0, 2 * 10**9) for _ in range(row_count)]
+    fractions = [random.randint(0, 999999999) for _ in range(row_count)]
+    timestamp = pyarrow.StructArray.from_arrays(
+        [pyarrow.array(epochs, pyarrow.int64()), pyarrow.array(fractions)],
+        ["epoch", "fraction"],
+    )
+    arrays = [
+        pyarrow.array(epochs, pyarrow.int64()),
+        timestamp,
+        timestamp,
+        pyarrow.array(fractions, pyarrow.int64()),
+    ]
+    column_meta = [
+        {"logicalType": "FIXED", "precision": "18", "scale": "2"},
+        {"logicalType": "TIMESTAMP_NTZ", "scale": "9"},
+        {"logicalType": "TIMESTAMP_LTZ", "scale": "9"},
+        {"logicalType": "TIME", "scale": "9"},
+    ]
+    fields = [
+        pyarrow.field(f"column_{i}", array.type, True, meta)
+        for i, (array, meta) in enumerate(zip(arrays, column_meta))
+    ]
+    names = [field.name for field in fields]
+    stream = BytesIO()
+    with RecordBatchStreamWriter(stream, pyarrow.schema(fields)) as writer:
+        for _ in range(3):
+            writer.write_batch(RecordBatch.from_arrays(arrays, names))
+    data = stream.getvalue()
+
+    def convert(_):
+        return next(
+            NanoarrowPyArrowTableIterator(
+                None, data, context, False, False, False, False
+            )
+        )
+
+    # converting scaled numbers logs, which needs the GIL again
+    with caplog.at_level(logging.DEBUG, "snowflake.connector"):
+        expected = convert(None)
+        with ThreadPoolExecutor(8) as executor:
+            tables = list(executor.map(convert, range(16)))
+    assert expected.num_rows == 3 * row_count
+    assert expected.column(0)[0].as_py() == epochs[0] / 100
+    assert all(table.equals(expected) for table in tables)
+    assert "Convert fixed number column to double column" in caplog.text
+
+
+@pytest.mark.skipif(
+    not installed_pandas or no_arrow_iterator_ext,
+    reason="arrow_iterator extension is not built, or pandas option is not installed.",
+)
+def test_column_conversion():
+    """Columns are converted to NumPy arrays that hold the fetched row values."""
+    import numpy
+
+    context = ArrowConverterContext({"TIMEZONE": "America/Los_Angeles"})
+    timestamp = pyarrow.StructArray.from_arrays(
+        [
+            pyarrow.array([1, None, 1600000000], pyarrow.int64()),
+            pyarrow.array([5, 0, 123456789], pyarrow.int32()),
+        ],
+        ["epoch", "fraction"],
+        mask=pyarrow.array([False, True, False]),
+    )
+    columns = [
+        (
+            pyarrow.array([1, None, 3], pyarrow.int8()),
+            {"logicalType": "FIXED", "precision": "2", "scale": "0"},
+        ),
+        (
+            pyarrow.array([123, 456, 789], pyarrow.int32()),
+            {"logicalType": "FIXED", "precision": "9", "scale": "2"},
+        ),
+        (
+            pyarrow.array(
+                [decimal.Decimal("1"), None, decimal.Decimal(10**30)],
+                pyarrow.decimal128(38, 0),
+            ),
+            {"logicalType": "FIXED", "precision": "38", "scale": "0"},
+        ),
+        (pyarrow.array([1.5, 2.5, None]), {"logicalType": "REAL"}),
+        (pyarrow.array([True, None, False]), {"logicalType": "BOOLEAN"}),
+        (pyarrow.array([0, 19000, None], pyarrow.int32()), {"logicalType": "DATE"}),
+        (timestamp, {"logicalType": "TIMESTAMP_NTZ", "scale": "9"}),
+        (
+            pyarrow.array([1000, 2000, 3000], pyarrow.int64()),
+            {"logicalType": "TIMESTAMP_LTZ", "scale": "3"},
+        ),
+        (pyarrow.array(["a", None, "c"]), {"logicalType": "TEXT"}),
+    ]
+    fields = [
+        pyarrow.field(f"column_{i}", array.type, True, meta)
+        for i, (array, meta) in enumerate(columns)
+    ]
+    stream = BytesIO()
+    with RecordBatchStreamWriter(stream, pyarrow.schema(fields)) as writer:
+        for _ in range(2):
+            writer.write_batch(
+                RecordBatch.from_arrays(
+                    [array for array, _ in columns], [field.name for field in fields]
+                )
+            )
+    it = NanoarrowPyArrowColumnIterator(
+        None, stream.getvalue(), context, False, False, False, True
+    )
+    batches = list(it)
+    assert len(batches) == 2
+    (
+        fixed,
+        scaled,
+        big,
+        real,
+        boolean,
+        date,
+        ntz,
+        ltz,
+        text,
+    ) = batches[0]
+
+    assert fixed.dtype == numpy.int64
+    assert fixed.tolist() == [1, None, 3]
+    assert isinstance(fixed, numpy.ma.MaskedArray)
+    assert scaled.dtype == numpy.float64
+    assert not isinstance(scaled, numpy.ma.MaskedArray)
+    assert scaled.tolist() == [1.23, 4.56, 7.89]
+    assert big.dtype == object
+    assert big.tolist() == [1, None, 10**30]
+    assert real.dtype == numpy.float64
+    assert real.tolist() == [1.5, 2.5, None]
+    assert boolean.dtype == numpy.bool_
+    assert boolean.tolist() == [True, None, False]
+    assert date.dtype == numpy.dtype("datetime64[D]")
+    assert date.tolist() == [
+        datetime.date(1970, 1, 1),
+        datetime.date(2022, 1, 8),
+        None,
+    ]
+    assert ntz.dtype == numpy.dtype("datetime64[ns]")
+    assert ntz[0] == numpy.datetime64(1000000005, "ns")
+    assert ntz.mask.tolist() == [False, True, False]
+    assert ntz[2] == numpy.datetime64(1600000000123456789, "ns")
+    # TIMESTAMP_LTZ values are UTC, not in the session time zone
+    assert ltz.dtype == numpy.dtype("datetime64[ns]")
+    assert ltz.astype("int64").tolist() == [10**9, 2 * 10**9, 3 * 10**9]
+    assert text.dtype == object
+    assert text.tolist() == ["a", None, "c"]
+    for first, second in zip(batches[0], batches[1]):
+        assert numpy.ma.allequal(first, second)
+
+
+@pytest.mark.skipif(
+    not installed_pandas or no_arrow_iterator_ext,
+    reason="arrow_iterator extension is not built, or pandas option is not installed.",
+)
+def test_column_conversion_out_of_range():
+    """Timestamps beyond datetime64[ns] raise instead of wrapping around."""
+    context = ArrowConverterContext({"TIMEZONE": "UTC"})
+    meta = {"logicalType": "TIMESTAMP_NTZ", "scale": "0"}
+    field = pyarrow.field("column", pyarrow.int64(), True, meta)
+    stream = BytesIO()
+    with RecordBatchStreamWriter(stream, pyarrow.schema([field])) as writer:
+        writer.write_batch(
+            RecordBatch.from_arrays(
+                [pyarrow.array([253402300800], pyarrow.int64())], ["column"]
+            )
+        )
+    it = NanoarrowPyArrowColumnIterator(
+        None, stream.getvalue(), context, False, False, False, True
+    )
+    with pytest.raises(InterfaceError, match="out of the range of numpy"):
+        next(it)
+
+
 def iterate_over_test_chunk(
     pyarrow_type,
     column_meta,
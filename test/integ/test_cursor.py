@@ -46,10 +46,11 @@ except ImportError:
 from snowflake.connector.description import CLIENT_VERSION
 from snowflake.connector.errorcode import (
     ER_FAILED_TO_REWRITE_MULTI_ROW_INSERT,
+    ER_INVALID_VALUE,
+    ER_NO_DATA_FOUND,
     ER_NOT_POSITIVE_SIZE,
 )
 from snowflake.connector.errors import Error
-from snowflake.connector.sqlstate import SQLSTATE_FEATURE_NOT_SUPPORTED
 from snowflake.connector.telemetry import TelemetryField
 
 try:
@@ -1495,15 +1496,29 @@ def test_fetchmany_size_error(conn_cnx):
                 assert ie.errno == ER_NOT_POSITIVE_SIZE
 
 
+@pytest.mark.skipolddriver
 def test_scroll(conn_cnx):
-    """Tests if scroll returns a NotSupported exception."""
+    """Tests moving the cursor within the results."""
     with conn_cnx() as con:
         with con.cursor() as cur:
-            with pytest.raises(
-                NotSupportedError, match="scroll is not supported."
-            ) as nse:
+            with pytest.raises(ProgrammingError) as pe:
                 cur.scroll(2)
-                assert nse.errno == SQLSTATE_FEATURE_NOT_SUPPORTED
+            assert pe.value.errno == ER_NO_DATA_FOUND
+            cur.execute(
+                "select seq4() from table(generator(rowcount => 10000)) order by 1"
+            )
+            cur.scroll(9000, mode="absolute")
+            assert cur.fetchone() == (9000,)
+            assert cur.rownumber == 9000
+            cur.scroll(-9001)
+            assert cur.fetchone() == (0,)
+            cur.scroll(4)
+            assert cur.fetchmany(2) == [(5,), (6,)]
+            cur.scroll(10000, mode="absolute")
+            assert cur.fetchone() is None
+            with pytest.raises(ProgrammingError) as pe:
+                cur.scroll(10001, mode="absolute")
+            assert pe.value.errno == ER_INVALID_VALUE
 
 
 @pytest.mark.skipolddriver
@@ -191,8 +191,9 @@ def test_cursor_download_uses_original_http_config(
 
     download_cfgs = []
     original_download = ResultBatch._download
+    original_download_stream = ResultBatch._download_stream
 
-    def spy_download(self, connection=None, **kwargs):  # type: ignore[no-self-use]
+    def record_download_cfg(self, connection):
         # Path A – batch carries its own cloned SessionManager
         if getattr(self, "_session_manager", None) is not None:
             download_cfgs.append(self._session_manager.config)
@@ -203,9 +204,19 @@ def test_cursor_download_uses_original_http_config(
             and connection.rest.session_manager is not None
         ):
             download_cfgs.append(connection.rest.session_manager.config)
+
+    def spy_download(self, connection=None, **kwargs):  # type: ignore[no-self-use]
+        record_download_cfg(self, connection)
         return original_download(self, connection, **kwargs)
 
+    def spy_download_stream(self, connection=None):  # type: ignore[no-self-use]
+        record_download_cfg(self, connection)
+        return original_download_stream(self, connection)
+
     monkeypatch.setattr(ResultBatch, "_download", spy_download, raising=True)
+    monkeypatch.setattr(
+        ResultBatch, "_download_stream", spy_download_stream, raising=True
+    )
 
     table_name = db_parameters["name"]
     query_sql = f"select * from {table_name} order by 1"
@@ -13,6 +13,7 @@ import base64
 import math
 import random
 import secrets
+import time
 
 import util as stress_util
 from util import task_execution_decorator
@@ -62,6 +63,7 @@ def create_nanoarrow_pyarrow_iterator(input_data, use_table_unit):
             False,
             False,
             False,
+            False,
         )
         if not use_table_unit
         else NanoarrowTableIterator(
@@ -73,6 +75,7 @@ def create_nanoarrow_pyarrow_iterator(input_data, use_table_unit):
             False,
             False,
             False,
+            False,
         )
     )
 
@@ -121,6 +124,55 @@ def execute_task(
         task(bytes_data, create_iterator_method, use_table_unit)
 
 
+def create_typed_chunk(logical_type, row_count):
+    """Creates an arrow chunk with one column of the given type, like the ones Snowflake sends."""
+    import pyarrow
+
+    rnd = random.Random(row_count)
+    epochs = [rnd.randint(0, 2 * 10**9) for _ in range(row_count)]
+    fractions = [rnd.randint(0, 999999999) for _ in range(row_count)]
+    timezones = [rnd.randint(1, 2879) for _ in range(row_count)]
+    meta = {"logicalType": logical_type, "precision": "0", "scale": "9"}
+    if logical_type == "FIXED":
+        meta.update(precision="18", scale="0")
+        array = pyarrow.array(epochs, pyarrow.int64())
+    elif logical_type == "TIMESTAMP_TZ":
+        meta["byteLength"] = "16"
+        array = pyarrow.StructArray.from_arrays(
+            [
+                pyarrow.array(epochs, pyarrow.int64()),
+                pyarrow.array(fractions, pyarrow.int32()),
+                pyarrow.array(timezones, pyarrow.int32()),
+            ],
+            ["epoch", "fraction", "timezone"],
+        )
+    else:
+        array = pyarrow.StructArray.from_arrays(
+            [
+                pyarrow.array(epochs, pyarrow.int64()),
+                pyarrow.array(fractions, pyarrow.int32()),
+            ],
+            ["epoch", "fraction"],
+        )
+    field = pyarrow.field("column", array.type, True, meta)
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, pyarrow.schema([field])) as writer:
+        writer.write_batch(pyarrow.RecordBatch.from_arrays([array], ["column"]))
+    return sink.getvalue().to_pybytes()
+
+
+def benchmark_types(iteration_cnt, row_count=100000):
+    """Prints how many rows per second are converted for each column type."""
+    for logical_type in ("FIXED", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"):
+        data = create_typed_chunk(logical_type, row_count)
+        best = math.inf
+        for _ in range(iteration_cnt):
+            start = time.perf_counter()
+            task_for_loop_iterator(data, create_nanoarrow_pyarrow_iterator)
+            best = min(best, time.perf_counter() - start)
+        print(f"{logical_type}: {row_count / best:,.0f} rows/sec")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -147,8 +199,19 @@ if __name__ == "__main__":
         default=False,
     )
 
+    parser.add_argument(
+        "--benchmark_types",
+        action="store_true",
+        default=False,
+        help="print the rows/sec converted for each column type on generated data",
+    )
+
     args = parser.parse_args()
 
+    if args.benchmark_types:
+        benchmark_types(args.iteration_cnt)
+        raise SystemExit(0)
+
     try:
         # file contains base64 encoded data
         with open(args.data_file) as f:
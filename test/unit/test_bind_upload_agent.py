@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import gzip
+import threading
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
 
 def test_bind_upload_agent_uploading_multiple_files():
     from snowflake.connector.bind_upload_agent import BindUploadAgent
@@ -13,7 +17,8 @@ def test_bind_upload_agent_uploading_multiple_files():
     agent = BindUploadAgent(csr, rows, stream_buffer_size=10)
     agent.upload()
     assert csr.execute.call_count == 1  # 1 for stage creation
-    assert csr._upload_stream.call_count == 10  # 10 for 10 files
+    # 10 for 10 files
+    assert csr.connection.cursor.return_value._upload_stream.call_count == 10
 
 
 def test_bind_upload_agent_row_size_exceed_buffer_size():
@@ -24,7 +29,8 @@ def test_bind_upload_agent_row_size_exceed_buffer_size():
     agent = BindUploadAgent(csr, rows, stream_buffer_size=10)
     agent.upload()
     assert csr.execute.call_count == 1  # 1 for stage creation
-    assert csr._upload_stream.call_count == 10  # 10 for 10 files
+    # 10 for 10 files
+    assert csr.connection.cursor.return_value._upload_stream.call_count == 10
 
 
 def test_bind_upload_agent_scoped_temp_object():
@@ -40,3 +46,79 @@ def test_bind_upload_agent_scoped_temp_object():
                 "create or replace SCOPED TEMPORARY stage"
                 in mock_execute.call_args[0][0]
             )
+
+
+def test_bind_upload_agent_streams_compressed_files():
+    from snowflake.connector.bind_upload_agent import BindUploadAgent
+
+    uploaded = {}
+    in_flight = []
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def upload_stream(input_stream, stage_location, options):
+        with lock:
+            in_flight.append(stage_location)
+            if len(in_flight) == 2:
+                release.set()
+        # uploads run at the same time
+        assert release.wait(5)
+        uploaded[stage_location.rsplit("/", 1)[1]] = gzip.decompress(
+            input_stream.read()
+        )
+
+    consumed = []
+
+    def rows():
+        for i in range(10):
+            consumed.append(i)
+            yield f"{i}\n".encode()
+
+    csr = MagicMock(auto_spec=True)
+    csr.connection.cursor.return_value._upload_stream.side_effect = upload_stream
+    agent = BindUploadAgent(
+        csr, rows(), stream_buffer_size=8, max_concurrent_uploads=2
+    )
+    agent.upload()
+    assert consumed == list(range(10))
+    assert uploaded == {
+        "4.csv.gz": b"0\n1\n2\n3\n",
+        "8.csv.gz": b"4\n5\n6\n7\n",
+        "10.csv.gz": b"8\n9\n",
+    }
+
+
+def test_bind_upload_agent_failed_row_conversion():
+    from snowflake.connector.bind_upload_agent import BindUploadAgent
+    from snowflake.connector.errors import BindUploadError
+
+    def rows():
+        yield b"1\n"
+        raise BindUploadError
+
+    csr = MagicMock(auto_spec=True)
+    agent = BindUploadAgent(csr, rows(), stream_buffer_size=1)
+    with pytest.raises(BindUploadError):
+        agent.upload()
+
+
+def test_bind_upload_agent_parquet_files():
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    from snowflake.connector.bind_upload_agent import BindUploadAgent
+
+    uploaded = {}
+
+    def upload_stream(input_stream, stage_location, options):
+        uploaded[stage_location.rsplit("/", 1)[1]] = pq.read_table(input_stream)
+
+    csr = MagicMock(auto_spec=True)
+    csr.connection.cursor.return_value._upload_stream.side_effect = upload_stream
+    table = pa.table({"1": pa.array(range(10), pa.int64())})
+    # 80 bytes of data, 4 rows in a file
+    agent = BindUploadAgent(csr, table, stream_buffer_size=32, file_format="parquet")
+    agent.upload()
+    assert "file_format=(type=parquet)" in csr.execute.call_args[0][0]
+    assert sorted(uploaded) == ["10.parquet", "4.parquet", "8.parquet"]
+    assert uploaded["8.parquet"].column("1").to_pylist() == [4, 5, 6, 7]
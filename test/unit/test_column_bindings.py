@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import numpy
+import pytest
+
+from snowflake.connector.bind_upload_agent import BindUploadAgent
+from snowflake.connector.column_bindings import (
+    column_to_bindings,
+    columns_to_arrow_table,
+    columns_to_rows,
+    is_columnar,
+    rows_to_arrow_table,
+    split_binding_params,
+    to_binding_columns,
+)
+from snowflake.connector.connection import (
+    DEFAULT_CONFIGURATION,
+    SnowflakeConnection,
+    TypeAndBinding,
+)
+from snowflake.connector.converter import SnowflakeConverter
+from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector.errors import ProgrammingError
+
+VALUES = {
+    "FIXED": [1, -2, None],
+    "REAL": [1.5, -0.25, None],
+    "BOOLEAN": [True, False, None],
+    "TIMESTAMP_NTZ": [
+        datetime(2024, 2, 29, 12, 30, 1, 123456),
+        datetime(1969, 12, 31, 23, 59, 58, 500000),
+        None,
+    ],
+    "DATE": [date(2024, 2, 29), date(1900, 1, 1), None],
+    "TIME": [timedelta(hours=26, microseconds=5), timedelta(seconds=59), None],
+    "TEXT": ['a,"b"', "", None],
+}
+
+
+def _value_by_value(converter, snowflake_type, values, csv):
+    if csv:
+        return [converter.to_csv_bindings(v) for v in values]
+    return [
+        None if v is None else converter.to_snowflake_bindings(snowflake_type, v)
+        for v in values
+    ]
+
+
+@pytest.mark.parametrize("csv", [False, True])
+def test_arrow_columns_match_value_by_value_bindings(csv):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(VALUES)
+    assert is_columnar(table) and is_columnar(table.to_batches()[0])
+    converter = SnowflakeConverter()
+    for column in to_binding_columns(table):
+        converted = column_to_bindings(column, csv=csv)
+        if column.name == "TEXT":
+            # strings are converted one by one
+            assert converted is None
+            assert column.values == VALUES["TEXT"]
+            continue
+        assert converted == (
+            column.name,
+            _value_by_value(converter, column.name, VALUES[column.name], csv),
+        )
+
+
+def test_pandas_columns():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "i": pd.array([1, None], dtype="Int64"),
+            "f": [0.5, numpy.nan],
+            "ts": pd.to_datetime(["2024-01-01 01:00", None]).tz_localize(
+                "Europe/Berlin"
+            ),
+            "s": ["x", None],
+        }
+    )
+    assert is_columnar(df)
+    columns = to_binding_columns(df)
+    assert [column_to_bindings(c) for c in columns[:3]] == [
+        ("FIXED", ["1", None]),
+        # NaN is a NULL in pandas
+        ("REAL", ["0.5", None]),
+        ("TIMESTAMP_LTZ", ["1704067200000000000", None]),
+    ]
+    assert column_to_bindings(columns[3]) is None
+    assert columns_to_rows(columns) == [
+        (1, 0.5, datetime(2024, 1, 1, tzinfo=timezone.utc), "x"),
+        (None, None, None, None),
+    ]
+
+
+def test_numpy_columns():
+    columns = {
+        "id": numpy.ma.masked_array([1, 2, 3], mask=[False, True, False]),
+        "name": numpy.array(["a", "b", "c\nd"]),
+        "day": numpy.array(["3000-01-01", "NaT", "1970-01-02"], dtype="M8[D]"),
+    }
+    assert is_columnar(columns)
+    assert not is_columnar({"id": [1, 2, 3]})
+    id_column, name_column, day_column = to_binding_columns(columns)
+    assert column_to_bindings(id_column, csv=True) == ("FIXED", ["1", "", "3"])
+    assert column_to_bindings(name_column, csv=True) == (
+        "TEXT",
+        ["a", "b", '"c\nd"'],
+    )
+    # dates far in the future are bound in nanoseconds in CSV files
+    assert column_to_bindings(day_column, csv=True) == (
+        "DATE",
+        ["32503680000000000000", "", "86400000"],
+    )
+    assert columns_to_rows([id_column, day_column]) == [
+        (1, date(3000, 1, 1)),
+        (None, None),
+        (3, date(1970, 1, 2)),
+    ]
+
+
+class FakeConnection(SnowflakeConnection):
+    def __init__(self):
+        self._log_max_query_length = 0
+        self._reuse_results = None
+        self._paramstyle = "qmark"
+        self._session_parameters = {"CLIENT_STAGE_ARRAY_BINDING_THRESHOLD": 0}
+        self._client_stage_binding_format = "csv"
+        self._client_bind_request_max_size = None
+        self.converter = SnowflakeConverter()
+
+
+TWO_COLUMNS = {
+    "id": numpy.array([1, 2], dtype=numpy.int32),
+    "name": numpy.array(["a", None], dtype=object),
+}
+
+
+def test_executemany_binds_columns():
+    fake_conn = FakeConnection()
+    cursor = SnowflakeCursor(fake_conn)
+    columns = TWO_COLUMNS
+    with patch.object(cursor, "execute") as execute:
+        cursor.executemany("insert into t values (?, ?)", columns)
+    params = execute.call_args.kwargs["params"]
+    assert params == [TypeAndBinding("FIXED", ["1", "2"]), ["a", None]]
+    assert fake_conn._process_params_qmarks(params, cursor) == {
+        "1": {"type": "FIXED", "value": ["1", "2"]},
+        "2": {"type": "TEXT", "value": ["a", None]},
+    }
+
+    # other statements bind the rows one by one
+    with patch.object(cursor, "execute") as execute:
+        cursor.executemany("update t set name = ? where id = ?", columns)
+    assert [c.kwargs["params"] for c in execute.call_args_list] == [
+        (1, "a"),
+        (2, None),
+    ]
+
+
+def test_arrow_table_for_parquet_binds():
+    pa = pytest.importorskip("pyarrow")
+    columns = to_binding_columns(
+        pa.table(
+            {
+                "ts": pa.array([0, None], pa.timestamp("ns", tz="Asia/Tokyo")),
+                "t": pa.array([timedelta(hours=1), None]),
+            }
+        )
+    )
+    table = columns_to_arrow_table(columns)
+    assert table.column_names == ["1", "2"]
+    assert table.schema.types == [pa.timestamp("ns", tz="UTC"), pa.time64("us")]
+    assert table.column("2").to_pylist() == [time(1), None]
+
+    table = rows_to_arrow_table([(1, b"\x00"), (None, b"\x01")])
+    assert table.schema.types == [pa.int64(), pa.binary()]
+    assert table.column("2").to_pylist() == [b"\x00", b"\x01"]
+
+
+def test_stage_binding_format():
+    pytest.importorskip("pyarrow")
+    fake_conn = FakeConnection()
+    fake_conn._client_stage_binding_format = "parquet"
+    cursor = SnowflakeCursor(fake_conn)
+    agent = cursor._create_bind_upload_agent([(1, "a"), (2, "b")])
+    assert agent._file_format == "parquet"
+    assert agent.rows.num_rows == 2
+    # values pyarrow cannot put in one column are uploaded as CSV
+    agent = cursor._create_bind_upload_agent([(1, "a"), ("b", 2)])
+    assert agent._file_format == "csv"
+    assert list(agent.rows) == [b"1,a\n", b"b,2\n"]
+
+    fake_conn._client_stage_binding_format = "csv"
+    agent = cursor._create_bind_upload_agent(to_binding_columns(TWO_COLUMNS))
+    assert agent._file_format == "csv"
+    assert list(agent.rows) == [b"1,a\n", b"2,\n"]
+
+
+@pytest.mark.parametrize("csv_fails", [False, True])
+def test_executemany_retries_rejected_parquet_binds(csv_fails):
+    pytest.importorskip("pyarrow")
+    fake_conn = FakeConnection()
+    fake_conn._client_stage_binding_format = "parquet"
+    fake_conn._session_parameters["CLIENT_STAGE_ARRAY_BINDING_THRESHOLD"] = 1
+    cursor = SnowflakeCursor(fake_conn)
+    uploaded = []
+
+    def execute(command, params=None, _bind_stage=None, **kwargs):
+        assert _bind_stage is not None and params is None
+        if uploaded[-1] == "parquet" or csv_fails:
+            raise ProgrammingError(f"{uploaded[-1]} rejected")
+
+    with patch.object(
+        BindUploadAgent,
+        "upload",
+        autospec=True,
+        side_effect=lambda agent: uploaded.append(agent._file_format),
+    ), patch.object(cursor, "execute", side_effect=execute):
+        if csv_fails:
+            with pytest.raises(ProgrammingError, match="csv rejected"):
+                cursor.executemany("insert into t values (?, ?)", [(1, "a")])
+        else:
+            cursor.executemany("insert into t values (?, ?)", [(1, "a")])
+    assert uploaded == ["parquet", "csv"]
+    # Parquet is given up only when the CSV files were accepted
+    assert fake_conn._client_stage_binding_format == (
+        "parquet" if csv_fails else "csv"
+    )
+
+
+def test_split_binding_params():
+    params = [list(range(100)), TypeAndBinding("TEXT", ["x" * 7] * 100)]
+    # a row takes 1 or 2 digits and 7 characters, plus 3 bytes per value
+    parts = split_binding_params(params, 160)
+    assert [len(part[0]) for part in parts] == [10] * 10
+    assert parts[1] == [list(range(10, 20)), TypeAndBinding("TEXT", ["x" * 7] * 10)]
+    assert split_binding_params(params, 1 << 20) == [params]
+
+
+def _split_insert_cursor(autocommit, fail_at=None, transaction=None):
+    """Returns a cursor sending inserts of about 100 bytes of binds, and the parts
+    and the statements of the other cursors it sent."""
+    fake_conn = FakeConnection()
+    fake_conn._client_bind_request_max_size = 100
+    if autocommit is not None:
+        fake_conn._session_parameters["AUTOCOMMIT"] = autocommit
+    statements = []
+    transaction_cursor = MagicMock()
+    transaction_cursor.__enter__.return_value = transaction_cursor
+
+    def execute_statement(command):
+        statements.append(command)
+        transaction_cursor.fetchone.return_value = (transaction,)
+        return transaction_cursor
+
+    transaction_cursor.execute.side_effect = execute_statement
+    fake_conn.cursor = MagicMock(return_value=transaction_cursor)
+    cursor = SnowflakeCursor(fake_conn)
+    sent = []
+
+    def execute(command, params, **kwargs):
+        if len(sent) == fail_at:
+            raise ProgrammingError("part failed")
+        sent.append(params)
+        if kwargs.get("_do_reset", True):
+            cursor._total_rowcount = -1
+        cursor._total_rowcount = max(cursor._total_rowcount, 0) + len(params[0])
+
+    patch.object(cursor, "execute", side_effect=execute).start()
+    return cursor, sent, statements
+
+
+@pytest.mark.parametrize("autocommit", [True, False, None])
+def test_executemany_splits_big_inserts(autocommit):
+    cursor, sent, statements = _split_insert_cursor(autocommit)
+    rows = [(i, "abc") for i in range(50)]
+    try:
+        cursor.executemany("insert into t values (?, ?)", rows)
+    finally:
+        patch.stopall()
+    # a row takes about 11 bytes, 9 rows are sent in a request
+    assert len(sent) == 6
+    assert [row for part in sent for row in zip(*part)] == rows
+    assert cursor.rowcount == 50
+    # whatever the connection knows about autocommit, no transaction is open
+    assert statements == ["SELECT CURRENT_TRANSACTION()", "BEGIN", "COMMIT"]
+
+
+def test_executemany_split_insert_in_open_transaction():
+    cursor, sent, statements = _split_insert_cursor(False, transaction="1")
+    try:
+        cursor.executemany("insert into t values (?, ?)", [(1, "a")] * 50)
+    finally:
+        patch.stopall()
+    assert len(sent) > 1
+    assert statements == ["SELECT CURRENT_TRANSACTION()"]
+
+
+def test_executemany_split_insert_is_opt_in():
+    assert DEFAULT_CONFIGURATION["client_bind_request_max_size"][0] is None
+    cursor, sent, statements = _split_insert_cursor(True)
+    cursor.connection._client_bind_request_max_size = None
+    try:
+        cursor.executemany("insert into t values (?, ?)", [(1, "a")] * 50)
+    finally:
+        patch.stopall()
+    assert len(sent) == 1
+    assert statements == []
+
+
+def test_executemany_failed_split_insert_is_rolled_back():
+    # autocommit was never set on the connection
+    cursor, sent, statements = _split_insert_cursor(None, fail_at=2)
+    assert "AUTOCOMMIT" not in cursor.connection._session_parameters
+    try:
+        with pytest.raises(ProgrammingError, match="part failed"):
+            cursor.executemany(
+                "insert into t values (?, ?)", [(i, "abc") for i in range(50)]
+            )
+    finally:
+        patch.stopall()
+    # the parts sent before the failed one are not left inserted
+    assert len(sent) == 2
+    assert statements == ["SELECT CURRENT_TRANSACTION()", "BEGIN", "ROLLBACK"]
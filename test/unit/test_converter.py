@@ -133,3 +133,63 @@ def test_year_month_interval_to_timedelta(months):
     assert converter.INTERVAL_YEAR_MONTH_to_numpy_timedelta(
         months
     ) == numpy.timedelta64(months, "M")
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    "type_name,scale,values",
+    [
+        ("DATE", None, ["0", "-1", "19000", "-719162", "2932896"]),
+        (
+            "TIMESTAMP_NTZ",
+            9,
+            ["0.000000000", "-0.000000009", "1700000000.123456789", "-1.500000000"],
+        ),
+        ("TIMESTAMP_NTZ", 3, ["0.001", "-0.001", "1700000000.999", "-86400.500"]),
+        ("TIMESTAMP_NTZ", 0, ["0", "-1", "253402300799", "-62135596800"]),
+    ],
+)
+def test_column_converter_matches_row_converter(use_numpy, type_name, scale, values):
+    converter = SnowflakeConverter(use_numpy=use_numpy)
+    column = {"type": type_name, "scale": scale}
+    column_conv = converter.to_python_column_method(type_name, column)
+    if column_conv is None:
+        # only some of the types have a vectorized converter
+        assert use_numpy and type_name == "DATE"
+        return
+    if use_numpy and scale == 0:
+        # datetime64[ns] can not represent the first and last years of datetime
+        values = values[:2]
+    expected = list(map(converter.to_python_method(type_name, column), values))
+    converted = column_conv(values)
+    assert converted == expected
+    assert [type(v) for v in converted] == [type(v) for v in expected]
+
+
+@pytest.mark.parametrize(
+    "type_name,scale,value",
+    [
+        ("DATE", None, "2932897"),
+        ("TIMESTAMP_NTZ", 0, "253402300800"),
+        ("TIMESTAMP_NTZ", 3, "-62135596800.001"),
+        ("TIMESTAMP_NTZ", 3, "not a timestamp"),
+    ],
+)
+def test_column_converter_out_of_range(type_name, scale, value):
+    converter = SnowflakeConverter()
+    column_conv = converter.to_python_column_method(
+        type_name, {"type": type_name, "scale": scale}
+    )
+    with pytest.raises(ValueError):
+        column_conv(["0", value])
+
+
+def test_column_converter_not_used_for_overridden_converter():
+    class DateAsString(SnowflakeConverter):
+        def _DATE_to_python(self, ctx):
+            return str
+
+    column = {"type": "DATE", "scale": None}
+    assert DateAsString().to_python_column_method("DATE", column) is None
+    assert ConverterSnowSQL().to_python_column_method("DATE", column) is None
+    assert SnowflakeConverter().to_python_column_method("TEXT", column) is None
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import time
+import uuid
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from snowflake.connector._sql_util import (
+    MAX_CACHED_STATEMENT_LENGTH,
+    get_statement_info,
+)
 from snowflake.connector.connection import SnowflakeConnection
 from snowflake.connector.cursor import SnowflakeCursor
 from snowflake.connector.errors import ServiceUnavailableError
@@ -57,6 +62,63 @@ def test_get_filetransfer_type(sql, _type):
     assert SnowflakeCursor.get_file_transfer_type(sql) == _type
 
 
+def test_statement_info_is_cached():
+    sql = f"insert into t_{uuid.uuid4().hex} values (%s, %s)"
+    before = SnowflakeCursor.statement_cache_info()
+    for _ in range(3):
+        statement = get_statement_info(sql)
+        assert statement.is_insert and statement.insert_values == "(%s, %s)"
+    after = SnowflakeCursor.statement_cache_info()
+    assert (after.hits - before.hits, after.misses - before.misses) == (2, 1)
+
+    assert get_statement_info("desc t;").describe_table == "describe table t"
+    assert get_statement_info(
+        "alter session set timezone = 'UTC';"
+    ).session_parameters == (("TIMEZONE", "UTC"),)
+    # long statements are not cached
+    long_sql = "select 1" + " " * MAX_CACHED_STATEMENT_LENGTH
+    assert get_statement_info(long_sql) is not get_statement_info(long_sql)
+
+
+def test_parameterized_statements_are_cached():
+    fake_conn = FakeConnection()
+    fake_conn._paramstyle = "pyformat"
+    fake_conn._interpolate_empty_sequences = False
+    fake_conn._process_params_pyformat = lambda params, cursor: params or {}
+    fake_conn.is_closed = lambda: False
+    cursor = SnowflakeCursor(fake_conn)
+    table = f"t_{uuid.uuid4().hex}"
+    sql = f"select * from {table} where secret = %s"
+    queries = []
+
+    def execute_helper(query, **kwargs):
+        queries.append((query, kwargs["_is_put_get"]))
+        raise ServiceUnavailableError()
+
+    before = SnowflakeCursor.statement_cache_info()
+    with patch.object(cursor, "_execute_helper", side_effect=execute_helper):
+        for value in ("'one'", "'two'", "'three'"):
+            with pytest.raises(ServiceUnavailableError):
+                cursor.execute(sql, (value,))
+        # statements using the values are analyzed with them
+        with pytest.raises(ServiceUnavailableError):
+            cursor.execute("alter session set timezone = %s", ("'UTC'",))
+        # nor the inserts executemany fills the rows into
+        with pytest.raises(ServiceUnavailableError):
+            cursor.executemany(
+                f"insert into {table} values (%s)", [("'one'",), ("'two'",)]
+            )
+    after = SnowflakeCursor.statement_cache_info()
+    # only the statements before their values were filled in are cached
+    assert (after.hits - before.hits, after.misses - before.misses) == (2, 3)
+    assert queries[-1] == (f"insert into {table} values ('one'),('two')", False)
+    assert queries[:3] == [
+        (f"select * from {table} where secret = 'one'", False),
+        (f"select * from {table} where secret = 'two'", False),
+        (f"select * from {table} where secret = 'three'", False),
+    ]
+
+
 def test_cursor_attribute():
     fake_conn = FakeConnection()
     cursor = SnowflakeCursor(fake_conn)
@@ -261,3 +323,88 @@ class TestUploadDownloadMethods(TestCase):
             cursor._download("@st", "/tmp", {})
 
         self._run_dop_cap_test(task, dop_cap=1)
+
+
+def test_scroll():
+    from snowflake.connector.errors import ProgrammingError
+    from snowflake.connector.result_batch import JSONResultBatch
+    from snowflake.connector.result_set import ResultSet
+
+    fake_conn = FakeConnection()
+    fake_conn.messages = []
+    cursor = SnowflakeCursor(fake_conn)
+    with pytest.raises(ProgrammingError, match="no results to scroll"):
+        cursor.scroll(1)
+
+    batches = []
+    for start in range(0, 30, 10):
+        batch = JSONResultBatch.from_data(
+            [[str(i)] for i in range(start, start + 10)],
+            10,
+            [MagicMock()],
+            [("TEXT", None)],
+            False,
+        )
+        batch.create_iter = MagicMock(wraps=batch.create_iter)
+        batches.append(batch)
+    cursor._result_set = ResultSet(cursor, batches, 2, False)
+    cursor.scroll(25, mode="absolute")
+    assert cursor.fetchone() == ("25",)
+    assert cursor.rownumber == 25
+    # only the batch holding the row and the ones after it are iterated
+    assert [batch.create_iter.call_count for batch in batches] == [0, 0, 1]
+
+    cursor.scroll(-16)
+    assert cursor.fetchmany(2) == [("10",), ("11",)]
+    cursor.scroll(1)
+    assert cursor.fetchone() == ("13",)
+    # scrolling within the batch scrolled to does not iterate it again
+    cursor.scroll(-4)
+    assert cursor.fetchone() == ("10",)
+    cursor.scroll(8)
+    assert cursor.fetchall() == [(str(i),) for i in range(19, 30)]
+    assert batches[1].create_iter.call_count == 1
+
+    # nor does scrolling forward within the batch being fetched
+    cursor.scroll(0, mode="absolute")
+    assert cursor.fetchone() == ("0",)
+    cursor.scroll(7)
+    assert cursor.fetchone() == ("8",)
+    assert batches[0].create_iter.call_count == 1
+    with pytest.raises(ProgrammingError, match="out of the results"):
+        cursor.scroll(31, mode="absolute")
+    with pytest.raises(ProgrammingError, match="Invalid scroll mode"):
+        cursor.scroll(1, mode="backwards")
+
+
+def test_partition_results_after_fetching():
+    from snowflake.connector.errors import ProgrammingError
+    from snowflake.connector.result_batch import JSONResultBatch
+    from snowflake.connector.result_set import ResultSet
+
+    fake_conn = FakeConnection()
+    fake_conn.messages = []
+    cursor = SnowflakeCursor(fake_conn)
+    batches = [
+        JSONResultBatch.from_data(
+            [[str(i)] for i in range(start, start + 10)],
+            10,
+            [MagicMock()],
+            [("TEXT", None)],
+            False,
+        )
+        for start in range(0, 30, 10)
+    ]
+    cursor._result_set = ResultSet(cursor, batches, 2, False)
+    cursor._rownumber = -1
+    assert cursor.fetchone() == ("0",)
+    # the partitions would return the fetched row again
+    with pytest.raises(ProgrammingError, match="1 rows were already fetched"):
+        cursor.partition_results(2)
+
+    cursor.scroll(0, mode="absolute")
+    with patch.object(cursor, "_log_telemetry_job_data"):
+        partitions = cursor.partition_results(2)
+    assert sorted(int(row[0]) for part in partitions for row in part) == list(
+        range(30)
+    )
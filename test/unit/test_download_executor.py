@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from unittest import mock
+
+import pytest
+
+try:
+    from snowflake.connector._download_executor import (
+        SharedDownloadExecutor,
+        SharedProcessPool,
+        get_shared_download_executor,
+        get_shared_process_pool,
+    )
+    from snowflake.connector.result_set import result_set_iterator
+except ImportError:  # pragma: no cover
+    pytestmark = pytest.mark.skip("shared download executor is not available")
+
+
+def test_round_robin_between_queues():
+    executor = SharedDownloadExecutor(1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def blocker():
+        started.set()
+        release.wait()
+
+    big, small = executor.queue(), executor.queue()
+    big.submit(blocker)
+    started.wait()
+    # While the only worker is busy, a big result set queues a lot of work
+    big_futures = [big.submit(order.append, f"big{i}") for i in range(5)]
+    small_future = small.submit(order.append, "small")
+    release.set()
+
+    big.shutdown()
+    small.shutdown()
+    assert small_future.done() and all(f.done() for f in big_futures)
+    # The small result set did not have to wait for the whole big one
+    assert order.index("small") == 1
+    executor.shutdown()
+
+
+def test_exceptions_are_propagated():
+    executor = SharedDownloadExecutor(2)
+    with executor.queue() as queue:
+        future = queue.submit(int, "not a number")
+    with pytest.raises(ValueError):
+        future.result()
+    executor.shutdown()
+
+
+def test_pool_is_bounded():
+    executor = SharedDownloadExecutor(2)
+    with executor.queue() as queue:
+        for _ in range(20):
+            queue.submit(threading.current_thread)
+    assert len(executor._threads) <= 2
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.queue().submit(int)
+
+
+def test_shared_executor_is_reused():
+    executor = get_shared_download_executor(2)
+    assert get_shared_download_executor(3) is executor
+    assert executor.max_workers >= 3
+
+
+def test_shared_process_pool_is_reused():
+    pool = get_shared_process_pool(1)
+    assert get_shared_process_pool(2) is pool
+    assert pool.max_workers >= 2
+
+
+def test_process_pool_grows_and_survives_dead_workers():
+    pool = SharedProcessPool(1)
+    with pool.queue() as queue:
+        assert queue.submit(abs, -1).result() == 1
+    first = pool._pool
+    pool.resize(2)
+    with pool.queue() as queue:
+        assert queue.submit(abs, -2).result() == 2
+    assert pool._pool is not first
+    # a worker process that died breaks the pool, the next download gets a new one
+    with pool.queue() as queue:
+        with pytest.raises(Exception):
+            queue.submit(os._exit, 1).result()
+        assert queue.submit(abs, -3).result() == 3
+    pool.shutdown()
+
+
+def test_result_set_iterator_uses_shared_executor():
+    executor = SharedDownloadExecutor(2)
+    batches = deque()
+    for i in range(1, 6):
+        batch = mock.Mock(id=str(i), uncompressed_size=10)
+        batch.create_iter.return_value = iter([(i,)])
+        batches.append(batch)
+    rows = list(
+        result_set_iterator(
+            iter([(0,)]),
+            deque(),
+            batches,
+            mock.Mock(),
+            2,
+            use_mp=False,
+            download_executor=executor,
+        )
+    )
+    assert rows == [(i,) for i in range(6)]
+    assert 0 < len(executor._threads) <= 2
+    executor.shutdown()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import pickle
+from unittest import mock
+
+import pytest
+
+try:
+    from snowflake.connector.errors import MissingDependencyError
+    from snowflake.connector.json_result_decoder import (
+        _DECODERS,
+        JSONResultDecoder,
+        OrjsonJSONResultDecoder,
+        get_json_result_decoder,
+        register_json_result_decoder,
+    )
+except ImportError:  # pragma: no cover
+    pytestmark = pytest.mark.skip("json_result_decoder module is not available")
+
+try:
+    import orjson  # NOQA
+
+    installed_orjson = True
+except ImportError:
+    installed_orjson = False
+
+ROWS = '["1","a\\u00e0\\"b",null],["2","Ofigràfic",""]'
+EXPECTED = [["1", 'aà"b', None], ["2", "Ofigràfic", ""]]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "json",
+        pytest.param(
+            "orjson",
+            marks=pytest.mark.skipif(
+                not installed_orjson, reason="orjson is not installed"
+            ),
+        ),
+    ],
+)
+def test_decoders_agree(name):
+    decoder = get_json_result_decoder(name)
+    assert decoder.name == name
+    framed = f"[{ROWS}]"
+    assert decoder.loads(framed) == EXPECTED
+    assert decoder.loads_utf8(framed.encode("utf-8")) == EXPECTED
+    assert decoder.loads_utf8(memoryview(bytearray(framed.encode("utf-8")))) == EXPECTED
+    with pytest.raises(ValueError):
+        decoder.loads_utf8("[[\"À\"]]".encode("latin1"))
+    # result batches carry their decoder to other processes
+    assert type(pickle.loads(pickle.dumps(decoder))) is type(decoder)
+
+
+def test_auto_decoder():
+    decoder = get_json_result_decoder("auto")
+    expected = OrjsonJSONResultDecoder if installed_orjson else JSONResultDecoder
+    assert type(decoder) is expected
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError, match="Unknown JSON result decoder: simdjson"):
+        get_json_result_decoder("simdjson")
+
+
+def test_custom_decoder():
+    class CustomDecoder(JSONResultDecoder):
+        name = "custom"
+
+    decoder = CustomDecoder()
+    assert get_json_result_decoder(decoder) is decoder
+    with mock.patch.dict(_DECODERS):
+        register_json_result_decoder("custom", CustomDecoder)
+        assert type(get_json_result_decoder("custom")) is CustomDecoder
+
+
+@pytest.mark.skipif(installed_orjson, reason="orjson is installed")
+def test_missing_orjson():
+    with pytest.raises(MissingDependencyError):
+        get_json_result_decoder("orjson")
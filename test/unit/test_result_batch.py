@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import threading
 from collections import namedtuple
+from datetime import date
 from http import HTTPStatus
 from test.helpers import create_mock_response
 from unittest import mock
@@ -23,6 +25,7 @@ from snowflake.connector.compat import (
 )
 from snowflake.connector.errorcode import (
     ER_FAILED_TO_CONNECT_TO_DB,
+    ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE,
     ER_HTTP_GENERAL_ERROR,
 )
 from snowflake.connector.errors import (
@@ -40,7 +43,12 @@ from snowflake.connector.errors import (
 try:
     from snowflake.connector.compat import TOO_MANY_REQUESTS
     from snowflake.connector.errors import TooManyRequests
-    from snowflake.connector.result_batch import MAX_DOWNLOAD_RETRY, JSONResultBatch
+    from snowflake.connector.json_result_decoder import JSONResultDecoder
+    from snowflake.connector.result_batch import (
+        MAX_DOWNLOAD_RETRY,
+        JSONResultBatch,
+        RemoteChunkInfo,
+    )
     from snowflake.connector.vendored import requests  # NOQA
 
     SESSION_FROM_REQUEST_MODULE_PATH = (
@@ -49,6 +57,8 @@ try:
 except ImportError:
     MAX_DOWNLOAD_RETRY = None
     JSONResultBatch = None
+    JSONResultDecoder = None
+    RemoteChunkInfo = None
     SESSION_FROM_REQUEST_MODULE_PATH = "requests.sessions.Session"
     TooManyRequests = None
     TOO_MANY_REQUESTS = None
@@ -151,3 +161,510 @@ def test_retries_until_success():
             assert res.raw == "success"
         # call `get` once for each error and one last time when it succeeds
         assert mock_get.call_count == len(error_codes) + 1
+
+
+@pytest.mark.skipolddriver
+def test_split_arrow_ipc_stream():
+    pa = pytest.importorskip("pyarrow")
+    from snowflake.connector.result_batch import split_arrow_ipc_stream
+
+    from ..helpers import create_nanoarrow_pyarrow_iterator
+
+    schema = pa.schema(
+        [
+            pa.field(
+                "a",
+                pa.int64(),
+                metadata={"logicalType": "FIXED", "scale": "0", "precision": "38"},
+            ),
+            pa.field("b", pa.string(), metadata={"logicalType": "TEXT"}),
+        ]
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for k in range(3):
+            writer.write_batch(
+                pa.record_batch(
+                    [pa.array(range(k * 10, k * 10 + 5)), pa.array(list("abcde"))],
+                    schema=schema,
+                )
+            )
+    data = sink.getvalue().to_pybytes()
+
+    # feed the stream in pieces that don't line up with message boundaries
+    record_batches = list(
+        split_arrow_ipc_stream(data[i : i + 7] for i in range(0, len(data), 7))
+    )
+    assert len(record_batches) == 3
+    rows = [
+        row
+        for record_batch in record_batches
+        for row in create_nanoarrow_pyarrow_iterator(record_batch, False)
+    ]
+    assert rows == list(create_nanoarrow_pyarrow_iterator(data, False))
+
+
+@pytest.mark.skipolddriver
+def test_download_stream_resumes_after_broken_connection():
+    def broken_body(_):
+        yield b"ab"
+        raise ConnectionError("connection reset")
+
+    responses = [
+        mock.Mock(status_code=OK, iter_content=broken_body),
+        mock.Mock(status_code=OK, iter_content=lambda _: iter([b"abc", b"def"])),
+    ]
+    session = mock.Mock()
+    session.request.side_effect = responses
+    with mock.patch.object(
+        result_batch, "_download_session"
+    ) as download_session, mock.patch("time.sleep", return_value=None):
+        download_session.return_value.__enter__.return_value = session
+        assert b"".join(result_batch._download_stream()) == b"abcdef"
+    assert session.request.call_count == 2
+    for response in responses:
+        response.close.assert_called_once()
+
+
+@pytest.mark.skipolddriver
+@pytest.mark.parametrize("reported_size", [0, 3, 6, 10])
+def test_download_to_buffer(reported_size):
+    chunk = RemoteChunkInfo("http://www.chunk-url.com", reported_size, 1)
+    batch = JSONResultBatch(100, None, chunk, [], [], True)
+    with mock.patch.object(
+        batch, "_download_stream", return_value=iter([b"abc", b"def"])
+    ):
+        buffer = batch._download_to_buffer()
+    # the buffer is sized up front, but adapts when the reported size is off
+    assert isinstance(buffer, memoryview)
+    assert bytes(buffer) == b"abcdef"
+
+
+@pytest.mark.skipolddriver
+@pytest.mark.parametrize("force_utf8", [True, False])
+def test_json_result_batch_decoder(force_utf8):
+    content = '["1","Ofigràfic"],["2",null]'.encode()
+    chunk = RemoteChunkInfo("http://www.chunk-url.com", len(content), 1)
+    decoder = mock.Mock(wraps=JSONResultDecoder())
+    batch = JSONResultBatch(
+        2,
+        None,
+        chunk,
+        [mock.Mock(), mock.Mock()],
+        [("TEXT", None), ("TEXT", None)],
+        False,
+        json_result_force_utf8_decoding=force_utf8,
+        json_decoder=decoder,
+    )
+    response = create_mock_response(200)
+    response.text = content.decode()
+    with mock.patch.object(
+        batch, "_download_stream", return_value=iter([content[:5], content[5:]])
+    ), mock.patch.object(batch, "_download", return_value=response):
+        assert list(batch.create_iter()) == [("1", "Ofigràfic"), ("2", None)]
+    if force_utf8:
+        # the download buffer is framed as a JSON array and decoded without copies
+        (data,), _ = decoder.loads_utf8.call_args
+        assert isinstance(data, memoryview)
+        decoder.loads.assert_not_called()
+    else:
+        decoder.loads.assert_called_once()
+
+
+@pytest.mark.skipolddriver
+@pytest.mark.parametrize("use_dict_result", [False, True])
+def test_json_result_batch_columnar_parse(use_dict_result):
+    from snowflake.connector.converter import SnowflakeConverter
+
+    converter = SnowflakeConverter()
+    rowtypes = [
+        {"name": "ID", "type": "FIXED", "scale": 0},
+        {"name": "D", "type": "DATE", "scale": None},
+        {"name": "S", "type": "TEXT", "scale": None},
+    ]
+    schema = [mock.Mock() for _ in rowtypes]
+    for col, c in zip(schema, rowtypes):
+        # name is a reserved argument of Mock
+        col.name = c["name"]
+    data = [
+        ["1", "0", "a"],
+        ["x", "y", "b"],
+        [None, "1", None],
+        ["4", "z", "d"],
+    ]
+    batch = JSONResultBatch.from_data(
+        data,
+        len(data),
+        schema,
+        [(c["type"], converter.to_python_method(c["type"], c)) for c in rowtypes],
+        use_dict_result,
+        vectorized_converters=[
+            converter.to_python_column_method(c["type"], c) for c in rowtypes
+        ],
+    )
+    rows = list(batch.create_iter())
+    expected = [
+        (1, date(1970, 1, 1), "a"),
+        None,
+        (None, date(1970, 1, 2), None),
+        None,
+    ]
+    if use_dict_result:
+        expected = [e and dict(zip(["ID", "D", "S"], e)) for e in expected]
+    assert [None if isinstance(r, Exception) else r for r in rows] == expected
+    # failing rows report their first failing column
+    assert "field ID: FIXED::x" in rows[1].msg
+    assert "field D: DATE::z" in rows[3].msg
+    assert all(
+        r.errno == ER_FAILED_TO_CONVERT_ROW_TO_PYTHON_TYPE for r in (rows[1], rows[3])
+    )
+
+
+@pytest.mark.skipolddriver
+def test_arrow_result_batch_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+    from snowflake.connector.arrow_context import ArrowConverterContext
+    from snowflake.connector.constants import FIELD_NAME_TO_ID
+    from snowflake.connector.cursor import ResultMetadataV2
+    from snowflake.connector.result_batch import ArrowResultBatch
+
+    schema = pa.schema(
+        [
+            pa.field(
+                "ID",
+                pa.int64(),
+                metadata={"logicalType": "FIXED", "scale": "0", "precision": "18"},
+            ),
+            pa.field("S", pa.string(), metadata={"logicalType": "TEXT"}),
+        ]
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(
+            pa.record_batch([pa.array([1, 2]), pa.array(["a", "b"])], schema=schema)
+        )
+        writer.write_batch(
+            pa.record_batch([pa.array([None, 4]), pa.array(["c", None])], schema=schema)
+        )
+    metadata = [
+        ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=0),
+        ResultMetadataV2("S", FIELD_NAME_TO_ID["TEXT"], True),
+    ]
+
+    def create_batch(data):
+        return ArrowResultBatch.from_data(
+            data, 4, ArrowConverterContext(), False, False, metadata, False
+        )
+
+    arrays = create_batch(sink.getvalue().to_pybytes()).to_numpy()
+    assert list(arrays) == ["ID", "S"]
+    # the arrays of the record batches are concatenated, the masks with them
+    assert isinstance(arrays["ID"], numpy.ma.MaskedArray)
+    assert arrays["ID"].dtype == numpy.int64
+    assert arrays["ID"].tolist() == [1, 2, None, 4]
+    assert arrays["S"].dtype == object
+    assert arrays["S"].tolist() == ["a", "b", "c", None]
+
+    empty = create_batch("").to_numpy()
+    assert empty["ID"].dtype == numpy.int64 and len(empty["ID"]) == 0
+    assert empty["S"].dtype == object and len(empty["S"]) == 0
+
+
+@pytest.mark.skipolddriver
+def test_arrow_result_batch_to_numpy_big_numbers():
+    numpy = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+    from decimal import Decimal
+
+    from snowflake.connector.constants import FIELD_NAME_TO_ID
+    from snowflake.connector.cursor import ResultMetadataV2
+    from snowflake.connector.result_batch import concatenate_numpy_arrays
+
+    def create_chunk(arrow_type, values):
+        schema = pa.schema(
+            [
+                pa.field(
+                    "ID",
+                    arrow_type,
+                    metadata={"logicalType": "FIXED", "scale": "0", "precision": "38"},
+                )
+            ]
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            writer.write_batch(
+                pa.record_batch([pa.array(values, arrow_type)], schema=schema)
+            )
+        return sink.getvalue().to_pybytes()
+
+    metadata = [
+        ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=38, scale=0)
+    ]
+    # the back-end stores a chunk as int64 or as decimals depending on its values
+    int_chunk = _create_arrow_result_batch(
+        create_chunk(pa.int64(), [1, None]), metadata
+    ).to_numpy()
+    decimal_chunk = _create_arrow_result_batch(
+        create_chunk(pa.decimal128(38, 0), [Decimal(10**20), Decimal(2)]), metadata
+    ).to_numpy()
+    empty = _create_arrow_result_batch("", metadata).to_numpy()
+    assert [arrays["ID"].dtype for arrays in (int_chunk, decimal_chunk, empty)] == [
+        numpy.dtype(object)
+    ] * 3
+    column = concatenate_numpy_arrays([int_chunk["ID"], decimal_chunk["ID"]])
+    assert column.dtype == object
+    assert column.tolist() == [1, None, 10**20, 2]
+
+
+def _create_arrow_chunk(pa, id_type=None, scale=2, precision=18):
+    schema = pa.schema(
+        [
+            pa.field(
+                "ID",
+                id_type or pa.int64(),
+                metadata={
+                    "logicalType": "FIXED",
+                    "scale": str(scale),
+                    "precision": str(precision),
+                },
+            ),
+            pa.field("S", pa.string(), metadata={"logicalType": "TEXT"}),
+        ]
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(
+            pa.record_batch([pa.array([1, 2]), pa.array(["a", "b"])], schema=schema)
+        )
+        writer.write_batch(
+            pa.record_batch([pa.array([None, 4]), pa.array(["c", None])], schema=schema)
+        )
+    return sink.getvalue().to_pybytes()
+
+
+def _create_arrow_result_batch(data, metadata):
+    from snowflake.connector.arrow_context import ArrowConverterContext
+    from snowflake.connector.result_batch import ArrowResultBatch
+
+    return ArrowResultBatch.from_data(
+        data,
+        4,
+        ArrowConverterContext({"TIMEZONE": "UTC"}),
+        False,
+        False,
+        metadata,
+        False,
+    )
+
+
+@pytest.mark.skipolddriver
+def test_arrow_result_batch_c_stream():
+    pa = pytest.importorskip("pyarrow")
+    from snowflake.connector.constants import FIELD_NAME_TO_ID
+    from snowflake.connector.cursor import ResultMetadataV2
+
+    metadata = [
+        ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=2),
+        ResultMetadataV2("S", FIELD_NAME_TO_ID["TEXT"], True),
+    ]
+    data = _create_arrow_chunk(pa)
+    reader = pa.RecordBatchReader._import_from_c_capsule(
+        _create_arrow_result_batch(data, metadata).__arrow_c_stream__()
+    )
+    # the record batches are converted like the ones of to_arrow
+    assert reader.read_all().equals(
+        _create_arrow_result_batch(data, metadata).to_arrow()
+    )
+
+
+@pytest.mark.skipolddriver
+def test_empty_arrow_result_batch_c_stream():
+    pa = pytest.importorskip("pyarrow")
+    from snowflake.connector.constants import FIELD_NAME_TO_ID
+    from snowflake.connector.cursor import ResultMetadataV2
+
+    metadata = [
+        ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=2),
+        ResultMetadataV2("S", FIELD_NAME_TO_ID["TEXT"], True),
+        ResultMetadataV2("T", FIELD_NAME_TO_ID["TIMESTAMP_TZ"], True),
+        ResultMetadataV2(
+            "M",
+            FIELD_NAME_TO_ID["MAP"],
+            True,
+            fields=[
+                ResultMetadataV2("k", FIELD_NAME_TO_ID["TEXT"], False),
+                ResultMetadataV2("v", FIELD_NAME_TO_ID["FIXED"], True),
+            ],
+        ),
+        ResultMetadataV2(
+            "V",
+            FIELD_NAME_TO_ID["VECTOR"],
+            True,
+            vector_dimension=3,
+            fields=[ResultMetadataV2("x", FIELD_NAME_TO_ID["REAL"], True)],
+        ),
+        ResultMetadataV2(
+            "O",
+            FIELD_NAME_TO_ID["OBJECT"],
+            True,
+            fields=[ResultMetadataV2("a", FIELD_NAME_TO_ID["DATE"], True)],
+        ),
+    ]
+    batch = _create_arrow_result_batch("", metadata)
+    reader = pa.RecordBatchReader._import_from_c_capsule(batch.__arrow_c_stream__())
+    assert reader.schema.equals(batch._declare_number_types(batch.to_arrow().schema))
+    assert reader.schema.field("ID").type == pa.float64()
+    assert reader.read_all().num_rows == 0
+
+
+@pytest.mark.skipolddriver
+def test_chain_arrow_array_streams():
+    pa = pytest.importorskip("pyarrow")
+    from snowflake.connector.constants import FIELD_NAME_TO_ID
+    from snowflake.connector.cursor import ResultMetadataV2
+    from snowflake.connector.nanoarrow_arrow_iterator import chain_arrow_array_streams
+
+    metadata = [
+        ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=0),
+        ResultMetadataV2("S", FIELD_NAME_TO_ID["TEXT"], True),
+    ]
+
+    def streams(*ids_types, error=None):
+        for id_type in ids_types:
+            batch = _create_arrow_result_batch(
+                _create_arrow_chunk(pa, id_type, scale=0), metadata
+            )
+            yield from batch._get_arrow_stream_iter()
+        if error:
+            raise error
+
+    def read(streams):
+        empty_batch = _create_arrow_result_batch("", metadata)
+        capsule = chain_arrow_array_streams(
+            streams, empty_batch._create_empty_arrow_schema
+        )
+        return pa.RecordBatchReader._import_from_c_capsule(capsule).read_all()
+
+    assert read(streams(pa.int64(), pa.int64(), pa.int64())).num_rows == 12
+    assert read(streams()).schema.names == ["ID", "S"]
+    # errors of later chunks are reported by the stream
+    with pytest.raises(OSError, match="download failed"):
+        read(streams(pa.int64(), error=RuntimeError("download failed")))
+    # the back-end may pick other integer widths for the numbers of each chunk
+    table = read(streams(pa.int8(), pa.int64(), pa.int16()))
+    assert table.schema.field("ID").type == pa.int64()
+    assert table.column("ID").to_pylist() == [1, 2, None, 4] * 3
+    # or store them as decimals when the column has more than 18 digits
+    metadata[0] = ResultMetadataV2(
+        "ID", FIELD_NAME_TO_ID["FIXED"], True, precision=38, scale=0
+    )
+    table = read(
+        batch
+        for id_type in (pa.int8(), pa.decimal128(20, 0))
+        for batch in _create_arrow_result_batch(
+            _create_arrow_chunk(pa, id_type, scale=0, precision=38), metadata
+        )._get_arrow_stream_iter()
+    )
+    assert table.schema.field("ID").type == pa.decimal128(38, 0)
+    assert table.column("ID").to_pylist() == [1, 2, None, 4] * 2
+    with pytest.raises(RuntimeError, match="download failed"):
+        read(streams(error=RuntimeError("download failed")))
+
+
+@pytest.mark.skipolddriver
+def test_batches_share_session_manager():
+    import pickle
+
+    from snowflake.connector.converter import SnowflakeConverter
+    from snowflake.connector.cursor import ResultMetadataV2
+    from snowflake.connector.result_batch import create_batches_from_response
+    from snowflake.connector.session_manager import SessionManager
+
+    cursor = mock.Mock(_use_dict_result=False)
+    cursor._connection.converter = SnowflakeConverter()
+    cursor._connection._session_manager = SessionManager(use_pooling=True)
+    cursor._connection._json_result_force_utf8_decoding = False
+    cursor._connection._json_result_decoder = None
+    rowtype = {
+        "name": "ID",
+        "type": "FIXED",
+        "nullable": True,
+        "length": None,
+        "precision": 18,
+        "scale": 0,
+    }
+    data = {
+        "rowtype": [rowtype],
+        "rowset": [["1"]],
+        "total": 7,
+        "qrmk": "key",
+        "chunks": [
+            {
+                "url": f"http://chunk/{i}",
+                "rowCount": 2,
+                "uncompressedSize": 10,
+                "compressedSize": 5,
+            }
+            for i in range(3)
+        ],
+    }
+    batches = create_batches_from_response(
+        cursor, "json", data, [ResultMetadataV2.from_column(rowtype)]
+    )
+    manager = batches[0].session_manager
+    assert manager is not cursor._connection._session_manager
+    assert manager.config is cursor._connection._session_manager.config
+    assert all(batch.session_manager is manager for batch in batches)
+    headers = batches[1]._chunk_headers
+    assert all(batch._chunk_headers is headers for batch in batches[1:])
+    assert batches[1].schema[0].name == "ID"
+
+    # a batch sent to another process only takes the configuration along
+    with manager.use_session("http://chunk/0"):
+        pass
+    assert manager.sessions_map
+    copy = pickle.loads(pickle.dumps(batches[1]))
+    assert type(copy.session_manager) is SessionManager
+    config = copy.session_manager.config
+    assert config.to_base_dict() == manager.config.to_base_dict()
+    assert not copy.session_manager.sessions_map
+    assert copy.schema == batches[1].schema
+
+    # changing the configuration of one batch leaves the others alone
+    batches[2].http_config = manager.config.copy_with(use_pooling=False)
+    assert not batches[2].session_manager.use_pooling
+    assert batches[1].session_manager is manager
+    assert manager.use_pooling
+
+
+@pytest.mark.skipolddriver
+def test_download_stops_reading_cancelled_body():
+    from snowflake.connector.result_batch import (
+        DownloadCancelled,
+        cancellable_downloads,
+    )
+
+    cancelled = threading.Event()
+
+    def body(_):
+        yield b"abc"
+        cancelled.set()
+        yield b"def"
+
+    batch = JSONResultBatch(
+        100, None, RemoteChunkInfo("http://www.chunk-url.com", 6, 6), [], [], True
+    )
+    response = mock.Mock(status_code=OK, iter_content=body)
+    with mock.patch(SESSION_FROM_REQUEST_MODULE_PATH + ".get") as mock_get:
+        mock_get.return_value = response
+        with cancellable_downloads(cancelled):
+            with pytest.raises(DownloadCancelled):
+                batch._download()
+    # the cancelled download is not retried
+    assert mock_get.call_count == 1
+    response.close.assert_called_once_with()
+
+    response = mock.Mock(status_code=OK, iter_content=lambda _: iter([b"a", b"b"]))
+    with mock.patch(SESSION_FROM_REQUEST_MODULE_PATH + ".get", return_value=response):
+        assert batch._download()._content == b"ab"
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import pytest
+
+try:
+    from snowflake.connector import result_chunk_cache
+    from snowflake.connector.arrow_context import ArrowConverterContext
+    from snowflake.connector.constants import FIELD_NAME_TO_ID
+    from snowflake.connector.cursor import ResultMetadataV2
+    from snowflake.connector.result_batch import ArrowResultBatch, RemoteChunkInfo
+    from snowflake.connector.result_chunk_cache import (
+        ResultChunkCache,
+        ResultChunkKey,
+        get_result_chunk_cache,
+    )
+except ImportError:  # pragma: no cover
+    pytestmark = pytest.mark.skip("result chunk cache is not available")
+
+
+def _cache_files(cache: ResultChunkCache) -> set[str]:
+    return {path.name for path in cache.cache_dir.iterdir()}
+
+
+def test_memory_and_disk_tiers(tmp_path):
+    key = ResultChunkKey("query", 0, 10)
+    cache = ResultChunkCache(tmp_path, max_size=100, memory_size=100)
+    assert cache.get(key) is None
+    assert list(cache.store(key, [b"abc", b"def"])) == [b"abc", b"def"]
+    assert _cache_files(cache) == {key.file_name}
+    assert b"".join(cache.get(key)) == b"abcdef"
+
+    # another process finds the chunk on disk
+    other = ResultChunkCache(tmp_path, max_size=100, memory_size=100)
+    assert b"".join(other.get(key)) == b"abcdef"
+    # a chunk of another size is a different one
+    assert other.get(key._replace(compressed_size=11)) is None
+    assert other.telemetry == {"memory_hit": 0, "disk_hit": 1, "miss": 1, "evicted": 0}
+    assert cache.telemetry == {"memory_hit": 1, "disk_hit": 0, "miss": 1, "evicted": 0}
+
+
+def test_least_recently_used_chunks_are_evicted(tmp_path):
+    cache = ResultChunkCache(tmp_path, max_size=25, memory_size=10)
+    keys = [ResultChunkKey("query", index, 10) for index in range(3)]
+    for key in keys[:2]:
+        list(cache.store(key, [bytes(10)]))
+    # reading the first chunk makes the second one the least recently used
+    assert cache.get(keys[0]) is not None
+    list(cache.store(keys[2], [bytes(10)]))
+    assert _cache_files(cache) == {keys[0].file_name, keys[2].file_name}
+    assert cache.get(keys[1]) is None
+    # the memory tier only holds the last chunk
+    assert list(cache._memory) == [keys[2]]
+
+    # a new cache takes over the files and evicts down to its size
+    assert _cache_files(ResultChunkCache(tmp_path, max_size=15)) == {
+        keys[2].file_name
+    }
+
+
+def test_unfinished_downloads_are_not_cached(tmp_path):
+    cache = ResultChunkCache(tmp_path, max_size=100)
+    key = ResultChunkKey("query", 0, 10)
+
+    def broken_download():
+        yield b"abc"
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        list(cache.store(key, broken_download()))
+    pieces = cache.store(key, [b"abc", b"def"])
+    assert next(pieces) == b"abc"
+    pieces.close()
+    assert cache.get(key) is None
+    assert not _cache_files(cache)
+
+
+class CountingArrowBatch(ArrowResultBatch):
+    """A remote ``ArrowResultBatch`` that counts its downloads."""
+
+    def __init__(self, payload: bytes) -> None:
+        super().__init__(
+            3,
+            None,
+            RemoteChunkInfo("http://chunk/0", len(payload), len(payload)),
+            ArrowConverterContext({"TIMEZONE": "UTC"}),
+            False,
+            False,
+            [ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18)],
+            False,
+        )
+        self._cache_key = ResultChunkKey("query", 0, len(payload))
+        self.payload = payload
+        self.downloads = 0
+
+    def _download_remote_stream(self, connection=None):
+        self.downloads += 1
+        yield self.payload
+
+
+def test_result_batch_reads_through_cache(tmp_path, monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    monkeypatch.setattr(result_chunk_cache, "_result_chunk_cache", None)
+    metadata = {"logicalType": "FIXED", "scale": "0", "precision": "18"}
+    schema = pa.schema([pa.field("ID", pa.int64(), metadata=metadata)])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(pa.record_batch([pa.array([1, 2, 3])], schema=schema))
+    payload = sink.getvalue().to_pybytes()
+
+    # without a cache every iteration downloads the chunk
+    batch = CountingArrowBatch(payload)
+    assert list(batch) == list(batch) == [(1,), (2,), (3,)]
+    assert batch.downloads == 2
+
+    cache = get_result_chunk_cache(tmp_path, 1 << 20)
+    assert get_result_chunk_cache(None, 1 << 20, 0) is cache
+    batch = CountingArrowBatch(payload)
+    assert list(batch) == [(1,), (2,), (3,)]
+    # the memory tier is disabled, the chunk is read back from disk
+    assert list(batch) == [(1,), (2,), (3,)]
+    assert batch.downloads == 1
+    assert cache.telemetry["disk_hit"] == 1
@@ -0,0 +1,679 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import itertools
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from multiprocessing.shared_memory import SharedMemory
+from unittest import mock
+
+import pytest
+
+try:
+    from snowflake.connector import result_batch
+    from snowflake.connector._download_executor import (
+        SharedDownloadExecutor,
+        get_shared_process_pool,
+    )
+    from snowflake.connector.arrow_context import ArrowConverterContext
+    from snowflake.connector.constants import FIELD_NAME_TO_ID, IterUnit
+    from snowflake.connector.cursor import ResultMetadataV2
+    from snowflake.connector.result_batch import (
+        SHARED_DATA_SUPPORTED,
+        ArrowResultBatch,
+        DownloadMetrics,
+        RemoteChunkInfo,
+    )
+    from snowflake.connector.result_set import (
+        PrefetchWindow,
+        ResultPartition,
+        ResultSet,
+        SpillBudget,
+        partition_batches,
+        result_set_iterator,
+    )
+except ImportError:  # pragma: no cover
+    pytestmark = pytest.mark.skip("result_set module is not available")
+    ArrowResultBatch = object
+    SHARED_DATA_SUPPORTED = False
+
+
+class FakeBatch:
+    """Stands in for a remote ``ResultBatch`` and records how many are downloading."""
+
+    lock = threading.Lock()
+
+    def __init__(self, idx: int, size: int, tracker: dict[str, int]) -> None:
+        self.id = str(idx)
+        self.rowcount = 1
+        self.uncompressed_size = size
+        self._idx = idx
+        self._tracker = tracker
+
+    def create_iter(self, **kwargs):
+        with self.lock:
+            self._tracker["submitted"] += 1
+            self._tracker["max_outstanding"] = max(
+                self._tracker["max_outstanding"],
+                self._tracker["submitted"] - self._tracker["consumed"],
+            )
+        return self._rows()
+
+    def _rows(self):
+        yield (self._idx,)
+        with self.lock:
+            self._tracker["consumed"] += 1
+
+
+def _iterate(num_batches, size, prefetch_thread_num, memory_limit=None):
+    tracker = {"submitted": 0, "consumed": 0, "max_outstanding": 0}
+    batches = deque(FakeBatch(i, size, tracker) for i in range(1, num_batches + 1))
+    final = mock.Mock()
+    rows = list(
+        result_set_iterator(
+            iter([(0,)]),
+            deque(),
+            batches,
+            final,
+            prefetch_thread_num,
+            use_mp=False,
+            prefetch_memory_limit=memory_limit,
+        )
+    )
+    final.assert_called_once()
+    return rows, tracker
+
+
+def test_fixed_window_without_memory_limit():
+    rows, tracker = _iterate(10, 100, prefetch_thread_num=3)
+    assert rows == [(i,) for i in range(11)]
+    # prefetched batches plus the one being consumed
+    assert tracker["max_outstanding"] <= 4
+
+
+@pytest.mark.parametrize("memory_limit,expected_max", [(250, 2), (50, 1)])
+def test_memory_limit_bounds_outstanding_batches(memory_limit, expected_max):
+    rows, tracker = _iterate(
+        10, 100, prefetch_thread_num=4, memory_limit=memory_limit
+    )
+    # Ordering is preserved and a batch bigger than the limit still makes progress
+    assert rows == [(i,) for i in range(11)]
+    assert tracker["max_outstanding"] <= expected_max
+
+
+def test_prefetch_window_adapts_to_consumer():
+    batch = mock.Mock(uncompressed_size=10)
+    window = PrefetchWindow(4, memory_limit=1000)
+    for _ in range(4):
+        assert window.can_submit(batch)
+        window.submitted(batch)
+    assert not window.can_submit(batch)
+    assert window.bytes_in_flight == 40
+
+    # Downloads are ahead of the consumer, the window shrinks
+    window.start_consuming(waited=False, next_ready=True)
+    window.finish_consuming()
+    assert window.size == 3
+    assert window.bytes_in_flight == 30
+    assert not window.can_submit(batch)
+
+    # The consumer had to wait, the window grows back but never above its maximum
+    for _ in range(3):
+        window.start_consuming(waited=True, next_ready=False)
+        window.finish_consuming()
+    assert window.size == 4
+    assert window.bytes_in_flight == 0
+
+
+def test_prefetch_window_without_memory_limit_is_fixed():
+    batch = mock.Mock(uncompressed_size=10)
+    window = PrefetchWindow(2)
+    window.submitted(batch)
+    window.submitted(batch)
+    window.start_consuming(waited=False, next_ready=True)
+    assert window.size == 2
+    assert window.can_submit(batch)
+
+
+class SlowBatch:
+    """A remote ``ResultBatch`` whose download waits until ``released`` is set."""
+
+    def __init__(self, idx: int, released: threading.Event) -> None:
+        self.id = str(idx)
+        self.uncompressed_size = 1
+        self._idx = idx
+        self._released = released
+
+    def create_iter(self, **kwargs):
+        assert self._released.wait(10)
+        return iter([(self._idx,)])
+
+
+@pytest.mark.parametrize("memory_limit", [None, 2])
+def test_unordered_consumes_batches_as_they_finish(memory_limit):
+    released = threading.Event()
+    batches = deque([SlowBatch(1, released)])
+    ready = threading.Event()
+    ready.set()
+    batches.extend(SlowBatch(i, ready) for i in range(2, 5))
+    rows = result_set_iterator(
+        iter([(0,)]),
+        deque(),
+        batches,
+        mock.Mock(),
+        3,
+        use_mp=False,
+        prefetch_memory_limit=memory_limit,
+        ordered=False,
+    )
+    # the slow first download does not hold back the ones after it
+    assert list(itertools.islice(rows, 3)) == [(0,), (2,), (3,)]
+    released.set()
+    assert sorted(rows) == [(1,), (4,)]
+
+
+class PayloadArrowBatch(ArrowResultBatch):
+    """A remote ``ArrowResultBatch`` that downloads its payload without a network."""
+
+    def __init__(
+        self, idx: int, payload: bytes, reported_size: int | None = None
+    ) -> None:
+        reported_size = reported_size or len(payload)
+        super().__init__(
+            1000,
+            None,
+            RemoteChunkInfo(f"http://chunk/{idx}", reported_size, reported_size),
+            ArrowConverterContext({"TIMEZONE": "UTC"}),
+            False,
+            False,
+            [
+                ResultMetadataV2(
+                    "ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=0
+                )
+            ],
+            False,
+        )
+        self.payload = payload
+
+    def _download_stream(self, connection=None):
+        for i in range(0, len(self.payload), 1000):
+            yield self.payload[i : i + 1000]
+
+
+def _create_arrow_payload(pa, values, id_type=None) -> bytes:
+    schema = pa.schema(
+        [
+            pa.field(
+                "ID",
+                id_type or pa.int64(),
+                metadata={"logicalType": "FIXED", "scale": "0", "precision": "18"},
+            )
+        ]
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for start in range(0, len(values), 100):
+            writer.write_batch(
+                pa.record_batch([pa.array(values[start : start + 100])], schema=schema)
+            )
+    return sink.getvalue().to_pybytes()
+
+
+def test_fetch_arrow_reader():
+    pa = pytest.importorskip("pyarrow")
+    cursor = mock.Mock(_first_chunk_time=None)
+
+    def first_batch(values, id_type=None):
+        return ArrowResultBatch.from_data(
+            _create_arrow_payload(pa, values, id_type) if values else "",
+            len(values),
+            ArrowConverterContext({"TIMEZONE": "UTC"}),
+            False,
+            False,
+            [
+                ResultMetadataV2(
+                    "ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=0
+                )
+            ],
+            False,
+        )
+
+    batches = [
+        first_batch(list(range(250))),
+        # this chunk is converted to a narrower type than the first one
+        PayloadArrowBatch(2, _create_arrow_payload(pa, [1, 2, 3], pa.int8())),
+        PayloadArrowBatch(3, _create_arrow_payload(pa, [4, None])),
+    ]
+    reader = ResultSet(cursor, batches, 2, False)._fetch_arrow_reader()
+    assert reader.schema.field("ID").type == pa.int64()
+    assert [batch.num_rows for batch in reader] == [100, 100, 50, 3, 2]
+
+    reader = ResultSet(cursor, batches, 2, False)._fetch_arrow_reader()
+    assert reader.read_all().column("ID").to_pylist() == list(range(250)) + [
+        1,
+        2,
+        3,
+        4,
+        None,
+    ]
+
+    empty = ResultSet(cursor, [first_batch([])], 2, False)._fetch_arrow_reader()
+    assert empty.schema.names == ["ID"]
+    assert empty.read_all().num_rows == 0
+
+    # the first chunk is narrower than the values of a later one
+    batches = [
+        first_batch([1, 2], pa.int8()),
+        PayloadArrowBatch(2, _create_arrow_payload(pa, [10**12])),
+    ]
+    reader = ResultSet(cursor, batches, 2, False)._fetch_arrow_reader()
+    assert reader.schema.field("ID").type == pa.int64()
+    assert reader.read_all().column("ID").to_pylist() == [1, 2, 10**12]
+
+
+def test_prefetch_is_picked_up_by_iteration():
+    pa = pytest.importorskip("pyarrow")
+    cursor = mock.Mock(_first_chunk_time=None)
+    cursor.connection.client_fetch_arrow_streaming = False
+    payloads = [
+        _create_arrow_payload(pa, list(range(i * 100, i * 100 + 100)))
+        for i in range(5)
+    ]
+    batches = [
+        ArrowResultBatch.from_data(
+            payloads[0],
+            100,
+            ArrowConverterContext({"TIMEZONE": "UTC"}),
+            False,
+            False,
+            [
+                ResultMetadataV2(
+                    "ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18, scale=0
+                )
+            ],
+            False,
+        )
+    ]
+    for i, payload in enumerate(payloads[1:], 1):
+        batch = PayloadArrowBatch(i, payload)
+        batch._download_stream = mock.Mock(wraps=batch._download_stream)
+        batches.append(batch)
+
+    # the memory limit leaves room for two of the four remote batches
+    result_set = ResultSet(cursor, batches, 4, False, 2 * len(payloads[1]))
+    result_set.prefetch()
+    assert sorted(result_set._prefetched) == [1, 2]
+    for future in result_set._prefetched.values():
+        future.result()
+    assert [batch._download_stream.call_count for batch in batches[1:]] == [
+        1,
+        1,
+        0,
+        0,
+    ]
+    # the prefetched data stays in this process
+    prefetched_batch = PayloadArrowBatch(1, payloads[1]).prefetch_data()
+    assert pickle.loads(pickle.dumps(prefetched_batch))._prefetched_data is None
+
+    assert list(result_set) == [(i,) for i in range(500)]
+    assert [batch._download_stream.call_count for batch in batches[1:]] == [1] * 4
+    assert all(batch._prefetched_data is None for batch in batches)
+
+
+def test_create_iter_from_row_skips_earlier_batches():
+    pa = pytest.importorskip("pyarrow")
+    cursor = mock.Mock(_first_chunk_time=None)
+    cursor.connection.client_fetch_arrow_streaming = False
+    batches = []
+    for i in range(5):
+        batch = PayloadArrowBatch(
+            i, _create_arrow_payload(pa, list(range(i * 100, i * 100 + 100)))
+        )
+        batch.rowcount = 100
+        batch._download_stream = mock.Mock(wraps=batch._download_stream)
+        batches.append(batch)
+    result_set = ResultSet(cursor, batches, 2, False)
+
+    assert list(result_set._create_iter(start_row=250)) == [
+        (i,) for i in range(250, 500)
+    ]
+    assert [batch._download_stream.call_count for batch in batches] == [
+        0,
+        0,
+        1,
+        1,
+        1,
+    ]
+    assert list(result_set._create_iter(start_row=200))[0] == (200,)
+    assert batches[1]._download_stream.call_count == 0
+    assert not list(result_set._create_iter(start_row=500))
+
+    # the prefetched data of skipped batches is released
+    result_set.prefetch()
+    prefetched = [(batches[i], result_set._prefetched[i]) for i in (0, 1)]
+    assert list(result_set._create_iter(start_row=450))[0] == (450,)
+    for batch, future in prefetched:
+        assert future.cancelled() or future.result() is batch
+        # the data is released by a callback of the future
+        deadline = time.monotonic() + 5
+        while batch._prefetched_data is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert batch._prefetched_data is None
+
+
+class UnreachableArrowBatch(PayloadArrowBatch):
+    """A remote ``ArrowResultBatch`` whose downloads keep failing and are retried."""
+
+    _download_stream = ArrowResultBatch._download_stream
+
+    def _download_session(self, connection, url):
+        raise ConnectionError("chunk is unreachable")
+
+
+@pytest.mark.parametrize("shared_executor", [False, True])
+def test_closing_iterator_cancels_downloads(shared_executor):
+    pa = pytest.importorskip("pyarrow")
+    payload = _create_arrow_payload(pa, list(range(100)))
+    batches = [PayloadArrowBatch(1, payload)] + [
+        UnreachableArrowBatch(i, payload) for i in range(2, 6)
+    ]
+    executor = SharedDownloadExecutor(2) if shared_executor else None
+    on_cancel = mock.Mock()
+    rows = result_set_iterator(
+        iter([]),
+        deque(),
+        deque(batches),
+        mock.Mock(),
+        3,
+        use_mp=False,
+        download_executor=executor,
+        on_cancel=on_cancel,
+        iter_unit=IterUnit.ROW_UNIT,
+    )
+    assert next(rows) == (0,)
+    start = time.monotonic()
+    rows.close()
+    # the retries with backoff would take minutes
+    assert time.monotonic() - start < 5
+    # the first batch was consumed and the last one never submitted
+    on_cancel.assert_called_once_with(3 * len(payload))
+
+    # a later iterator only reports the downloads it cancelled
+    batches[1].__class__ = DownloadedArrowBatch
+    batches[1].downloaded = threading.Event()
+    on_cancel.reset_mock()
+    rows = result_set_iterator(
+        iter([]),
+        deque(),
+        deque(batches[:2]),
+        mock.Mock(),
+        3,
+        use_mp=False,
+        download_executor=executor,
+        on_cancel=on_cancel,
+        iter_unit=IterUnit.ROW_UNIT,
+    )
+    assert next(rows) == (0,)
+    assert batches[1].downloaded.wait(5)
+    rows.close()
+    on_cancel.assert_called_once_with(0)
+    if executor is not None:
+        executor.shutdown()
+
+
+class DownloadedArrowBatch(PayloadArrowBatch):
+    """A ``PayloadArrowBatch`` that tells when it was downloaded."""
+
+    def create_iter(self, **kwargs):
+        rows = super().create_iter(**kwargs)
+        self.downloaded.set()
+        return rows
+
+
+class StreamedArrowBatch(PayloadArrowBatch):
+    """A ``PayloadArrowBatch`` that records when its whole payload was downloaded."""
+
+    def __init__(self, idx: int, payload: bytes) -> None:
+        super().__init__(idx, payload)
+        self.downloaded = threading.Event()
+
+    def _download_stream(self, connection=None):
+        size = 0
+        for piece in super()._download_stream(connection):
+            size += len(piece)
+            if size == len(self.payload):
+                self.downloaded.set()
+            yield piece
+
+
+def test_streamed_batch_downloads_while_not_consumed():
+    pa = pytest.importorskip("pyarrow")
+    connection = mock.Mock(client_fetch_arrow_streaming=True, _debug_arrow_chunk=False)
+    batch = StreamedArrowBatch(1, _create_arrow_payload(pa, list(range(1000))))
+    rows = batch.create_iter(connection=connection)
+    # nobody consumes the rows, the download finishes anyway
+    assert batch.downloaded.wait(5)
+    assert list(rows) == [(i,) for i in range(1000)]
+
+    batch = UnreachableArrowBatch(2, b"")
+    connection._backoff_generator = itertools.repeat(60)
+    cancelled = threading.Event()
+    cancelled.set()
+    with result_batch.cancellable_downloads(cancelled):
+        with pytest.raises(result_batch.DownloadCancelled):
+            batch.create_iter(connection=connection)
+
+
+def test_cancel_prefetch_stops_downloads():
+    pa = pytest.importorskip("pyarrow")
+    cursor = mock.Mock(_first_chunk_time=None)
+    cursor.connection._backoff_generator = itertools.repeat(60)
+    payload = _create_arrow_payload(pa, list(range(100)))
+    batches = [UnreachableArrowBatch(i, payload) for i in range(3)]
+    result_set = ResultSet(cursor, batches, 3, False)
+    result_set.prefetch()
+    futures = list(result_set._prefetched.values())
+    assert len(futures) == 3
+    start = time.monotonic()
+    result_set.cancel_prefetch()
+    for future in futures:
+        assert future.cancelled() or isinstance(
+            future.exception(), result_batch.DownloadCancelled
+        )
+    # the retries with backoff would take minutes
+    assert time.monotonic() - start < 5
+    assert not result_set._prefetched
+
+
+def test_resetting_cursor_cancels_prefetch():
+    from snowflake.connector.cursor import SnowflakeCursor
+
+    connection = mock.Mock(_reuse_results=False)
+    cursor = SnowflakeCursor(connection)
+    result_set = cursor._result_set = mock.Mock()
+    cursor.reset()
+    result_set.cancel_prefetch.assert_called_once_with()
+    assert cursor._result_set is None
+
+
+def test_partition_batches_by_size():
+    tracker = {"submitted": 0, "consumed": 0, "max_outstanding": 0}
+    sizes = [None, 50, 10, 40, 30, 20, 10]
+    batches = [FakeBatch(i, size, tracker) for i, size in enumerate(sizes)]
+    partitions = partition_batches(batches, 3)
+    assert [[batch.id for batch in part] for part in partitions] == [
+        ["1", "6"],
+        ["0", "2", "3"],
+        ["4", "5"],
+    ]
+    assert len(partition_batches(batches[:2], 3)) == 2
+    assert partition_batches([], 3) == []
+
+
+def test_result_partitions_are_consumed_in_parallel():
+    pa = pytest.importorskip("pyarrow")
+    cursor = mock.Mock(_first_chunk_time=None)
+    first = ArrowResultBatch.from_data(
+        _create_arrow_payload(pa, list(range(10))),
+        10,
+        ArrowConverterContext({"TIMEZONE": "UTC"}),
+        False,
+        False,
+        [ResultMetadataV2("ID", FIELD_NAME_TO_ID["FIXED"], True, precision=18)],
+        False,
+    )
+    batches = [first] + [
+        PayloadArrowBatch(
+            i, _create_arrow_payload(pa, list(range(i * 10, i * 10 + 10)))
+        )
+        for i in range(1, 8)
+    ]
+    result_set = ResultSet(cursor, batches, 4, False, prefetch_memory_limit=8000)
+    partitions = [ResultPartition(part) for part in result_set._partition(3)]
+    assert len(partitions) == 3
+    assert sum(part.rowcount for part in partitions) == 7010
+    executors = {part._result_set._download_executor for part in partitions}
+    assert len(executors) == 1 and None not in executors
+    assert {part._result_set.prefetch_thread_num for part in partitions} == {2}
+    assert {part._result_set.prefetch_memory_limit for part in partitions} == {2666}
+
+    results = [None] * len(partitions)
+
+    def consume(idx):
+        if partitions[idx].batches[0] is not first:
+            results[idx] = [row[0] for row in partitions[idx]]
+        else:
+            results[idx] = [
+                value
+                for table in partitions[idx].fetch_arrow_batches()
+                for value in table.column("ID").to_pylist()
+            ]
+
+    threads = [
+        threading.Thread(target=consume, args=(idx,)) for idx in range(len(partitions))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(itertools.chain(*results)) == list(range(80))
+    # every partition holds its batches in result order
+    for result in results:
+        assert result == sorted(result)
+
+
+def _shared_memory_segments() -> set[str]:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+@pytest.mark.skipif(
+    not SHARED_DATA_SUPPORTED, reason="shared memory transport is not used"
+)
+def test_use_mp_hands_arrow_batches_back_in_shared_memory(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    # other test processes create segments as well, only look at the ones that
+    # were handed back to this process
+    opened = set()
+
+    def open_shared_memory(name=None, *args, **kwargs):
+        opened.add(name)
+        return SharedMemory(name, *args, **kwargs)
+
+    monkeypatch.setattr(result_batch, "SharedMemory", open_shared_memory)
+    schema = pa.schema(
+        [
+            pa.field(
+                "ID",
+                pa.int64(),
+                metadata={"logicalType": "FIXED", "scale": "0", "precision": "18"},
+            )
+        ]
+    )
+
+    def create_batches(count):
+        for idx in range(1, count + 1):
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, schema) as writer:
+                writer.write_batch(
+                    pa.record_batch(
+                        [pa.array(range(idx * 1000, idx * 1000 + 1000))], schema=schema
+                    )
+                )
+            payload = sink.getvalue().to_pybytes()
+            # the back-end reported a too small size for the second batch
+            yield PayloadArrowBatch(idx, payload, 10 if idx == 2 else len(payload))
+
+    def iterate(count):
+        return result_set_iterator(
+            iter([]),
+            deque(),
+            deque(create_batches(count)),
+            mock.Mock(),
+            2,
+            use_mp=True,
+            iter_unit=IterUnit.ROW_UNIT,
+        )
+
+    assert list(iterate(4)) == [(i,) for i in range(1000, 5000)]
+    pool = get_shared_process_pool(2)._pool
+    assert pool is not None
+
+    rows = iterate(5)
+    assert list(itertools.islice(rows, 3)) == [(1000,), (1001,), (1002,)]
+    rows.close()
+    # the worker processes are reused and no segment is left behind, also not the
+    # ones of the batches that were downloaded but not consumed
+    assert get_shared_process_pool(2)._pool is pool
+    assert len(opened) >= 5
+    assert not opened & _shared_memory_segments()
+
+
+@pytest.mark.parametrize("use_mp", [False, True])
+@pytest.mark.parametrize("is_fetch_all", [False, True])
+def test_spill_batches_over_memory_limit(tmp_path, use_mp, is_fetch_all):
+    pa = pytest.importorskip("pyarrow")
+    payloads = [
+        _create_arrow_payload(pa, list(range(i * 100, i * 100 + 100)))
+        for i in range(1, 6)
+    ]
+    size = len(payloads[0])
+
+    def iterate():
+        batches = deque(
+            PayloadArrowBatch(i, payload) for i, payload in enumerate(payloads, 1)
+        )
+        budget = SpillBudget(2 * size, str(tmp_path))
+        return batches, result_set_iterator(
+            iter([]),
+            deque(),
+            deque(batches),
+            mock.Mock(),
+            5,
+            use_mp=use_mp,
+            is_fetch_all=is_fetch_all,
+            spill_budget=budget,
+            iter_unit=IterUnit.ROW_UNIT,
+        )
+
+    batches, rows = iterate()
+    assert list(rows) == [(i,) for i in range(100, 600)]
+    assert not list(tmp_path.iterdir())
+    if not use_mp:
+        # the first two batches fit into memory
+        spilled = DownloadMetrics.spilled.value
+        assert [batch._metrics.get(spilled) for batch in batches] == [
+            None,
+            None,
+            size,
+            size,
+            size,
+        ]
+
+    # spill files of batches that were never consumed are removed
+    _, rows = iterate()
+    assert next(rows) == (100,)
+    rows.close()
+    assert not list(tmp_path.iterdir())